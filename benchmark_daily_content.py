@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import update_daily_content as daily
+
+DEFAULT_ARTICLE_SIZES = [100, 1_000]
+DEFAULT_USED_SIZES = [1_000, 10_000]
+FULL_ARTICLE_SIZES = [100, 1_000, 10_000, 100_000]
+FULL_USED_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_REPEATS = 3
+DEFAULT_THRESHOLD = 0.25
+BENCHMARK_DATE = datetime(2026, 1, 15, 9, 0, tzinfo=daily.BERLIN_TZ)
+
+
+def synthetic_corpus(articles_per_category: int, seed: int = 0) -> dict[str, list[dict[str, object]]]:
+    rng = random.Random(seed)
+    words = ["Reform", "Vertrag", "Krise", "Handel", "Reich", "Revolution", "Konzil", "Bündnis", "Aufstand"]
+    corpus: dict[str, list[dict[str, object]]] = {}
+    for category in daily.CATEGORY_ORDER:
+        pool = []
+        for number in range(articles_per_category):
+            year = rng.randint(-800, 2024)
+            topic = " ".join(rng.choice(words) for _ in range(3))
+            pool.append(
+                {
+                    "slug": f"{category}-{number:06d}",
+                    "title": f"{category.capitalize()}: {topic} {year}",
+                    "paragraphs": [
+                        f"<strong>Ereignis:</strong> Am {rng.randint(1, 28)}. {daily.MONTHS[rng.randint(1, 12)]} {year} {topic}.",
+                        f"<strong>Folgen:</strong> {topic} veränderte Politik, Wirtschaft und Gesellschaft nachhaltig.",
+                        f"<strong>Was wir gelernt haben:</strong> {topic} zeigt, wie Institutionen auf Krisen reagieren.",
+                        f"<strong>Vertiefung:</strong> Quellenlage und Forschung zu {topic} sind umfangreich.",
+                    ],
+                    "source_label": "Synthetische Quelle",
+                    "source_title": topic,
+                    "source_url": f"https://example.org/{category}/{number}",
+                }
+            )
+        corpus[category] = pool
+    return corpus
+
+
+def synthetic_history(
+    corpus: dict[str, list[dict[str, object]]],
+    used_count: int,
+    seed: int = 0,
+) -> dict[str, object]:
+    rng = random.Random(seed)
+    # Verwendete Slugs: zuerst echte Artikel (ein Teil je Kategorie bleibt frei), danach ausgemusterte Slugs.
+    candidates = [article["slug"] for pool in corpus.values() for article in pool[: max(1, len(pool) * 9 // 10)]]
+    rng.shuffle(candidates)
+    used = candidates[:used_count]
+    used.extend(f"archiv-{number:07d}" for number in range(used_count - len(used)))
+
+    entries: list[dict[str, object]] = []
+    per_day = len(daily.CATEGORY_ORDER)
+    recent = used[-daily.HISTORY_MAX_ENTRIES * per_day :]
+    start = BENCHMARK_DATE.date() - timedelta(days=len(recent) // per_day + 1)
+    for day_index in range(len(recent) // per_day):
+        entries.append(
+            {
+                "date": (start + timedelta(days=day_index)).isoformat(),
+                "slugs": recent[day_index * per_day : (day_index + 1) * per_day],
+            }
+        )
+    return {"history": entries, daily.HISTORY_USED_SLUGS_KEY: used}
+
+
+def _measure(
+    stage: Callable[[], object],
+    repeats: int,
+    setup: Callable[[], None] | None = None,
+) -> dict[str, float]:
+    timings: list[float] = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        gc.collect()
+        started = time.perf_counter()
+        stage()
+        timings.append(time.perf_counter() - started)
+
+    # Speicher getrennt messen, damit tracemalloc die Zeitmessung nicht verfaelscht.
+    if setup is not None:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    stage()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    allocations = sum(stat.count_diff for stat in after.compare_to(before, "lineno") if stat.count_diff > 0)
+
+    return {
+        "seconds": min(timings),
+        "peak_bytes": float(peak),
+        "allocations": float(allocations),
+    }
+
+
+def run_scenario(articles_per_category: int, used_count: int, repeats: int) -> dict[str, dict[str, float]]:
+    corpus = synthetic_corpus(articles_per_category)
+    document = synthetic_history(corpus, used_count)
+    workdir = Path(tempfile.mkdtemp(prefix="geschichte-bench-"))
+    history_path = workdir / "history_log.json"
+    previous_store = daily.ARTICLE_STORE
+    daily.ARTICLE_STORE = daily.MemoryArticleStore(corpus)
+    try:
+        history_path.write_text(json.dumps(document, ensure_ascii=True, indent=2) + "\n", encoding="utf-8")
+        seeded = daily.load_history(history_path)
+        daily.rebuild_category_cursors(seeded)
+        daily.compact_history(seeded, history_path)
+
+        results: dict[str, dict[str, float]] = {}
+        results["load_history"] = _measure(lambda: daily.load_history(history_path), repeats)
+        history = daily.load_history(history_path)
+        results["ensure_history_unique"] = _measure(lambda: daily._ensure_history_unique(history), repeats)
+        results["select_articles"] = _measure(lambda: daily.select_articles(BENCHMARK_DATE, history), repeats)
+        # Taeglicher Lauf mit gueltigem gespeichertem Plan: nur Nachschlagen, kein Neuplanen.
+        daily.plan_schedule(BENCHMARK_DATE.date(), history, history_path)
+        results["scheduled_articles"] = _measure(
+            lambda: daily.scheduled_articles(BENCHMARK_DATE, history, history_path), repeats
+        )
+
+        articles, _ = daily.select_articles(BENCHMARK_DATE, history)
+        date_long = daily.german_long_date(BENCHMARK_DATE)
+        date_short = daily.german_short_date(BENCHMARK_DATE)
+        results["build_html"] = _measure(lambda: daily.build_html(date_long, date_short, articles), repeats)
+        results["build_pdf_content"] = _measure(
+            lambda: daily.build_pdf_content(date_long, date_short, articles), repeats
+        )
+
+        slugs = [article.slug for article in articles]
+        state: dict[str, dict[str, object]] = {}
+
+        def reload() -> None:
+            state["history"] = daily.load_history(history_path)
+
+        def append_and_save() -> None:
+            daily._append_history_entry(state["history"], BENCHMARK_DATE.date().isoformat(), slugs)
+            daily.save_history(state["history"], history_path)
+            daily._history_journal_path(history_path).unlink(missing_ok=True)
+
+        results["append_and_save"] = _measure(append_and_save, repeats, setup=reload)
+        return results
+    finally:
+        daily.ARTICLE_STORE = previous_store
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def run_benchmarks(article_sizes: list[int], used_sizes: list[int], repeats: int) -> dict[str, object]:
+    scenarios: dict[str, dict[str, dict[str, float]]] = {}
+    for articles_per_category in article_sizes:
+        for used_count in used_sizes:
+            name = f"articles={articles_per_category},used={used_count}"
+            print(f"{name} ...", file=sys.stderr)
+            scenarios[name] = run_scenario(articles_per_category, used_count, repeats)
+    return {"python": sys.version.split()[0], "repeats": repeats, "scenarios": scenarios}
+
+
+def compare_to_baseline(
+    report: dict[str, object],
+    baseline: dict[str, object],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    regressions: list[str] = []
+    current = report.get("scenarios", {})
+    previous = baseline.get("scenarios", {})
+    if not isinstance(current, dict) or not isinstance(previous, dict):
+        return regressions
+
+    for scenario, stages in current.items():
+        reference = previous.get(scenario)
+        if not isinstance(reference, dict):
+            continue
+        for stage, metrics in stages.items():
+            reference_metrics = reference.get(stage)
+            if not isinstance(reference_metrics, dict):
+                continue
+            for metric in ("seconds", "peak_bytes"):
+                old_value = reference_metrics.get(metric)
+                new_value = metrics.get(metric)
+                if not isinstance(old_value, (int, float)) or not isinstance(new_value, (int, float)) or old_value <= 0:
+                    continue
+                change = new_value / old_value - 1
+                if change > threshold:
+                    regressions.append(
+                        f"{scenario} {stage} {metric}: {old_value:.6g} -> {new_value:.6g} (+{change:.0%})"
+                    )
+    return regressions
+
+
+def _format_report(report: dict[str, object]) -> str:
+    lines = [f"{'Szenario':<34} {'Stufe':<22} {'Zeit ms':>10} {'Peak KiB':>10} {'Allok.':>9}"]
+    scenarios = report.get("scenarios", {})
+    if isinstance(scenarios, dict):
+        for scenario, stages in scenarios.items():
+            for stage, metrics in stages.items():
+                lines.append(
+                    f"{scenario:<34} {stage:<22} {metrics['seconds'] * 1000:>10.3f} "
+                    f"{metrics['peak_bytes'] / 1024:>10.1f} {int(metrics['allocations']):>9}"
+                )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Misst die Stufen der taeglichen Aktualisierung mit synthetischen Daten.")
+    parser.add_argument("--articles", type=int, nargs="+", help="Artikel pro Kategorie (mehrere Werte moeglich).")
+    parser.add_argument("--used", type=int, nargs="+", help="Anzahl verwendeter Slugs im Archiv.")
+    parser.add_argument("--full", action="store_true", help="Volle Staffel 10^2-10^5 Artikel, 10^3-10^6 Slugs.")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Wiederholungen je Stufe (Minimum zaehlt).")
+    parser.add_argument("--output", type=Path, help="Bericht als JSON speichern.")
+    parser.add_argument("--baseline", type=Path, help="Mit gespeichertem Bericht vergleichen.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Erlaubte relative Verschlechterung gegenueber der Baseline (Standard 0.25).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    article_sizes = args.articles or (FULL_ARTICLE_SIZES if args.full else DEFAULT_ARTICLE_SIZES)
+    used_sizes = args.used or (FULL_USED_SIZES if args.full else DEFAULT_USED_SIZES)
+
+    report = run_benchmarks(article_sizes, used_sizes, max(1, args.repeats))
+    print(_format_report(report))
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        if regressions:
+            print("Regressionen gegenueber der Baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("Keine Regressionen gegenueber der Baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Das Skript liegt im Projektwurzelverzeichnis; so laufen die Tests auch mit blankem "pytest" von ueberall.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import update_daily_content as daily  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolated_run(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # Keine Umgebungsschalter und kein echter Redaktionskalender aus dem Arbeitsverzeichnis.
+    monkeypatch.delenv("FORCE_NEW_SELECTION", raising=False)
+    monkeypatch.delenv(daily.ANNIVERSARY_SELECTION_ENV, raising=False)
+    monkeypatch.setattr(daily, "CALENDAR_PATH", tmp_path / "kalender.json")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import update_daily_content as daily
+
+
+def _copy_corpus(tmp_path: Path) -> Path:
+    directory = tmp_path / "articles"
+    directory.mkdir()
+    for path in daily.ARTICLES_PATH.glob(f"*{daily.ARTICLE_FILE_SUFFIX}"):
+        shutil.copy(path, directory / path.name)
+    return directory
+
+
+def test_reordered_lines_refresh_the_fingerprint(tmp_path: Path) -> None:
+    directory = _copy_corpus(tmp_path)
+    original = daily.JsonLinesArticleStore(directory)
+    before = original.fingerprint("politik")
+    first, second = original.load_category("politik").slugs[:2]
+
+    path = directory / f"politik{daily.ARTICLE_FILE_SUFFIX}"
+    stat = path.stat()
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    lines[0], lines[1] = lines[1], lines[0]
+    path.write_text("".join(lines), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    store = daily.JsonLinesArticleStore(directory)
+    assert path.stat().st_size == stat.st_size
+    assert store.fingerprint("politik") != before
+    assert store.load_category("politik").slugs[:2] == (second, first)
+
+
+def test_incomplete_store_fails_on_creation() -> None:
+    class PartialStore(daily.ArticleStore):
+        def categories(self) -> list[str]:
+            return []
+
+    with pytest.raises(TypeError):
+        PartialStore()
+
+
+def test_fresh_checkout_keeps_the_index(tmp_path: Path) -> None:
+    directory = _copy_corpus(tmp_path)
+    daily.JsonLinesArticleStore(directory).slugs()
+    index_bytes = (directory / daily.ARTICLE_INDEX_NAME).read_bytes()
+
+    # Neue Aenderungszeiten, kein lokaler Stat-Zwischenspeicher: der Inhalt entscheidet.
+    (directory / daily.ARTICLE_STAT_CACHE_NAME).unlink()
+    for path in directory.glob(f"*{daily.ARTICLE_FILE_SUFFIX}"):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    store = daily.JsonLinesArticleStore(directory)
+    store.slugs()
+    assert store._read_index() is not None
+    assert (directory / daily.ARTICLE_INDEX_NAME).read_bytes() == index_bytes
+    assert (directory / daily.ARTICLE_STAT_CACHE_NAME).exists()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import shutil
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+import update_daily_content as daily
+
+
+def _copy_history(tmp_path: Path) -> Path:
+    history_path = tmp_path / "history_log.json"
+    shutil.copy(daily.HISTORY_LOG_PATH, history_path)
+    return history_path
+
+
+def test_saved_batch_passes_the_daily_check(tmp_path: Path) -> None:
+    history_path = _copy_history(tmp_path)
+    daily.run_batch(date(2026, 10, 19), date(2026, 10, 25), tmp_path / "vorschau", history_path=history_path)
+
+    history = daily._load_checked_history(history_path)
+    assert history["history"][-1]["date"] == "2026-10-25"
+
+
+def test_batch_with_duplicates_is_not_saved(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    history_path = _copy_history(tmp_path)
+    before = history_path.read_bytes()
+    same_articles = [daily.ARTICLE_STORE.load_category(category)[0] for category in daily.CATEGORY_ORDER]
+    monkeypatch.setattr(daily, "select_articles", lambda now, history: (same_articles, False))
+    monkeypatch.setattr(daily, "_is_allowed_repeat", lambda history, date_value, slug: False)
+
+    with pytest.raises(RuntimeError):
+        daily.run_batch(date(2026, 10, 19), date(2026, 10, 20), tmp_path / "vorschau", history_path=history_path)
+    assert history_path.read_bytes() == before
+    assert not daily._history_journal_path(history_path).exists()
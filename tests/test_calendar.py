@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import update_daily_content as daily
+
+START = datetime(2026, 10, 18, 9, 0, tzinfo=daily.BERLIN_TZ)
+
+
+def test_pin_wins_for_article_already_in_history_window(tmp_path: Path) -> None:
+    history_path = tmp_path / "history_log.json"
+    shutil.copy(daily.HISTORY_LOG_PATH, history_path)
+    history = daily._load_checked_history(history_path)
+    pinned = history["history"][-1]["slugs"][0]
+    first = START.date()
+    calendar = {"pins": [{"slug": pinned, "from": first.isoformat(), "to": (first + timedelta(days=2)).isoformat()}]}
+    daily.CALENDAR_PATH.write_text(json.dumps(calendar), encoding="utf-8")
+    edition = daily.Edition("test", output_dir=tmp_path / "site", history_path=history_path)
+
+    for offset in range(3):
+        daily.run_editions([edition], START + timedelta(days=offset), cache=None)
+
+    entries = daily._load_checked_history(history_path)["history"]
+    # Der Pin gilt einmal im Zeitraum und wird als erlaubte Wiederholung vermerkt.
+    assert pinned in entries[-3]["slugs"]
+    assert pinned in entries[-3][daily.HISTORY_REPEATS_KEY]
+    assert pinned not in entries[-2]["slugs"] + entries[-1]["slugs"]
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import update_daily_content as daily
+
+
+def test_feeds_are_skipped_without_site_url(tmp_path: Path) -> None:
+    edition = daily.Edition("test", output_dir=tmp_path, history_path=tmp_path / "history_log.json")
+    assert daily.update_feeds(daily.load_history(), edition) == []
+    assert not any(tmp_path.iterdir())
+
+
+def test_feed_links_are_absolute(tmp_path: Path) -> None:
+    edition = daily.Edition(
+        "test",
+        output_dir=tmp_path / "site",
+        history_path=tmp_path / "history_log.json",
+        site_url="https://example.org/geschichte",
+    )
+    daily.update_feeds(daily.load_history(), edition)
+
+    feed = json.loads((edition.output_dir / daily.FEED_FILES["json"]).read_text(encoding="utf-8"))
+    assert feed["home_page_url"].startswith("https://example.org/geschichte/")
+    assert all(item["url"].startswith("https://example.org/geschichte/") for item in feed["items"])
+    assert "<link></link>" not in (edition.output_dir / daily.FEED_FILES["rss"]).read_text(encoding="utf-8")
+    # Der Arbeitsstand liegt neben der Historie, nicht im veroeffentlichten Verzeichnis.
+    assert sorted(path.name for path in edition.output_dir.iterdir()) == sorted(daily.FEED_FILES.values())
+    assert (tmp_path / f"history_log{daily.FEED_STATE_SUFFIX}").exists()
+
+
+def test_relative_site_url_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        daily._edition_from_config({"name": "test", "site_url": "geschichte"}, tmp_path)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import shutil
+from datetime import date, timedelta
+from pathlib import Path
+
+import update_daily_content as daily
+
+FIRST_DAY = date(2027, 1, 1)
+
+
+def _copy_history(tmp_path: Path) -> Path:
+    history_path = tmp_path / "history_log.json"
+    shutil.copy(daily.HISTORY_LOG_PATH, history_path)
+    return history_path
+
+
+def _append_days(history: dict[str, object], start: int, count: int) -> None:
+    for number in range(start, start + count):
+        day = (FIRST_DAY + timedelta(days=number)).isoformat()
+        daily._append_history_entry(history, day, [f"archiv-{number:04d}"])
+
+
+def test_journal_replay_and_compaction(tmp_path: Path) -> None:
+    history_path = _copy_history(tmp_path)
+    journal_path = daily._history_journal_path(history_path)
+    snapshot = history_path.read_bytes()
+    history = daily.load_history(history_path)
+    expected = daily.load_history(history_path)
+
+    for number in range(daily.HISTORY_COMPACT_INTERVAL - 1):
+        _append_days(history, number, 1)
+        _append_days(expected, number, 1)
+        daily.save_history(history, history_path)
+        history = daily.load_history(history_path)
+        assert history["history"] == expected["history"]
+        assert history[daily.HISTORY_JOURNAL_RECORDS_KEY] == number + 1
+    # Bis hierher nur angehaengt: der Snapshot ist unveraendert, das Journal traegt alle Tage.
+    assert history_path.read_bytes() == snapshot
+    assert journal_path.exists()
+
+    _append_days(history, daily.HISTORY_COMPACT_INTERVAL - 1, 1)
+    _append_days(expected, daily.HISTORY_COMPACT_INTERVAL - 1, 1)
+    daily.save_history(history, history_path)
+    assert not journal_path.exists()
+    reloaded = daily.load_history(history_path)
+    assert reloaded["history"] == expected["history"]
+    assert reloaded[daily.HISTORY_SEQUENCE_KEY] == expected[daily.HISTORY_SEQUENCE_KEY]
+    assert reloaded[daily.HISTORY_JOURNAL_RECORDS_KEY] == 0
+
+
+def test_used_bitset_round_trip(tmp_path: Path) -> None:
+    history_path = _copy_history(tmp_path)
+    history = daily.load_history(history_path)
+    expected = daily.load_history(history_path)
+    for number in range(daily.HISTORY_COMPACT_INTERVAL + 5):
+        _append_days(history, number, 1)
+        _append_days(expected, number, 1)
+        daily.save_history(history, history_path)
+        history = daily.load_history(history_path)
+
+    assert history["history"] == expected["history"]
+    used = history[daily.HISTORY_USED_SLUGS_KEY]
+    assert set(used) == set(expected[daily.HISTORY_USED_SLUGS_KEY])
+    # Artikel mit ID landen im Bitset, ausgemusterte Slugs in der Liste daneben.
+    assert any(daily.ARTICLE_STORE.slug_id(slug) is not None for slug in used)
+    assert "archiv-0000" in used.extras
+
+
+def test_truncated_journal_line_is_ignored(tmp_path: Path) -> None:
+    history_path = _copy_history(tmp_path)
+    history = daily.load_history(history_path)
+    _append_days(history, 0, 2)
+    daily.save_history(history, history_path)
+    expected = daily.load_history(history_path)["history"]
+
+    with daily._history_journal_path(history_path).open("ab") as handle:
+        handle.write(b'{"seq":99999,"date":"2027-01-0')
+    history = daily.load_history(history_path)
+    assert history["history"] == expected
+
+    # Der naechste Eintrag beginnt auf einer neuen Zeile und wird wieder gelesen.
+    _append_days(history, 2, 1)
+    daily.save_history(history, history_path)
+    assert daily.load_history(history_path)["history"][-1]["slugs"] == ["archiv-0002"]
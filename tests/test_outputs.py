@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import gzip
+import os
+import zlib
+from pathlib import Path
+
+import update_daily_content as daily
+
+PAYLOAD = b"<!DOCTYPE html>\n<p>Heute vor Jahren</p>\n" * 20
+
+
+def _sidecar(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix)
+
+
+def test_write_output_adds_gzip_and_deflate_sidecars(tmp_path: Path) -> None:
+    path = tmp_path / "index.html"
+    with daily.output_compression(deflate=True):
+        assert daily.write_output(path, PAYLOAD)
+
+    assert path.read_bytes() == PAYLOAD
+    assert gzip.decompress(_sidecar(path, daily.OUTPUT_GZIP_SUFFIX).read_bytes()) == PAYLOAD
+    assert zlib.decompress(_sidecar(path, daily.OUTPUT_DEFLATE_SUFFIX).read_bytes()) == PAYLOAD
+
+
+def test_write_output_without_compression_or_for_binary_files(tmp_path: Path) -> None:
+    html = tmp_path / "index.html"
+    daily.write_output(html, PAYLOAD)
+    pdf = tmp_path / "dokumentation.pdf"
+    with daily.output_compression(deflate=True):
+        daily.write_output(pdf, b"%PDF-1.4\n")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["dokumentation.pdf", "index.html"]
+
+
+def test_unchanged_output_repairs_only_stale_sidecars(tmp_path: Path) -> None:
+    path = tmp_path / "feed.xml"
+    with daily.output_compression(deflate=True):
+        daily.write_output(path, PAYLOAD)
+    gzip_path = _sidecar(path, daily.OUTPUT_GZIP_SUFFIX)
+    deflate_path = _sidecar(path, daily.OUTPUT_DEFLATE_SUFFIX)
+    # Die .gz-Datei ist aelter als die Ausgabe und hat falschen Inhalt; die .zz-Datei ist aktuell.
+    gzip_path.write_bytes(b"alt")
+    modified = path.stat().st_mtime_ns
+    os.utime(gzip_path, ns=(modified - 1_000_000, modified - 1_000_000))
+    deflate_stat = deflate_path.stat()
+
+    with daily.output_compression(deflate=True):
+        assert not daily.write_output(path, PAYLOAD)
+
+    assert gzip.decompress(gzip_path.read_bytes()) == PAYLOAD
+    assert deflate_path.stat().st_mtime_ns == deflate_stat.st_mtime_ns
+
+
+def test_remove_output_takes_its_sidecars(tmp_path: Path) -> None:
+    path = tmp_path / "index.html"
+    with daily.output_compression(deflate=True):
+        daily.write_output(path, PAYLOAD)
+    daily.remove_output(path)
+    assert not list(tmp_path.iterdir())
+
+
+def test_stale_shards_are_removed_with_their_sidecars(tmp_path: Path) -> None:
+    stale = tmp_path / "shard-zz.json"
+    for path in (stale, _sidecar(stale, daily.OUTPUT_GZIP_SUFFIX)):
+        path.write_bytes(b"{}")
+
+    with daily.output_compression():
+        written = daily.export_search_shards(daily.SearchIndex.build(), tmp_path, prefix_length=3)
+
+    remaining = {path.name for path in tmp_path.iterdir()}
+    assert stale.name not in remaining
+    assert f"{stale.name}{daily.OUTPUT_GZIP_SUFFIX}" not in remaining
+    assert {path.name for path in written} <= remaining
+    assert all(f"{path.name}{daily.OUTPUT_GZIP_SUFFIX}" in remaining for path in written)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import shutil
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import update_daily_content as daily
+
+
+def _server(tmp_path: Path) -> daily.PreviewServer:
+    history_path = tmp_path / "history_log.json"
+    shutil.copy(daily.HISTORY_LOG_PATH, history_path)
+    return daily.PreviewServer(daily.Edition("test", output_dir=tmp_path / "site", history_path=history_path))
+
+
+def _last_history_date(server: daily.PreviewServer) -> date:
+    return date.fromisoformat(daily.load_history(server.edition.history_path)["history"][-1]["date"])
+
+
+def test_day_after_the_history_is_planned_without_writing(tmp_path: Path) -> None:
+    server = _server(tmp_path)
+    before = server.edition.history_path.read_bytes()
+    day = max(_last_history_date(server), datetime.now(daily.BERLIN_TZ).date()) + timedelta(days=3)
+
+    status, headers, body = server.respond("GET", f"/{day.isoformat()}.html", {})
+
+    assert status == 200
+    assert headers["Content-Type"].startswith("text/html")
+    assert daily.german_long_date(datetime.combine(day, datetime.min.time())).encode("utf-8") in body
+    assert server.edition.history_path.read_bytes() == before
+
+
+def test_limit_is_counted_from_today(tmp_path: Path) -> None:
+    server = _server(tmp_path)
+    # Die Historie reicht schon einige Tage ueber heute hinaus; die Grenze darf nicht mitwandern.
+    now = datetime.now(daily.BERLIN_TZ)
+    for offset in range(5):
+        daily.run_editions([server.edition], now + timedelta(days=offset), cache=None)
+    today = now.date()
+    assert _last_history_date(server) > today
+    inside = today + timedelta(days=daily.PREVIEW_MAX_DAYS_AHEAD - 1)
+    outside = today + timedelta(days=daily.PREVIEW_MAX_DAYS_AHEAD)
+
+    assert server.respond("GET", f"/{outside.isoformat()}.pdf", {})[0] == 404
+    assert server.respond("GET", f"/{inside.isoformat()}.pdf", {})[0] == 200
+
+
+def test_etag_answers_not_modified(tmp_path: Path) -> None:
+    server = _server(tmp_path)
+    target = f"/{_last_history_date(server).isoformat()}.html"
+    status, headers, body = server.respond("GET", target, {})
+    assert status == 200 and body
+
+    status, cached_headers, body = server.respond("GET", target, {"if-none-match": headers["ETag"]})
+    assert status == 304
+    assert body == b""
+    assert cached_headers["ETag"] == headers["ETag"]
+
+
+def test_post_is_not_allowed(tmp_path: Path) -> None:
+    status, headers, body = _server(tmp_path).respond("POST", "/", {})
+    assert status == 405
+    assert headers["Allow"] == "GET, HEAD"
+    assert body == b""
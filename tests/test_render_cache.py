@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import update_daily_content as daily
+
+
+def _job(slug: str) -> daily.RenderJob:
+    return daily.RenderJob("html", "15. Januar 2026", "15.01.2026", [daily.ARTICLE_STORE.get(slug)])
+
+
+def test_same_size_edit_is_repaired(tmp_path: Path) -> None:
+    cache = daily.RenderCache(tmp_path / "cache")
+    target = tmp_path / "index.html"
+    (payload,) = daily.render_cached([_job("politik-1648")], cache=cache)
+    assert daily.write_output(target, payload)
+
+    (cached,) = daily.render_cached([_job("politik-1648")], cache=cache)
+    target.write_bytes(cached.replace(b"<html", b"<HTML", 1))
+    assert daily.write_output(target, cached)
+    assert target.read_bytes() == payload
+
+
+def test_eviction_runs_once_per_call(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = daily.RenderCache(tmp_path / "cache", max_bytes=1)
+    calls: list[None] = []
+    original = daily.RenderCache.evict
+    monkeypatch.setattr(daily.RenderCache, "evict", lambda self: calls.append(None) or original(self))
+    daily.render_cached([_job("politik-1648"), _job("politik-1989"), _job("politik-1947")], cache=cache)
+
+    assert len(calls) == 1
+    assert sum(path.stat().st_size for path in (tmp_path / "cache").glob("*.bin")) <= 1
+
+
+def test_keys_are_computed_only_for_rendered_jobs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    keys: list[daily.RenderJob] = []
+    original = daily.render_cache_key
+    monkeypatch.setattr(daily, "render_cache_key", lambda job: keys.append(job) or original(job))
+    daily.render_cached([_job("politik-1648")], cache=None)
+    assert not keys
+
+    history = daily.load_history(daily.HISTORY_LOG_PATH)
+    edition = daily.Edition("test", output_dir=tmp_path / "site", history_path=tmp_path / "history_log.json")
+    cache = daily.RenderCache(tmp_path / "cache")
+    assert daily.update_archive(history, edition, cache=cache)
+    assert keys
+    keys.clear()
+    # Unveraenderte Tage werden am Manifest erkannt, ohne ihren Cache-Schluessel zu berechnen.
+    assert not daily.update_archive(history, edition, cache=cache)
+    assert not keys
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import update_daily_content as daily
+
+START = datetime(2026, 10, 18, 9, 0, tzinfo=daily.BERLIN_TZ)
+
+
+def _run_days(edition: daily.Edition, days: int) -> None:
+    for offset in range(days):
+        daily.run_editions([edition], START + timedelta(days=offset), cache=None)
+
+
+def test_daily_runs_continue_past_pool_exhaustion(tmp_path: Path) -> None:
+    # Mit der eingecheckten Historie sind die Pools nach wenigen Tagen erschoepft; danach rotiert die Auswahl.
+    history_path = tmp_path / "history_log.json"
+    shutil.copy(daily.HISTORY_LOG_PATH, history_path)
+    edition = daily.Edition("test", output_dir=tmp_path / "site", history_path=history_path)
+    _run_days(edition, 10)
+
+    history = daily._load_checked_history(history_path)
+    assert history["history"][-1]["date"] == "2026-10-27"
+    assert any(entry.get(daily.HISTORY_REPEATS_KEY) for entry in history["history"])
+
+
+def test_fresh_single_category_edition_cycles_its_pool(tmp_path: Path) -> None:
+    pool_size = len(daily.ARTICLE_STORE.load_category("politik"))
+    edition = daily.Edition(
+        "politik",
+        categories=("politik",),
+        output_dir=tmp_path / "site",
+        history_path=tmp_path / "politik" / "history_log.json",
+    )
+    _run_days(edition, 2 * pool_size + 3)
+
+    history = daily._load_checked_history(edition.history_path)
+    slugs = [entry["slugs"][0] for entry in history["history"]]
+    assert len(slugs) == 2 * pool_size + 3
+    assert set(slugs[:pool_size]) == set(daily.ARTICLE_STORE.load_category("politik").slugs)
+    # Die Rotation beginnt mit dem am laengsten nicht verwendeten Artikel.
+    assert slugs[pool_size : 2 * pool_size] == slugs[:pool_size]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import shutil
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import update_daily_content as daily
+
+NOW = datetime(2026, 10, 19, 9, 0, tzinfo=daily.BERLIN_TZ)
+
+
+def test_schedule_uses_the_loaded_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    history_path = tmp_path / "history_log.json"
+    shutil.copy(daily.HISTORY_LOG_PATH, history_path)
+    history = daily.load_history(history_path)
+    expected, _ = daily.select_articles(NOW, daily.load_history(history_path))
+
+    loads: list[Path] = []
+    original_load = daily.load_history
+    monkeypatch.setattr(daily, "load_history", lambda path=daily.HISTORY_LOG_PATH: loads.append(path) or original_load(path))
+    articles, reused = daily.scheduled_articles(NOW, history, history_path)
+
+    assert not loads
+    assert not reused
+    assert [article.slug for article in articles] == [article.slug for article in expected]
+    # Planen auf der Kopie laesst die geladene Historie unveraendert, legt aber die Rotationszeiger an.
+    assert history["history"][-1]["date"] < NOW.date().isoformat()
+    assert set(history[daily.HISTORY_CURSORS_KEY]) == set(daily.CATEGORY_ORDER)
+
+
+def test_daily_run_reads_today_from_the_stored_schedule(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    history_path = tmp_path / "history_log.json"
+    shutil.copy(daily.HISTORY_LOG_PATH, history_path)
+    history = daily.load_history(history_path)
+    days = daily.plan_schedule(NOW.date(), history, history_path)
+    planned_today = days[NOW.date().isoformat()]
+    daily._append_history_entry(history, NOW.date().isoformat(), planned_today)
+    daily.save_history(history, history_path)
+
+    plans: list[date] = []
+    original_plan = daily.plan_schedule
+    monkeypatch.setattr(daily, "plan_schedule", lambda today, *args: plans.append(today) or original_plan(today, *args))
+    tomorrow = NOW + timedelta(days=1)
+    articles, _ = daily.scheduled_articles(tomorrow, daily.load_history(history_path), history_path)
+    assert not plans
+    assert [article.slug for article in articles] == days[tomorrow.date().isoformat()]
+
+    # Ein abweichend veroeffentlichter Tag macht den Plan ungueltig; dann wird neu geplant.
+    history = daily.load_history(history_path)
+    daily._append_history_entry(history, tomorrow.date().isoformat(), days[tomorrow.date().isoformat()][::-1])
+    daily.save_history(history, history_path)
+    daily.scheduled_articles(tomorrow + timedelta(days=1), daily.load_history(history_path), history_path)
+    assert plans == [(tomorrow + timedelta(days=1)).date()]
@@ -1,15 +1,58 @@
 from __future__ import annotations
 
+import argparse
+import asyncio
+import base64
+import copy
+import cProfile
+import gzip
+import hashlib
+import heapq
+import html
 import json
+import math
 import os
-from datetime import datetime
+import re
+import sys
+import time
+import tracemalloc
+import unicodedata
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from email.utils import format_datetime
 from pathlib import Path
+from typing import NamedTuple
 from zoneinfo import ZoneInfo
 
 BASE_PATH = Path(__file__).resolve().parent
 HISTORY_LOG_PATH = BASE_PATH / "history_log.json"
 HISTORY_MAX_ENTRIES = 180
 HISTORY_USED_SLUGS_KEY = "used_slugs"
+HISTORY_SEQUENCE_KEY = "sequence"
+HISTORY_PENDING_KEY = "pending"
+HISTORY_JOURNAL_RECORDS_KEY = "journal_records"
+HISTORY_CURSORS_KEY = "cursors"
+HISTORY_INDEX_KEY = "index"
+HISTORY_USED_BITSET_KEY = "used_bitset"
+HISTORY_LAST_USED_KEY = "last_used"
+HISTORY_REPEATS_KEY = "repeats"
+HISTORY_JOURNAL_SUFFIX = ".journal.jsonl"
+HISTORY_COMPACT_INTERVAL = 30
+CALENDAR_PATH = BASE_PATH / "kalender.json"
+SCHEDULE_SUFFIX = ".schedule.json"
+SCHEDULE_VERSION = 1
+SCHEDULE_HORIZON_DAYS = 60
+ARTICLES_PATH = BASE_PATH / "articles"
+ARTICLE_INDEX_NAME = "index.json"
+ARTICLE_INDEX_VERSION = 5
+# Lokaler, nicht eingecheckter Zwischenspeicher: Datei-Stat -> bereits gepruefter Digest.
+ARTICLE_STAT_CACHE_NAME = "index.stat.json"
+ARTICLE_FILE_SUFFIX = ".jsonl"
 
 MONTHS = {
     1: "Januar",
@@ -27,6 +70,61 @@ MONTHS = {
 }
 
 UPDATE_TIME = "09:00"
+BERLIN_TZ = ZoneInfo("Europe/Berlin")
+BATCH_OUTPUT_PATH = BASE_PATH / "vorschau"
+EDITIONS_CONFIG_PATH = BASE_PATH / "editions.json"
+DEFAULT_EDITION_NAME = "standard"
+DEFAULT_EDITION_TITLE = "history"
+ARCHIVE_DIR_NAME = "archiv"
+ARCHIVE_PAGE_SIZE = 30
+ARCHIVE_MANIFEST_NAME = "manifest.json"
+ARCHIVE_MANIFEST_VERSION = 2
+OUTPUT_COMPRESS_SUFFIXES = (".html", ".xml", ".json")
+OUTPUT_GZIP_SUFFIX = ".gz"
+OUTPUT_DEFLATE_SUFFIX = ".zz"
+OUTPUT_COMPRESS_WORKERS = 2
+FEED_WINDOW = 30
+FEED_STATE_SUFFIX = ".feeds-state.json"
+FEED_FORMAT_VERSION = 1
+FEED_FILES = {"rss": "feed.xml", "atom": "atom.xml", "json": "feed.json"}
+SITE_URL_ENV = "SITE_URL"
+ANNIVERSARY_INDEX_PATH = ARTICLES_PATH / "anniversaries.json"
+ANNIVERSARY_INDEX_VERSION = 1
+ANNIVERSARY_SELECTION_ENV = "ANNIVERSARY_SELECTION"
+SEARCH_INDEX_PATH = ARTICLES_PATH / "search.json"
+SEARCH_INDEX_VERSION = 1
+SEARCH_SHARDS_PATH = BASE_PATH / "suche"
+SEARCH_SHARD_PREFIX_LENGTH = 2
+SEARCH_RESULT_LIMIT = 10
+SEARCH_FIELD_WEIGHTS = {"title": 3.0, "paragraphs": 1.0, "source": 1.5}
+SEARCH_BM25_K1 = 1.2
+SEARCH_BM25_B = 0.75
+SEARCH_STOPWORDS = frozenset(
+    "am an auf aus bei das dass dem den der des die ein eine einen einer eines im in ist mit nach "
+    "oder sich sie und vom von vor wie wurde zu zum zur".split()
+)
+PREVIEW_HOST = "127.0.0.1"
+PREVIEW_PORT = 8000
+PREVIEW_CACHE_SIZE = 256
+PREVIEW_MAX_DAYS_AHEAD = 366
+RENDER_WORKERS_ENV = "RENDER_WORKERS"
+RENDER_CACHE_PATH = BASE_PATH / ".render_cache"
+RENDER_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Bei inhaltlichen Aenderungen an den Vorlagen erhoehen; der Quelltext-Hash faengt den Rest ab.
+RENDER_TEMPLATE_VERSION = "2"
+DEFAULT_HTML_THEME = "standard"
+HTML_FRAGMENT_CACHE_SIZE = 4096
+PDF_PAGE_WIDTH = 612
+PDF_PAGE_HEIGHT = 792
+PDF_MARGIN_LEFT = 72
+PDF_MARGIN_TOP = 32
+PDF_MARGIN_BOTTOM = 54
+PDF_TEXT_WIDTH = PDF_PAGE_WIDTH - 2 * PDF_MARGIN_LEFT
+PDF_FONT_SIZE = 12
+PDF_LEADING = 18
+METRICS_PATH_ENV = "DAILY_METRICS_PATH"
+PROFILE_DIR_PATH = BASE_PATH / ".profile"
+TRACEMALLOC_TOP_STATS = 25
 
 CATEGORY_ORDER = [
     "politik",
@@ -36,793 +134,495 @@ CATEGORY_ORDER = [
     "antike",
 ]
 
-ARTICLES = {
-    "politik": [
-        {
-            "slug": "politik-1648",
-            "title": "Politik: Westfaelischer Frieden 1648",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 24. Oktober 1648 beendeten die Vertraege von Muenster und Osnabrueck den Dreissigjaehrigen Krieg, erkannten die Souveraenitaet der Reichsstaende an und verschoben das Machtgleichgewicht zugunsten Frankreichs und Schwedens.",
-                "<strong>Folgen:</strong> Die Vereinbarungen etablierten eine europaweite Diplomatie mit regelmaessigen Kongressen, gaben kleineren Staaten mehr Verhandlungsspielraum und verankerten die Idee, dass religioese Konflikte politisch vermittelt werden koennen.",
-                "<strong>Was wir gelernt haben:</strong> Dauerhafte Friedensordnungen benoetigen geteilte Sicherheitsgarantien, klare Grenzregelungen und Foren fuer Konfliktbearbeitung, damit Sieger und Besiegte langfristig kooperieren.",
-                "<strong>Vertiefung:</strong> Westfaelische Instrumente wie Gesandtenkongresse und Protokollregeln praegen bis heute zwischenstaatliche Verhandlungen und legten die Grundlage fuer moderne Voelkerrechtsprinzipien.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Peace of Westphalia",
-            "source_url": "https://www.britannica.com/event/Peace-of-Westphalia",
-        },
-        {
-            "slug": "politik-1989",
-            "title": "Politik: Mauerfall und deutsche Einheit 1989/90",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 9. November 1989 fiel die Berliner Mauer, was den Weg zur deutschen Einheit und zum Ende des Kalten Krieges ebnete.",
-                "<strong>Folgen:</strong> Die Wiedervereinigung Deutschlands, der Abzug sowjetischer Truppen und die Integration Ostdeutschlands in die EU und NATO folgten.",
-                "<strong>Was wir gelernt haben:</strong> Friedliche Revolutionen koennen durch Dialog, internationale Garantien und wirtschaftliche Hilfen stabilisiert werden.",
-                "<strong>Vertiefung:</strong> Die Transformation Ostdeutschlands und die europaeische Integration sind bis heute Gegenstand politischer und gesellschaftlicher Debatten.",
-            ],
-            "source_label": "Bundeszentrale für politische Bildung",
-            "source_title": "Der Weg zur deutschen Einheit",
-            "source_url": "https://www.bpb.de/geschichte/deutsche-geschichte/deutsche-einheit/",
-        },
-        {
-            "slug": "politik-1947",
-            "title": "Politik: Unabhaengigkeit Indiens 1947",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 15. August 1947 entliess Grossbritannien das ehemalige Britisch-Indien in die Unabhaengigkeit, wodurch die Dominions Indien und Pakistan entstanden und eine massive Migrationsbewegung ausgeloest wurde.",
-                "<strong>Folgen:</strong> Die Teilung schuf neue Verfassungsprozesse, stellte Verwaltungsstrukturen auf die Probe und machte Grenzfragen wie Kaschmir zum zentralen Konfliktfeld zwischen den Nachbarstaaten.",
-                "<strong>Was wir gelernt haben:</strong> Dekolonisation gelingt nachhaltiger, wenn Minderheitenschutz, gemeinsame Institutionen und wirtschaftliche Verflechtungen parallel aufgebaut werden.",
-                "<strong>Vertiefung:</strong> Die indische Verfassung von 1950 kombinierte parlamentarische Demokratie, Foederalismus und Grundrechte und wurde zum Referenzrahmen fuer viele Staaten des Globalen Suedens.",
-            ],
-            "source_label": "Library of Congress",
-            "source_title": "Independence for the Indian Subcontinent",
-            "source_url": "https://www.loc.gov/exhibits/british-empire/independence-for-indian-subcontinent.html",
-        },
-        {
-            "slug": "politik-1975",
-            "title": "Politik: Helsinki-Schlussakte 1975",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 1. August 1975 unterzeichneten 35 Staaten der KSZE in Helsinki eine Schlussakte, die Grenzen in Europa anerkannte, Menschenrechte hervorhob und vertrauensbildende Sicherheitsmassnahmen vereinbarte.",
-                "<strong>Folgen:</strong> Die Konferenz schuf Berichtspflichten, Beobachterformate und neue Kommunikationskanaele zwischen Ost und West, was Buergerrechtsbewegungen in Osteuropa zusaetzlich staerkte.",
-                "<strong>Was wir gelernt haben:</strong> Dialogplattformen koennen selbst unter Systemkonflikten funktionieren, wenn sie Transparenzanforderungen, militaerische Vertrauensmassnahmen und Zivilgesellschaftsrechte verbinden.",
-                "<strong>Vertiefung:</strong> Die OSZE uebernimmt bis heute Wahlbeobachtungen, Konfliktpraevention und Mediationen, die direkt aus den Helsinki-Standards abgeleitet sind.",
-            ],
-            "source_label": "OSZE",
-            "source_title": "Helsinki Final Act",
-            "source_url": "https://www.osce.org/helsinki-final-act",
-        },
-        {
-            "slug": "politik-1998",
-            "title": "Politik: Good-Friday-Agreement 1998",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 10. April 1998 legte das Karfreitagsabkommen den Grundstein fuer eine Machtteilung in Nordirland, beendete den bewaffneten Konflikt weitgehend und schuf neue grenzueberschreitende Institutionen.",
-                "<strong>Folgen:</strong> Gewaltakte nahmen drastisch ab, die Polizeireform begann und kulturelle Identitaeten erhielten gleichberechtigtere Anerkennung innerhalb eines gemeinsamen politischen Rahmens.",
-                "<strong>Was wir gelernt haben:</strong> Friedensabkommen muessen Sicherheitsgarantien, politische Teilhabe und soziooekonomische Entwicklungsprogramme kombinieren, um bewaffnete Gruppen langfristig zu integrieren.",
-                "<strong>Vertiefung:</strong> Die Einrichtung gemeinsamer Ministerien und Foren zwischen Belfast, Dublin und London dient international als Blaupause fuer postkonfliktuelle Machtteilung.",
-            ],
-            "source_label": "UK Government",
-            "source_title": "The Belfast Agreement",
-            "source_url": "https://www.gov.uk/government/publications/the-belfast-agreement",
-        },
-        {
-            "slug": "politik-1992",
-            "title": "Politik: Vertrag von Maastricht 1992",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 7. Februar 1992 unterzeichneten die Staaten der Europaeischen Gemeinschaft den Vertrag von Maastricht, der die Europaeische Union gruendete und Grundlagen fuer gemeinsame Waehrungs-, Aussen- und Innenpolitik legte.",
-                "<strong>Folgen:</strong> Der Vertrag fuehrte den Euro schrittweise ein, erweiterte das Mitentscheidungsverfahren des Europaeischen Parlaments und schuf neue Politikkoordination in Bereichen wie Bildung, Gesundheit und Umwelt.",
-                "<strong>Was wir gelernt haben:</strong> Tiefere Integration setzt klare Kompetenzverteilungen, demokratische Legitimation und verbindliche Konvergenzkriterien voraus, damit Mitgliedstaaten Reformen mittragen.",
-                "<strong>Vertiefung:</strong> Spaetere Vertragswerke wie Amsterdam, Nizza und Lissabon bauten auf Maastricht auf, indem sie Institutionen an Erweiterungen anpassten und die gemeinsame Aussen- und Sicherheitspolitik praezisierten.",
-            ],
-            "source_label": "Europaeische Union",
-            "source_title": "Vertrag von Maastricht",
-            "source_url": "https://european-union.europa.eu/principles-countries-history/history-eu/1990-1999/1992/de",
-        },
-        {
-            "slug": "politik-1919",
-            "title": "Politik: Versailler Vertrag 1919",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 28. Juni 1919 unterzeichneten die Alliierten und Deutschland im Spiegelsaal von Versailles einen Friedensvertrag, der den Ersten Weltkrieg offiziell beendete und Reparationspflichten festschrieb.",
-                "<strong>Folgen:</strong> Der Vertrag begrenzte das deutsche Heer, schuf den Voelkerbund und ordnete Grenzen Europas neu, loeste jedoch wirtschaftliche und politische Instabilitaet in Deutschland aus.",
-                "<strong>Was wir gelernt haben:</strong> Friedensschluesse muessen wirtschaftliche Tragfaehigkeit und politische Integration der Besiegten beruecksichtigen, sonst entstehen Revanchismus und extremistische Bewegungen.",
-                "<strong>Vertiefung:</strong> Historiker diskutieren bis heute, wie Sanktionspolitik, Selbstbestimmungsversprechen und unvollstaendige Sicherheitsarchitektur den Weg fuer spaetere Konflikte bahnten.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Treaty of Versailles",
-            "source_url": "https://www.britannica.com/event/Treaty-of-Versailles-1919",
-        },
-        {
-            "slug": "politik-1955",
-            "title": "Politik: Bandung-Konferenz 1955",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Vom 18. bis 24. April 1955 trafen sich 29 afrikanische und asiatische Staaten in Bandung, um gemeinsame Positionen gegen Kolonialismus und Blockpolitik zu formulieren.",
-                "<strong>Folgen:</strong> Die Konferenz begruendete die Blockfreienbewegung, foerderte sued-sued Kooperation und verschaffte postkolonialen Staaten eine internationale Stimme.",
-                "<strong>Was wir gelernt haben:</strong> Multilaterale Allianzen abseits der Grossmaechte koennen Verhandlungsmacht erhoehen, solange gemeinsame Agenden und Vermittlungsforen gepflegt werden.",
-                "<strong>Vertiefung:</strong> Spaetere Gipfel von Belgrad bis Havanna bauten auf Bandung auf und entwickelten Prinzipien wie Nichteinmischung, gegenseitige Hilfe und wirtschaftliche Solidaritaet.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Bandung Conference",
-            "source_url": "https://www.britannica.com/event/Bandung-Conference",
-        },
-        {
-            "slug": "politik-1962",
-            "title": "Politik: Kuba-Krise 1962",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Im Oktober 1962 stationierte die Sowjetunion Mittelstreckenraketen auf Kuba, woraufhin die USA eine Seeblockade verhaengten und beide Supermaechte intensives Krisenmanagement betrieben.",
-                "<strong>Folgen:</strong> Nach geheimen und oeffentlichen Verhandlungen zog Moskau die Raketen ab, Washington sagte im Gegenzug Raketenstationierungen in der Tuerkei ab und richtete einen direkten Krisentelefonkanal ein.",
-                "<strong>Was wir gelernt haben:</strong> Transparente Kommunikation, Eskalationskontrolle und vertrauliche Diplomatie sind lebenswichtig, um Fehlkalkulationen in Hochrisikokonflikten zu vermeiden.",
-                "<strong>Vertiefung:</strong> Die Krise fuehrte zu Ruestungskontrollinitiativen wie dem partiellen Atomteststoppvertrag von 1963 und praegt bis heute Verfahren der strategischen Stabilitaet.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Cuban missile crisis",
-            "source_url": "https://www.britannica.com/event/Cuban-missile-crisis",
-        },
-        {
-            "slug": "politik-1987",
-            "title": "Politik: INF-Vertrag 1987",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 8. Dezember 1987 unterzeichneten die USA und die Sowjetunion in Washington den INF-Vertrag, der landgestuetzte Mittelstreckenraketen verbot und Inspektionen ermoeglichte.",
-                "<strong>Folgen:</strong> Ueber 2600 Waffen wurden vernichtet, gegenseitige Ueberwachungsmechanismen etabliert und das Vertrauen zwischen den Supermaechten im spaeten Kalten Krieg gestaerkt.",
-                "<strong>Was wir gelernt haben:</strong> Ruestungskontrolle funktioniert, wenn Verifikationstechnik, klare Definitionen und politische Entspannung zusammenkommen.",
-                "<strong>Vertiefung:</strong> Der Vertrag diente als Vorbild fuer spaetere Abkommen wie START und schuf neue sicherheitspolitische Dialogplattformen in Europa.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Intermediate-Range Nuclear Forces Treaty",
-            "source_url": "https://www.britannica.com/event/Intermediate-Range-Nuclear-Forces-Treaty",
-        },
-        {
-            "slug": "politik-2015",
-            "title": "Politik: Pariser Klimaabkommen 2015",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 12. Dezember 2015 einigten sich 196 Vertragsparteien der UN-Klimakonferenz in Paris auf ein globales Abkommen, das die Erderwaermung deutlich unter zwei Grad Celsius begrenzen soll.",
-                "<strong>Folgen:</strong> Staaten reichten nationale Klimaplaene ein, entwickelten Transparenzregeln und richteten Finanzierungsmechanismen fuer Anpassung und Emissionsminderung ein.",
-                "<strong>Was wir gelernt haben:</strong> Globale Herausforderungen benoetigen dynamische Ambitionsschleifen, Peer-Review und verlaessliche Finanzierung, damit gemeinsame Ziele tragfaehig bleiben.",
-                "<strong>Vertiefung:</strong> Folgekonferenzen konkretisieren Emissionsmaerkte, Loss-and-Damage-Fonds und Berichterstattung, waehrend Gerichte und Parlamente Klimapolitik zunehmend einfordern.",
-            ],
-            "source_label": "UNFCCC",
-            "source_title": "The Paris Agreement",
-            "source_url": "https://unfccc.int/process-and-meetings/the-paris-agreement",
-        },
-        {
-            "slug": "politik-2005",
-            "title": "Politik: Bundestagswahl und Kanzlerwechsel 2005",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 18. September 2005 fand die vorgezogene Bundestagswahl statt, die zum ersten Mal eine Kanzlerin, Angela Merkel, hervorbrachte.",
-                "<strong>Folgen:</strong> Die Große Koalition prägte die deutsche Politik, Reformen in Arbeitsmarkt und Sozialstaat wurden umgesetzt.",
-                "<strong>Was wir gelernt haben:</strong> Politische Wechsel können neue Impulse für Modernisierung und internationale Positionierung bringen.",
-                "<strong>Vertiefung:</strong> Die Ära Merkel beeinflusste Deutschlands Rolle in Europa und der Welt nachhaltig.",
-            ],
-            "source_label": "Bundeszentrale für politische Bildung",
-            "source_title": "Bundestagswahl 2005",
-            "source_url": "https://www.bpb.de/kurz-knapp/hintergrund-aktuell/202005/bundestagswahl-2005/",
-        },
-    ],
-    "wirtschaft": [
-        {
-            "slug": "wirtschaft-1944",
-            "title": "Wirtschaft: Bretton-Woods-System 1944",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Im Juli 1944 schufen 44 Staaten in Bretton Woods ein System fester Wechselkurse, gruendeten den Internationalen Waehrungsfonds und die Weltbank und banden den US-Dollar an Gold.",
-                "<strong>Folgen:</strong> Gemeinsame Regeln fuer Kapitalverkehr, Kreditlinien und Zahlungsbilanzen beschleunigten den Wiederaufbau und liessen den Welthandel bis in die 1960er Jahre stark wachsen.",
-                "<strong>Was wir gelernt haben:</strong> Globale Finanzarchitekturen benoetigen Anpassungsmechanismen und transparente Aufsicht, um Ungleichgewichte fruehzeitig zu korrigieren.",
-                "<strong>Vertiefung:</strong> Nachfolgeinstrumente des IWF, etwa Sonderziehungsrechte, greifen weiterhin auf Grundideen von Bretton Woods zurueck.",
-            ],
-            "source_label": "International Monetary Fund",
-            "source_title": "The Enduring Legacy of Bretton Woods",
-            "source_url": "https://www.imf.org/external/about/histcoop.htm",
-        },
-        {
-            "slug": "wirtschaft-2008",
-            "title": "Wirtschaft: Globale Finanzkrise 2008",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Im Herbst 2008 loeste der Kollaps von Lehman Brothers eine weltweite Finanzkrise aus, die Banken, Maerkte und Volkswirtschaften erschuetterte.",
-                "<strong>Folgen:</strong> Staaten retteten Banken, fuehrten Konjunkturpakete ein und verschuldeten sich stark, waehrend Arbeitslosigkeit und soziale Spannungen zunahmen.",
-                "<strong>Was wir gelernt haben:</strong> Finanzsysteme benoetigen strenge Regulierung, Transparenz und internationale Zusammenarbeit, um systemische Risiken zu begrenzen.",
-                "<strong>Vertiefung:</strong> Die Krise fuehrte zu neuen Regeln wie Basel III, zur Staerkung von Aufsichtsbehoerden und zu Debatten ueber soziale Gerechtigkeit.",
-            ],
-            "source_label": "Deutsche Bundesbank",
-            "source_title": "Die globale Finanzkrise 2008",
-            "source_url": "https://www.bundesbank.de/de/aufgaben/themen/die-globale-finanzkrise-2008-667962",
-        },
-        {
-            "slug": "wirtschaft-1947",
-            "title": "Wirtschaft: Marshallplan 1947",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Im April 1948 startete das European Recovery Program, besser bekannt als Marshallplan, mit dem die USA Milliarden fuer den Wiederaufbau Westeuropas bereitstellten.",
-                "<strong>Folgen:</strong> Kredite, Rohstofflieferungen und Technologietransfer staerkten Industrieproduktion, fuehrten zu neuen Handelspartnerschaften und verankerten transatlantische Kooperation.",
-                "<strong>Was wir gelernt haben:</strong> Wiederaufbauprogramme wirken nachhaltiger, wenn sie wirtschaftliche Integration, Produktivitaetssteigerungen und Bildungsoffensiven verbinden.",
-                "<strong>Vertiefung:</strong> Die Organisation fuer Europaesche Wirtschaftliche Zusammenarbeit, Vorlaeufer der OECD, koordinierte die Mittelverwendung und wurde zu einem Forum fuer gemeinsame Planung.",
-            ],
-            "source_label": "US Department of State",
-            "source_title": "The Marshall Plan",
-            "source_url": "https://www.state.gov/the-marshall-plan/",
-        },
-        {
-            "slug": "wirtschaft-1999",
-            "title": "Wirtschaft: Euro-Einfuehrung 1999",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 1. Januar 1999 fuehrten elf EU-Staaten den Euro als Buchwaehrung ein und uebertrugen die Geldpolitik an die neu gegruendete Europaeische Zentralbank.",
-                "<strong>Folgen:</strong> Der gemeinsame Waehrungsraum erleichterte Handel, senkte Transaktionskosten und machte fiskalische Koordinierung sowie Stabilitaetspakte zwingend.",
-                "<strong>Was wir gelernt haben:</strong> Gemeinsame Waehrungen erfordern strenge Haushaltsueberwachung, Bankenaufsicht und geteilte Kriseninstrumente, um asymmetrische Schocks aufzufangen.",
-                "<strong>Vertiefung:</strong> Die Kapitalmarktunion, Rettungsschirme und die Bankenunion bauen auf den institutionellen Strukturen der Euro-Einfuehrung auf.",
-            ],
-            "source_label": "Europaeische Zentralbank",
-            "source_title": "Introduction of the Euro",
-            "source_url": "https://www.ecb.europa.eu/euro/intro/html/index.en.html",
-        },
-        {
-            "slug": "wirtschaft-2001",
-            "title": "Wirtschaft: WTO-Beitritt Chinas 2001",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 11. Dezember 2001 trat China der Welthandelsorganisation bei und verpflichtete sich zu Zollsenkungen, Marktliberalisierung und Rechtsreformen im Handel.",
-                "<strong>Folgen:</strong> Die Integration Chinas in den Welthandel senkte Konsumpreise weltweit, verstaerkte jedoch Wettbewerbsdruck auf Industriearbeitnehmer in vielen Regionen.",
-                "<strong>Was wir gelernt haben:</strong> Handelserweiterungen brauchen flankierende Sozial- und Strukturpolitik, damit Produktivitaetsgewinne breiter verteilt werden.",
-                "<strong>Vertiefung:</strong> Debatten ueber Lieferketten, Technologietransfer und faire Marktbedingungen praegen seither die internationale Wirtschaftspolitik.",
-            ],
-            "source_label": "World Trade Organization",
-            "source_title": "China and the WTO",
-            "source_url": "https://www.wto.org/english/thewto_e/acc_e/a1_china_e.htm",
-        },
-        {
-            "slug": "wirtschaft-1957",
-            "title": "Wirtschaft: Roemische Vertraege 1957",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 25. Maerz 1957 unterzeichneten sechs Staaten die Roemischen Vertraege und gruendeten damit die Europaeische Wirtschaftsgemeinschaft sowie Euratom als Bausteine fuer einen gemeinsamen Markt.",
-                "<strong>Folgen:</strong> Zuelle wurden abgebaut, Wettbewerbsregeln vereinheitlicht und gemeinsame Institutionen geschaffen, was Handel, Produktivitaet und Investitionen im Binnenmarkt langfristig steigerte.",
-                "<strong>Was wir gelernt haben:</strong> Wirtschaftliche Integration braucht verbindliche Rechtsrahmen, faire Uebergangsfristen und Ausgleichsmechanismen fuer strukturschwaechere Regionen.",
-                "<strong>Vertiefung:</strong> Die heutige EU knuepft mit Binnenmarkt, Zollunion und Strukturfoerderung direkt an Prinzipien der Roemischen Vertraege an und erweitert sie um gemeinsame Standards in vielen Politikfeldern.",
-            ],
-            "source_label": "Europaeische Kommission",
-            "source_title": "Die Roemischen Vertraege",
-            "source_url": "https://european-union.europa.eu/principles-countries-history/history-eu/1950-1959/1957/de",
-        },
-        {
-            "slug": "wirtschaft-1933",
-            "title": "Wirtschaft: New Deal 1933",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Ab 1933 setzte US-Praesident Franklin D. Roosevelt das New-Deal-Programm um, um Banken zu stabilisieren, Arbeit zu schaffen und Sozialabsicherung nach der Weltwirtschaftskrise auszubauen.",
-                "<strong>Folgen:</strong> Institutionen wie die FDIC und Social Security entstanden, Infrastrukturprojekte kurbelten Nachfrage an und der Staat uebernahm groessere Verantwortung fuer Konjunktursteuerung.",
-                "<strong>Was wir gelernt haben:</strong> Antizyklische Fiskalpolitik und Regulierung koennen Wirtschaftskrisen abmildern, muessen aber an regionale Bedarfe angepasst werden.",
-                "<strong>Vertiefung:</strong> Der New Deal beeinflusste spaetere Wohlfahrtsstaaten, von europaeischen Sozialmodellen bis zu Entwicklungsprogrammen in Lateinamerika.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "New Deal",
-            "source_url": "https://www.britannica.com/event/New-Deal",
-        },
-        {
-            "slug": "wirtschaft-1973",
-            "title": "Wirtschaft: Oelkrise 1973",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Im Oktober 1973 verkuendeten OPEC-Staaten ein Oelembargo gegen Laender, die Israel unterstuetzten, wodurch Rohstoffpreise stark stiegen und Lieferketten ins Stocken gerieten.",
-                "<strong>Folgen:</strong> Industrienationen fuehrten Tempolimits, Rationierungen und Energieprogramme ein; Rezession und Inflation praegten die mittleren 1970er Jahre.",
-                "<strong>Was wir gelernt haben:</strong> Energiesicherheit verlangt Diversifizierung, Effizienzstrategien und strategische Reserven, um Preisschocks abzufedern.",
-                "<strong>Vertiefung:</strong> Die Krise beschleunigte die Gruendung der Internationalen Energieagentur und Investitionen in erneuerbare und nukleare Alternativen.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "oil crisis",
-            "source_url": "https://www.britannica.com/event/oil-crisis",
-        },
-        {
-            "slug": "wirtschaft-1985",
-            "title": "Wirtschaft: Plaza-Abkommen 1985",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 22. September 1985 vereinbarten die Finanzminister der G5 im Plaza Hotel in New York koordinierte Deviseninterventionen, um den US-Dollar zu schwaechen.",
-                "<strong>Folgen:</strong> Der Dollar verlor deutlich an Wert, Handelsungleichgewichte reduzierten sich kurzfristig und Japan sowie Deutschland passten ihre Geld- und Fiskalpolitik an.",
-                "<strong>Was wir gelernt haben:</strong> Koordinierte Waehrungspolitik erfordert abgestimmte Zentralbankmassnahmen und wirtschaftspolitische Konsistenz, sonst entstehen neue Verzerrungen.",
-                "<strong>Vertiefung:</strong> Das Plaza-Abkommen bereitete den Louvre Accord 1987 vor und zeigte, wie begrenzt zeitlich befristete Wechselkurssteuerung wirkt.",
-            ],
-            "source_label": "Federal Reserve History",
-            "source_title": "The Plaza Accord",
-            "source_url": "https://www.federalreservehistory.org/essays/plaza-accord",
-        },
-        {
-            "slug": "wirtschaft-1994",
-            "title": "Wirtschaft: NAFTA 1994",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 1. Januar 1994 trat das Nordamerikanische Freihandelsabkommen zwischen Kanada, Mexiko und den USA in Kraft und hob Zolle sowie viele Handelsbarrieren schrittweise auf.",
-                "<strong>Folgen:</strong> Handel und Investitionen nahmen zu, Lieferketten verbanden Industrien neu, waehrend einzelne Branchen Anpassungsdruck und Standortwettbewerb erlebten.",
-                "<strong>Was wir gelernt haben:</strong> Freihandel braucht flankierende Bildungs-, Infrastruktur- und Sozialpolitiken, damit Wettbewerbsfaehigkeit breiter aufgebaut wird.",
-                "<strong>Vertiefung:</strong> Der Nachfolgevertrag USMCA aktualisierte Ursprungsregeln, Digitalhandel und Arbeitsstandards und baut auf den Erfahrungen aus NAFTA auf.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "North American Free Trade Agreement",
-            "source_url": "https://www.britannica.com/topic/North-American-Free-Trade-Agreement",
-        },
-        {
-            "slug": "wirtschaft-2014",
-            "title": "Wirtschaft: Gruendung der AIIB 2014",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 24. Oktober 2014 unterzeichneten 21 Staaten in Peking ein Memorandum zur Gruendung der Asian Infrastructure Investment Bank, um Infrastrukturfinanzierung in Asien zu staerken.",
-                "<strong>Folgen:</strong> Die Bank stellte Milliarden fuer Verkehrs-, Energie- und Digitalprojekte bereit, kooperierte mit bestehenden Entwicklungsbanken und erweiterte globale Kapitalstroeme.",
-                "<strong>Was wir gelernt haben:</strong> Neue Entwicklungsbanken koennen Finanzierungsluecken schliessen, wenn Governance, Umweltauflagen und Transparenz gesichert sind.",
-                "<strong>Vertiefung:</strong> Die AIIB wuchs rasch auf Mitglieder aller Kontinente und setzt Schwerpunkte auf nachhaltige Infrastruktur, regionale Konnektivitaet und Klimakompatibilitaet.",
-            ],
-            "source_label": "Asian Infrastructure Investment Bank",
-            "source_title": "About AIIB",
-            "source_url": "https://www.aiib.org/en/about-aiib/index.html",
-        },
-        {
-            "slug": "wirtschaft-2020",
-            "title": "Wirtschaft: Corona-Krise und Wirtschaft 2020",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Ab März 2020 führte die COVID-19-Pandemie zu einem weltweiten Wirtschaftseinbruch.",
-                "<strong>Folgen:</strong> Kurzarbeit, staatliche Hilfspakete und Digitalisierung prägten die Reaktion auf die Krise.",
-                "<strong>Was wir gelernt haben:</strong> Resiliente Wirtschaftssysteme brauchen flexible Instrumente und internationale Zusammenarbeit.",
-                "<strong>Vertiefung:</strong> Die Pandemie beschleunigte Strukturwandel und neue Arbeitsformen.",
-            ],
-            "source_label": "ifo Institut",
-            "source_title": "Corona-Krise und Wirtschaft",
-            "source_url": "https://www.ifo.de/thema/corona",
-        },
-    ],
-    "zeitgeschichte": [
-        {
-            "slug": "zeitgeschichte-1989",
-            "title": "Zeitgeschichte: Fall der Berliner Mauer 1989",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 9. November 1989 oeffnete die Berliner Mauer nach einer missverstandenen Pressekonferenz, was spontane Grenzuebergaenge, Jubel und den raschen Zusammenbruch der DDR-Grenzinfrastruktur ausloeste.",
-                "<strong>Folgen:</strong> Familien wurden wiedervereint, kommunistische Regime in Osteuropa gerieten unter Reformdruck und die deutsche Einigung wurde binnen eines Jahres politisch umgesetzt.",
-                "<strong>Was wir gelernt haben:</strong> Kommunikation in Krisenzeiten kann kipppunktartig wirken; Transparenz und vorbereitete Fahrplaene sind entscheidend, um friedliche Umbrueche zu begleiten.",
-                "<strong>Vertiefung:</strong> Erinnerungsorte, Bildungsprogramme und Forschungsstaetten analysieren seither die Ursachen friedlicher Revolutionen und deren Bedeutung fuer heutige Transformationsprozesse.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Fall of the Berlin Wall",
-            "source_url": "https://www.britannica.com/event/fall-of-the-Berlin-Wall",
-        },
-        {
-            "slug": "zeitgeschichte-2001",
-            "title": "Zeitgeschichte: 11. September 2001",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 11. September 2001 veruebten Terroristen Anschlaege auf das World Trade Center und das Pentagon, was weltweite Schockwellen ausloeste.",
-                "<strong>Folgen:</strong> Die USA und ihre Verbuendeten begannen den Krieg gegen den Terror, fuehrten neue Sicherheitsgesetze ein und griffen in Afghanistan und Irak militärisch ein.",
-                "<strong>Was wir gelernt haben:</strong> Globale Sicherheit erfordert internationale Kooperation, Geheimdienstarbeit und gesellschaftliche Resilienz gegen Extremismus.",
-                "<strong>Vertiefung:</strong> Die Anschlaege veraenderten langfristig Aussenpolitik, Ueberwachung und das Verhaeltnis von Freiheit und Sicherheit.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "September 11 attacks",
-            "source_url": "https://www.britannica.com/event/September-11-attacks",
-        },
-        {
-            "slug": "zeitgeschichte-1986",
-            "title": "Zeitgeschichte: Reaktorkatastrophe von Tschernobyl 1986",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 26. April 1986 explodierte Block 4 des Kernkraftwerks Tschernobyl, verbreitete radioaktive Wolken ueber Europa und machte weite Gebiete um Pripjat unbewohnbar.",
-                "<strong>Folgen:</strong> Evakuierungen, Langzeitkrankheiten und enorme Dekontaminationskosten veraenderten die Energiedebatte weltweit und fuehrten zu strengeren Sicherheitsstandards.",
-                "<strong>Was wir gelernt haben:</strong> Hochrisikotechnologien brauchen transparente Aufsicht, Notfallplaene und eine Sicherheitskultur, die Fehler offenlegt, statt sie zu vertuschen.",
-                "<strong>Vertiefung:</strong> Internationale Agenturen wie die IAEA koordinieren seither Stresstests, Informationsaustausch und Sicherheitsmissionen fuer Atomkraftwerke.",
-            ],
-            "source_label": "International Atomic Energy Agency",
-            "source_title": "Chernobyl Accident",
-            "source_url": "https://www.iaea.org/topics/chernobyl",
-        },
-        {
-            "slug": "zeitgeschichte-1995",
-            "title": "Zeitgeschichte: Wahrheitskommission Suedafrika 1995",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 1995 setzte Suedafrika die Truth and Reconciliation Commission ein, um Verbrechen der Apartheid aufzuklaeren, Opfern Gehoer zu geben und ueber Amnestien zu entscheiden.",
-                "<strong>Folgen:</strong> Oeffentliche Anhoerungen, Reparationsempfehlungen und nationale Debatten unterstuetzten den Uebergang zu einer inklusiveren Demokratie trotz ungeloster Ungleichheiten.",
-                "<strong>Was wir gelernt haben:</strong> Versoehnungspolitik verlangt Kombinationen aus Wahrheit, Verantwortlichkeit und Reformprogrammen, damit Vertrauen zwischen Gesellschaftsgruppen entstehen kann.",
-                "<strong>Vertiefung:</strong> Viele Laender uebersetzten das Modell in eigene Wahrheitskommissionen und kombinierten es mit Strafverfolgung sowie Restitutionsmassnahmen.",
-            ],
-            "source_label": "South African Government",
-            "source_title": "Truth and Reconciliation Commission Reports",
-            "source_url": "https://www.justice.gov.za/trc/report/",
-        },
-        {
-            "slug": "zeitgeschichte-2011",
-            "title": "Zeitgeschichte: Arabischer Fruehling 2011",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Ausgehend von Protesten in Tunesien Ende 2010 breitete sich 2011 eine Welle von Demonstrationen und Aufstaenden in der arabischen Welt aus, die Autoritarismus und soziale Ungleichheit infrage stellten.",
-                "<strong>Folgen:</strong> Manche Staaten sahen Reformen oder Regierungswechsel, andere gerieten in langwierige Konflikte; regionale und internationale Akteure rangen um Einfluss.",
-                "<strong>Was wir gelernt haben:</strong> Soziale Medien, demografischer Druck und wirtschaftliche Perspektivlosigkeit koennen politische Systeme schnell destabilisieren, wenn Reformkanaele fehlen.",
-                "<strong>Vertiefung:</strong> Analysen untersuchen weiterhin, welche institutionellen Faktoren den Transformationsverlauf bestimmten und wie Resilienz autoritaerer Regime funktioniert.",
-            ],
-            "source_label": "Council on Foreign Relations",
-            "source_title": "The Arab Spring at Ten",
-            "source_url": "https://www.cfr.org/timeline/arab-spring",
-        },
-        {
-            "slug": "zeitgeschichte-1969",
-            "title": "Zeitgeschichte: Mondlandung Apollo 11 1969",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 20. Juli 1969 landeten Neil Armstrong und Buzz Aldrin mit Apollo 11 auf dem Mond und setzten erstmals menschliche Schritte auf einen anderen Himmelskoerper.",
-                "<strong>Folgen:</strong> Die Mission demonstrierte technologische Leistungsfaehigkeit, foerderte Weltraumforschung und inspirierte Kooperationen in Wissenschaft, Navigation und Materialentwicklung.",
-                "<strong>Was wir gelernt haben:</strong> Grosse Forschungsprojekte erfordern langfristige Investitionen, klare Ziele und internationale Sicherheitsstandards, um gesellschaftliche Akzeptanz zu gewinnen.",
-                "<strong>Vertiefung:</strong> Nach Apollo etablierte die NASA Programme wie Skylab und das Space-Shuttle, waehrend internationale Partner spaeter mit der ISS gemeinsame Forschung ausbauten.",
-            ],
-            "source_label": "NASA",
-            "source_title": "Apollo 11 Mission Overview",
-            "source_url": "https://www.nasa.gov/mission_pages/apollo/missions/apollo11.html",
-        },
-        {
-            "slug": "zeitgeschichte-1961",
-            "title": "Zeitgeschichte: Erstflug von Juri Gagarin 1961",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 12. April 1961 umkreiste der sowjetische Kosmonaut Juri Gagarin in der Raumkapsel Wostok 1 einmal die Erde und wurde damit zum ersten Menschen im Weltall.",
-                "<strong>Folgen:</strong> Der Erfolg intensivierte das Weltraumrennen, foerderte Bildungsprogramme in Naturwissenschaften und fuehrte zu grossen Investitionen in Raumfahrttechnologien weltweit.",
-                "<strong>Was wir gelernt haben:</strong> Technologische Durchbrueche entstehen aus langfristiger Forschungsfoerderung, internationalem Wettbewerb und gezielter Nachwuchsausbildung.",
-                "<strong>Vertiefung:</strong> Der Flug bereitete Kooperationen wie Apollo-Sojus, den Aufbau der Raumstation Mir und spaeter die Internationale Raumstation vor.",
-            ],
-            "source_label": "NASA",
-            "source_title": "Yuri Gagarin: First Human in Space",
-            "source_url": "https://www.nasa.gov/content/yuri-gagarin-first-human-in-space",
-        },
-        {
-            "slug": "zeitgeschichte-1972",
-            "title": "Zeitgeschichte: Anschlag von Muenchen 1972",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 5. September 1972 nahm die palaestinensische Gruppe Schwarzer September israelische Athleten im Olympischen Dorf von Muenchen als Geiseln; eine missglueckte Befreiung endete toedlich.",
-                "<strong>Folgen:</strong> Zwoelf Israelis, ein deutscher Polizist und fuenf Taeter starben; Sicherheitsprotokolle fuer Sportgrossveranstaltungen und Antiterror-Massnahmen wurden grundlegend ueberarbeitet.",
-                "<strong>Was wir gelernt haben:</strong> Grosse Veranstaltungen brauchen integrierte Sicherheitsarchitektur, internationale Zusammenarbeit und transparente Krisenkommunikation.",
-                "<strong>Vertiefung:</strong> Das Ereignis fuehrte zur Aufstellung von Spezialeinheiten wie der GSG 9 und praegte internationale Kooperationen gegen transnationalen Terrorismus.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Munich Massacre",
-            "source_url": "https://www.britannica.com/event/Munich-Massacre",
-        },
-        {
-            "slug": "zeitgeschichte-1984",
-            "title": "Zeitgeschichte: Bhopal-Katastrophe 1984",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> In der Nacht vom 2. auf den 3. Dezember 1984 entwichen giftige Gase aus einer Pestizidfabrik in Bhopal, Indien, und verursachten eine der schlimmsten Industriekatastrophen.",
-                "<strong>Folgen:</strong> Tausende Menschen starben, Hunderttausende erlitten Langzeitschaeden, und Umwelt sowie Grundwasser wurden schwer kontaminiert.",
-                "<strong>Was wir gelernt haben:</strong> Industriestandards, Risikomanagement und Notfallplaene muessen strikt eingehalten werden, vor allem in dicht besiedelten Regionen.",
-                "<strong>Vertiefung:</strong> Die Katastrophe loeste weltweite Debatten ueber Konzernhaftung, Chemiesicherheit und Opferentschaedigung aus und beeinflusste Umweltrecht dauerhaft.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Bhopal disaster",
-            "source_url": "https://www.britannica.com/event/Bhopal-disaster",
-        },
-        {
-            "slug": "zeitgeschichte-2004",
-            "title": "Zeitgeschichte: Indischer Ozean Tsunami 2004",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 26. Dezember 2004 loeste ein Seebeben der Staerke 9,1 im Indischen Ozean Tsunamis aus, die Kuesten in 14 Laendern verwuesteten.",
-                "<strong>Folgen:</strong> Mehr als 230000 Menschen starben, Millionen verloren ihre Lebensgrundlage, und internationale Hilfsprogramme erreichten beispiellose Ausmasse.",
-                "<strong>Was wir gelernt haben:</strong> Fruehwarnsysteme, Katastrophenschutz und resilienter Wiederaufbau sind zentral, um Naturgefahren zu begegnen.",
-                "<strong>Vertiefung:</strong> Nach der Katastrophe bauten Anrainerstaaten regionale Tsunami-Warnzentren auf und verankerten Katastrophenvorsorge in Entwicklungsstrategien.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Indian Ocean tsunami of 2004",
-            "source_url": "https://www.britannica.com/event/Indian-Ocean-tsunami-of-2004",
-        },
-        {
-            "slug": "zeitgeschichte-2014",
-            "title": "Zeitgeschichte: Ebola-Ausbruch Westafrika 2014",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 2014 breitete sich in Guinea, Liberia und Sierra Leone ein Ebola-Ausbruch aus und entwickelte sich zum groessten verzeichneten Ereignis der Krankheit.",
-                "<strong>Folgen:</strong> Ueber 11000 Menschen starben, Gesundheitssysteme kollabierten und wirtschaftliche wie soziale Aktivitaeten kamen zeitweise zum Erliegen.",
-                "<strong>Was wir gelernt haben:</strong> Globale Gesundheitskrisen verlangen fruehe Surveillance, vernetzte Labore und Community-Einbindung, um Vertrauen und Compliance zu sichern.",
-                "<strong>Vertiefung:</strong> Der Ausbruch fuehrte zur Staerkung der WHO-Notfallprogramme, zu UN-Koordinierung via UNMEER und zur beschleunigten Entwicklung von Impfstoffen.",
-            ],
-            "source_label": "World Health Organization",
-            "source_title": "Ebola virus disease: one year into the outbreak",
-            "source_url": "https://www.who.int/csr/disease/ebola/one-year-report/introduction/en/",
-        },
-        {
-            "slug": "zeitgeschichte-2015",
-            "title": "Zeitgeschichte: Flüchtlingskrise 2015",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 2015 erreichten über eine Million Geflüchtete Europa, vor allem Deutschland, ausgelöst durch Kriege und Krisen im Nahen Osten.",
-                "<strong>Folgen:</strong> Gesellschaftliche Debatten, Integrationsmaßnahmen und politische Umbrüche prägten die Folgejahre.",
-                "<strong>Was wir gelernt haben:</strong> Migration stellt Gesellschaften vor Herausforderungen, bietet aber auch Chancen für Erneuerung.",
-                "<strong>Vertiefung:</strong> Die Flüchtlingskrise beeinflusst bis heute Politik, Recht und gesellschaftlichen Zusammenhalt.",
-            ],
-            "source_label": "Bundeszentrale für politische Bildung",
-            "source_title": "Flüchtlingskrise 2015",
-            "source_url": "https://www.bpb.de/themen/migration-integration/dossier-migration/216790/fluechtlingskrise-2015/",
-        },
-    ],
-    "gesellschaft": [
-        {
-            "slug": "gesellschaft-1964",
-            "title": "Gesellschaft: Civil Rights Act 1964",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 2. Juli 1964 unterzeichnete US-Praesident Lyndon B. Johnson den Civil Rights Act, der Rassentrennung im oeffentlichen Leben verbot und den Zugang zu Wahlrechten schuetze.",
-                "<strong>Folgen:</strong> Gerichte, Bundesbehoerden und Aktivistinnen konnten diskriminierende Praktiken konsequenter anfechten; das Gesetz wirkte als Motor fuer weitere Gleichberechtigungsagenda.",
-                "<strong>Was wir gelernt haben:</strong> Gesetzliche Gleichstellung muss mit Durchsetzungsmechanismen, Bildungsinvestitionen und gesellschaftlichem Dialog flankiert werden, damit sie Wirkung entfaltet.",
-                "<strong>Vertiefung:</strong> Der Civil Rights Act bildet eine Grundlage fuer spaetere Antidiskriminierungsnormen, etwa im Bereich Behinderung, Geschlecht oder Herkunft.",
-            ],
-            "source_label": "National Archives",
-            "source_title": "The Civil Rights Act",
-            "source_url": "https://www.archives.gov/milestone-documents/civil-rights-act",
-        },
-        {
-            "slug": "gesellschaft-2020",
-            "title": "Gesellschaft: COVID-19-Pandemie 2020",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Ab Maerz 2020 breitete sich das Coronavirus weltweit aus, fuehrte zu Lockdowns, Schulschliessungen und einer globalen Gesundheitskrise.",
-                "<strong>Folgen:</strong> Wirtschaftliche Einbrueche, Digitalisierungsschub, neue Formen der Arbeit und gesellschaftliche Polarisierung praegten die Zeit.",
-                "<strong>Was wir gelernt haben:</strong> Krisenmanagement erfordert transparente Kommunikation, wissenschaftliche Beratung und internationale Solidaritaet.",
-                "<strong>Vertiefung:</strong> Die Pandemie beschleunigte Innovationen in Medizin, Bildung und Verwaltung und wirkte als Katalysator fuer gesellschaftlichen Wandel.",
-            ],
-            "source_label": "Robert Koch-Institut",
-            "source_title": "COVID-19-Pandemie",
-            "source_url": "https://www.rki.de/DE/Content/InfAZ/N/Neuartiges_Coronavirus/nCoV.html",
-        },
-        {
-            "slug": "gesellschaft-1971",
-            "title": "Gesellschaft: Frauenstimmrecht Schweiz 1971",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> In einer Volksabstimmung am 7. Februar 1971 sprach sich die Schweiz fuer das Frauenstimmrecht auf Bundesebene aus und schloss damit eine lange Phase der politischen Ausschliessung.",
-                "<strong>Folgen:</strong> Frauen konnten nun an nationalen Wahlen teilnehmen, Mandate uebernehmen und Gleichstellungsfragen staerker auf die politische Agenda setzen.",
-                "<strong>Was wir gelernt haben:</strong> Inklusivere Demokratien entstehen durch hartnaeckige Zivilgesellschaft, Allianzen ueber Parteigrenzen hinweg und durch die Argumentation, dass Teilhabe Demokratie stabilisiert.",
-                "<strong>Vertiefung:</strong> Kantone passten sukzessive ihre Gesetze an, waehrend Bildungsinitiativen politische Partizipation von Frauen weiter foerderten.",
-            ],
-            "source_label": "swissinfo",
-            "source_title": "Women gain the vote in Switzerland",
-            "source_url": "https://www.swissinfo.ch/eng/politics/womens-vote-50-years/46377464",
-        },
-        {
-            "slug": "gesellschaft-1991",
-            "title": "Gesellschaft: World Wide Web 1991",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 6. August 1991 stellte das CERN das World Wide Web der Oeffentlichkeit zur Verfuegung, wodurch Hypertext-Dokumente weltweit ueber das Internet abrufbar wurden.",
-                "<strong>Folgen:</strong> Forschung, Medien, Handel und Bildung verlagerten Inhalte ins Netz; neue Branchen und digitale Kommunikationsformen entstanden in kurzer Zeit.",
-                "<strong>Was wir gelernt haben:</strong> Offene Standards und lizenzfreie Technologien beschleunigen Innovation, muessen aber von Datenschutz- und Ethikregeln begleitet werden.",
-                "<strong>Vertiefung:</strong> Das Web-Konsortium setzt bis heute technische Spezifikationen fest, waehrend Debatten um digitale Souveraenitaet und Plattformregulierung an Bedeutung gewinnen.",
-            ],
-            "source_label": "CERN",
-            "source_title": "The Birth of the Web",
-            "source_url": "https://home.cern/science/computing/birth-web",
-        },
-        {
-            "slug": "gesellschaft-2006",
-            "title": "Gesellschaft: UN-Behindertenrechtskonvention 2006",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Die UN-Generalversammlung verabschiedete am 13. Dezember 2006 die Konvention ueber die Rechte von Menschen mit Behinderungen, die 2008 in Kraft trat.",
-                "<strong>Folgen:</strong> Staaten verpflichteten sich zu Barrierefreiheit, Inklusion im Bildungssystem und rechtlicher Gleichstellung; Monitoringstellen ueberwachen Fortschritte und Defizite.",
-                "<strong>Was wir gelernt haben:</strong> Menschenrechte muessen intersektional gedacht werden, damit strukturelle Diskriminierung in Arbeit, Wohnen und politischer Teilhabe abgebaut wird.",
-                "<strong>Vertiefung:</strong> Nationale Aktionsplaene, Aktionsforschung und Selbstvertretungsorganisationen treiben seitdem Reformen fuer inklusive Gesellschaften voran.",
-            ],
-            "source_label": "Vereinte Nationen",
-            "source_title": "Convention on the Rights of Persons with Disabilities",
-            "source_url": "https://www.un.org/development/desa/disabilities/convention-on-the-rights-of-persons-with-disabilities.html",
-        },
-        {
-            "slug": "gesellschaft-2017",
-            "title": "Gesellschaft: Ehe fuer alle Deutschland 2017",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 30. Juni 2017 beschloss der Deutsche Bundestag die Ehe fuer alle und oeffnete die zivilrechtliche Ehe unabhaengig vom Geschlecht der Partner.",
-                "<strong>Folgen:</strong> Gleichgeschlechtliche Paare erhielten volle Adoptions- und Erbrechte, Verwaltungen passten Formulare an und rechtliche Diskriminierungen wurden weiter abgebaut.",
-                "<strong>Was wir gelernt haben:</strong> Fortschritte in Gleichstellungsfragen benoetigen parlamentarische Mehrheiten, verfassungsrechtliche Absicherung und kontinuierliche Bewusstseinsarbeit.",
-                "<strong>Vertiefung:</strong> Nach dem Beschluss folgten Anpassungen in Familien- und Steuerrecht sowie Debatten ueber Schutz vor Diskriminierung im Arbeits- und Bildungsbereich.",
-            ],
-            "source_label": "Deutscher Bundestag",
-            "source_title": "Bundestag beschliesst Ehe fuer alle",
-            "source_url": "https://www.bundestag.de/dokumente/textarchiv/2017/kw26-de-ehe-513354",
-        },
-        {
-            "slug": "gesellschaft-1948",
-            "title": "Gesellschaft: Allgemeine Erklaerung der Menschenrechte 1948",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 10. Dezember 1948 verabschiedete die UN-Generalversammlung in Paris die Allgemeine Erklaerung der Menschenrechte als universellen Referenzrahmen.",
-                "<strong>Folgen:</strong> Der Katalog beeinflusste Verfassungen, internationale Pakte und buergerrechtliche Bewegungen weltweit und setzte Standards fuer die Nachkriegsordnung.",
-                "<strong>Was wir gelernt haben:</strong> Menschenrechte entfalten Wirkung, wenn Staaten Berichtspflichten, Justizzugang und Bildungsprogramme fuer ihre Umsetzung etablieren.",
-                "<strong>Vertiefung:</strong> Spaetere Pakte zu buergerlichen und sozialen Rechten sowie regionale Konventionen konkretisierten die Prinzipien der Erklaerung.",
-            ],
-            "source_label": "Vereinte Nationen",
-            "source_title": "Universal Declaration of Human Rights",
-            "source_url": "https://www.un.org/en/about-us/universal-declaration-of-human-rights",
-        },
-        {
-            "slug": "gesellschaft-1954",
-            "title": "Gesellschaft: Brown v. Board of Education 1954",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 17. Mai 1954 erklaerte der US Supreme Court im Fall Brown v. Board of Education staatliche Rassentrennung an Schulen fuer verfassungswidrig.",
-                "<strong>Folgen:</strong> Der Entscheid leitete die Desegregation oeffentlicher Bildung ein, staerkte die Buergerrechtsbewegung und provozierte politischen Widerstand in mehreren Bundesstaaten.",
-                "<strong>Was wir gelernt haben:</strong> Gerichtliche Entscheidungen koennen strukturellen Wandel ausloesen, benoetigen aber Durchsetzung, Monitoring und gesellschaftliche Ueberzeugungsarbeit.",
-                "<strong>Vertiefung:</strong> Nachfolgeurteile und Bundesgesetze wie der Civil Rights Act festigten Gleichstellungsnormen, waehrend Debatten ueber Bildungsungleichheit weitergehen.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Brown v. Board of Education of Topeka",
-            "source_url": "https://www.britannica.com/event/Brown-v-Board-of-Education-of-Topeka",
-        },
-        {
-            "slug": "gesellschaft-1990",
-            "title": "Gesellschaft: Americans with Disabilities Act 1990",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 26. Juli 1990 unterzeichnete US-Praesident George H. W. Bush den Americans with Disabilities Act und verankerte umfassende Antidiskriminierungsrechte fuer Menschen mit Behinderungen.",
-                "<strong>Folgen:</strong> Unternehmen, Verwaltungen und Verkehrstraeger mussten Barrierefreiheit schaffen, waehrend Ombudsstellen und Klagen Rechte effektiv durchsetzten.",
-                "<strong>Was wir gelernt haben:</strong> Inklusionspolitik braucht klare Standards, Kontrollinstanzen und Beteiligung von Betroffenen, um strukturelle Hindernisse abzubauen.",
-                "<strong>Vertiefung:</strong> Der ADA inspirierte vergleichbare Gesetze weltweit und bereitete den Boden fuer internationale Abkommen wie die UN-Behindertenrechtskonvention.",
-            ],
-            "source_label": "National Archives",
-            "source_title": "Americans with Disabilities Act",
-            "source_url": "https://www.archives.gov/milestone-documents/americans-with-disabilities-act",
-        },
-        {
-            "slug": "gesellschaft-2001",
-            "title": "Gesellschaft: Ehe fuer alle Niederlande 2001",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 1. April 2001 fuehrten die Niederlande als erstes Land die Ehe fuer gleichgeschlechtliche Paare ein und passten das Zivilrecht entsprechend an.",
-                "<strong>Folgen:</strong> Adoption, Steuer- und Erbrechte wurden geoeffnet, gesellschaftliche Akzeptanz nahm zu und internationale Debatten ueber Gleichstellung erhielten Auftrieb.",
-                "<strong>Was wir gelernt haben:</strong> Fortschritt in LGBTQ+-Rechten beruht auf langjaehrigen Kampagnen, politischem Willen und gerichtlicher Rueckendeckung.",
-                "<strong>Vertiefung:</strong> Zahlreiche Staaten uebernahmen das Modell, waehrend transnationale Netzwerke rechtliche und soziale Unterstuetzung fuer Regenbogenfamilien ausbauten.",
-            ],
-            "source_label": "Government of the Netherlands",
-            "source_title": "Same-sex marriage",
-            "source_url": "https://www.government.nl/topics/marriage-cohabitation-and-registered-partnership/same-sex-marriage",
-        },
-        {
-            "slug": "gesellschaft-2015",
-            "title": "Gesellschaft: Agenda 2030 und SDGs 2015",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 25. September 2015 verabschiedeten die UN-Mitgliedstaaten die Agenda 2030 mit 17 Nachhaltigkeitszielen fuer soziale, oekonomische und oekologische Entwicklung.",
-                "<strong>Folgen:</strong> Staaten, Unternehmen und Staedte entwickelten Monitoringrahmen, Dateninitiativen und Partnerschaften, um Armut, Ungleichheit und Klimawandel gemeinsam zu adressieren.",
-                "<strong>Was wir gelernt haben:</strong> Globale Zielsysteme muessen messbar, inklusiv und finanziell unterlegt sein, damit Fortschritte transparent nachvollzogen werden koennen.",
-                "<strong>Vertiefung:</strong> Regelmaessige Hochrangige Politische Foren und freiwillige nationale Berichte pruefen Umsetzungsluecken, waehrend Zivilgesellschaft zusaetzliche Daten und Finanzierung einfordert.",
-            ],
-            "source_label": "Vereinte Nationen",
-            "source_title": "Sustainable Development Goals",
-            "source_url": "https://sdgs.un.org/goals",
-        },
-    ],
-    "antike": [
-        {
-            "slug": "antike-1750",
-            "title": "Antike: Kodex Hammurabi ca. 1750 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Um 1750 v. Chr. liess Koenig Hammurabi von Babylon einen umfangreichen Gesetzeskorpus in Stein meisseln, der Eigentums-, Familien- und Strafrecht regelte.",
-                "<strong>Folgen:</strong> Der Kodex schuf Rechtssicherheit fuer Handel und Verwaltung, legitimierte monarchische Autoritaet und diente als Vorlage fuer spaetere Keilschriftgesetzgebungen.",
-                "<strong>Was wir gelernt haben:</strong> Schriftliche Gesetze erhoehen Transparenz, muessen aber regelmaessig angepasst werden, damit soziale Gruppen nicht benachteiligt werden.",
-                "<strong>Vertiefung:</strong> Der Kodex zeigt fruehe Abstufungen von Strafen nach sozialem Status und inspiriert Forschungen zu Gerechtigkeitsvorstellungen im Alten Orient.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Code of Hammurabi",
-            "source_url": "https://www.britannica.com/topic/Code-of-Hammurabi",
-        },
-        {
-            "slug": "antike-0049",
-            "title": "Antike: Caesars Ueberschreitung des Rubikon 49 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Im Januar 49 v. Chr. ueberschritt Gaius Julius Caesar mit seinen Legionen den Rubikon und loeste damit den roemischen Buergerkrieg aus.",
-                "<strong>Folgen:</strong> Die Republik zerbrach, Caesar wurde Diktator auf Lebenszeit und bereitete den Uebergang zum Prinzipat vor.",
-                "<strong>Was wir gelernt haben:</strong> Machtkonzentration und Missachtung republikanischer Normen koennen politische Systeme destabilisieren.",
-                "<strong>Vertiefung:</strong> Der Rubikon-Entschluss ist bis heute ein Symbol fuer unumkehrbare Entscheidungen in der Politik.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Julius Caesar crosses the Rubicon",
-            "source_url": "https://www.britannica.com/event/Julius-Caesar-crosses-the-Rubicon",
-        },
-        {
-            "slug": "antike-0300",
-            "title": "Antike: Bibliothek von Alexandria 3. Jh. v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Im 3. Jahrhundert v. Chr. gruendete das ptolemaeische Herrscherhaus in Alexandria eine Bibliothek, die Aufbewahrung und Uebersetzung antiker Texte zum Ziel hatte.",
-                "<strong>Folgen:</strong> Gelehrte aus vielen Regionen tauschten Wissen aus, katalogisierten Schriften und entwickelten philologische Methoden, die Wissenschaften bis heute praegen.",
-                "<strong>Was wir gelernt haben:</strong> Wissenszentren gedeihen durch offene Sammlungen, Sprachkompetenz und staatliche Foerderung, bleiben jedoch an politische Stabilitaet gebunden.",
-                "<strong>Vertiefung:</strong> Rekonstruktionen der Bibliothek zeigen, wie antike Infrastruktur und Stiftungen globale Wissensnetzwerke ermoeglichten.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Library of Alexandria",
-            "source_url": "https://www.britannica.com/place/Library-of-Alexandria",
-        },
-        {
-            "slug": "antike-0594",
-            "title": "Antike: Reformen des Solon 594 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 594 v. Chr. uebernahm Solon in Athen weitreichende Vollmachten, hob Schuldknechtschaft auf und reorganisierte politische Beteiligung nach Einkommensklassen.",
-                "<strong>Folgen:</strong> Die Reformen stabilisierten Athen, weiteten Mitbestimmung aus und legten Grundlagen fuer spaetere demokratische Institutionen wie Rat und Volksgericht.",
-                "<strong>Was wir gelernt haben:</strong> Soziale Spannungen lassen sich durch ausgewogene Kombinationen von Schuldenerlass, Rechtsreform und politischer Inklusion entspannen.",
-                "<strong>Vertiefung:</strong> Spaetere Gesetzgeber wie Kleisthenes knuepften an Solons Kompromisse an und entwickelten die attische Demokratie weiter.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Solon",
-            "source_url": "https://www.britannica.com/biography/Solon",
-        },
-        {
-            "slug": "antike-0312",
-            "title": "Antike: Via Appia 312 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 312 v. Chr. begann Rom den Bau der Via Appia, einer befestigten Fernstrasse, die die Hauptstadt mit Sueditalien verband und Truppentransporte beschleunigte.",
-                "<strong>Folgen:</strong> Die Strasse erleichterte Handel, Verwaltung und kulturellen Austausch und wurde zum Vorbild fuer das roemische Strassennetz.",
-                "<strong>Was wir gelernt haben:</strong> Infrastrukturprojekte koennen Machtprojektion, Wirtschaft und Integration gleichzeitig staerken, wenn Wartung und Sicherheit gewaehrleistet sind.",
-                "<strong>Vertiefung:</strong> Archaeologische Untersuchungen zeigen, wie Ingenieurkunst, Vermessung und lokale Arbeitskraefte zusammenspielten, um dauerhafte Verkehrswege zu schaffen.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Appian Way",
-            "source_url": "https://www.britannica.com/topic/Appian-Way",
-        },
-        {
-            "slug": "antike-0490",
-            "title": "Antike: Schlacht von Marathon 490 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 490 v. Chr. besiegten athenische Hopliten bei Marathon eine persische Invasionsarmee und stoppten damit vorerst die Ausdehnung des Achamenidenreichs nach Griechenland.",
-                "<strong>Folgen:</strong> Der Sieg staerkte das Selbstbewusstsein der griechischen Poleis, foerderte Milizsysteme und wurde zum Symbol fuer den Schutz demokratischer Strukturen gegen aeussere Bedrohungen.",
-                "<strong>Was wir gelernt haben:</strong> Mobilisierung freier Buerger und schnelle Kommunikation ueber Boten konnten strategische Vorteile schaffen, wenn politische Fuehrung geschlossen agierte.",
-                "<strong>Vertiefung:</strong> Historiker analysieren Marathon als Auftakt der Perserkriege und diskutieren, wie sich daraus Athener Seemacht, Delisch-Attischer Bund und klassische Kultur entwickelten.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Battle of Marathon",
-            "source_url": "https://www.britannica.com/event/Battle-of-Marathon",
-        },
-        {
-            "slug": "antike-0449",
-            "title": "Antike: Zwoelf Tafeln 449 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 449 v. Chr. verkuendete Rom die Zwoelf Tafeln als oeffentliches Gesetzeswerk und machte zentrale Rechtsnormen fuer alle Buergerschichten zugaenglich.",
-                "<strong>Folgen:</strong> Der Kodex begrenzte patrizische Willkuer, vereinheitlichte Verfahren und staerkte das Rechtsbewusstsein der Plebejer.",
-                "<strong>Was wir gelernt haben:</strong> Gesetzeswerke schaffen Vertrauen, wenn sie transparent, nachvollziehbar und fuer unterschiedliche Gruppen anwendbar sind.",
-                "<strong>Vertiefung:</strong> Die Zwoelf Tafeln beeinflussten das spaetere roemische Recht und dienten als Referenz fuer mittelalterliche und moderne Gesetzgebungen.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Twelve Tables",
-            "source_url": "https://www.britannica.com/topic/Twelve-Tables",
-        },
-        {
-            "slug": "antike-0431",
-            "title": "Antike: Peloponnesischer Krieg 431 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 431 v. Chr. brach zwischen Athen und Sparta der Peloponnesische Krieg um Hegemonie ueber die griechische Welt aus.",
-                "<strong>Folgen:</strong> Der fast drei Jahrzehnte dauernde Konflikt schwaechte Stadtstaaten, zerstoerte Ressourcen und fuehrte schliesslich zum Niedergang Athens.",
-                "<strong>Was wir gelernt haben:</strong> Machtverschiebungen und starre Buendnisse koennen Sicherheitsdilemmata erzeugen, wenn diplomatische Ausgleichsforen fehlen.",
-                "<strong>Vertiefung:</strong> Thukydides' Analyse des Krieges praegte politische Theorie und dient bis heute als Lehrbeispiel fuer Realismus und Machtbalance.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Peloponnesian War",
-            "source_url": "https://www.britannica.com/event/Peloponnesian-War",
-        },
-        {
-            "slug": "antike-0331",
-            "title": "Antike: Schlacht von Gaugamela 331 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 1. Oktober 331 v. Chr. besiegte Alexander der Grosse den Perserkoenig Dareios III. bei Gaugamela mit einer beweglichen, kombinierten Streitmacht.",
-                "<strong>Folgen:</strong> Der Sieg oeffnete den Weg zur Einnahme Babylons, zur Aufloesung des Achamenidenreichs und zur Errichtung hellenistischer Koenigreiche.",
-                "<strong>Was wir gelernt haben:</strong> Flexible Taktik, Koordination verschiedener Waffengattungen und Fuehrungsqualitaet entscheiden auch ueber zahlenmaessig ueberlegene Gegner.",
-                "<strong>Vertiefung:</strong> Gaugamela markierte den Beginn umfassender Kulturkontakte zwischen Mittelmeerraum und Vorderasien und praegte militaerisches Denken ueber Jahrhunderte.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Battle of Gaugamela",
-            "source_url": "https://www.britannica.com/event/Battle-of-Gaugamela",
-        },
-        {
-            "slug": "antike-0264",
-            "title": "Antike: Erster Punischer Krieg 264 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 264 v. Chr. begann der Erste Punische Krieg zwischen Rom und Karthago um die Kontrolle ueber Sizilien und maritime Handelswege.",
-                "<strong>Folgen:</strong> Nach 23 Jahren siegte Rom, etablierte seine erste Provinz und baute eine leistungsfaehige Flotte auf, waehrend Karthago hohe Reparationen zahlen musste.",
-                "<strong>Was wir gelernt haben:</strong> Langfristige Kriege erfordern Ressourcenmanagement, technische Innovationen und politische Ausdauer, um See- und Landoperationen zu verbinden.",
-                "<strong>Vertiefung:</strong> Der Konflikt leitete Roms Expansion im Mittelmeer ein und bereitete spaetere Punische Kriege sowie den Aufstieg zur Grossmacht vor.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "First Punic War",
-            "source_url": "https://www.britannica.com/event/First-Punic-War",
-        },
-        {
-            "slug": "antike-0027",
-            "title": "Antike: Prinzipat des Augustus 27 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> 27 v. Chr. verlieh der Senat Octavian den Titel Augustus, womit der Prinzipat als neue Regierungsform des Roemischen Reiches entstand.",
-                "<strong>Folgen:</strong> Verwaltungsreformen, ein stehendes Heer und Provinzpolitik sicherten Stabilitaet und leiteten die Pax Romana ein.",
-                "<strong>Was wir gelernt haben:</strong> Politische Systeme koennen konsolidiert werden, wenn Machtteilung, Tradition und Innovation in neuen Institutionen verbunden werden.",
-                "<strong>Vertiefung:</strong> Augustische Bauprogramme, Gesetzgebung und Propaganda praegten das Selbstverstaendnis des Imperiums und beeinflussen historische Wahrnehmung bis heute.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Augustus",
-            "source_url": "https://www.britannica.com/biography/Augustus",
-        },
-        {
-            "slug": "antike-0051",
-            "title": "Antike: Schlacht von Actium 31 v. Chr.",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Am 2. September 31 v. Chr. besiegte Octavian die Flotte von Marcus Antonius und Kleopatra bei Actium.",
-                "<strong>Folgen:</strong> Der Sieg leitete das Ende der römischen Republik und den Beginn des Prinzipats ein.",
-                "<strong>Was wir gelernt haben:</strong> Seeherrschaft und strategische Allianzen können den Lauf der Geschichte entscheiden.",
-                "<strong>Vertiefung:</strong> Die Schlacht von Actium ist ein Wendepunkt der antiken Weltgeschichte.",
-            ],
-            "source_label": "Encyclopaedia Britannica",
-            "source_title": "Battle of Actium",
-            "source_url": "https://www.britannica.com/event/Battle-of-Actium",
-        },
-    ],
-}
-
+class RunMetrics:
+    # Zeiten je Stufe (Sekunden, aufsummiert) und Zaehler fuer einen Lauf.
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.started = time.perf_counter()
+        self.spans: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + time.perf_counter() - started
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def record(self, **extra: object) -> dict[str, object]:
+        record: dict[str, object] = {
+            "timestamp": datetime.now(BERLIN_TZ).isoformat(timespec="seconds"),
+            "total_seconds": round(time.perf_counter() - self.started, 6),
+            "spans": {name: round(seconds, 6) for name, seconds in self.spans.items()},
+            "counters": dict(self.counters),
+        }
+        record.update(extra)
+        return record
+
+
+METRICS = RunMetrics()
+
+
+def _record_text(record: dict[str, object], key: str) -> str:
+    value = record.get(key)
+    return value if isinstance(value, str) else ""
+
+
+class Article(NamedTuple):
+    # Unveraenderlicher Korpusartikel: Slug und Kategorie interniert, Absaetze als Tupel, kein __dict__.
+    slug: str
+    category: str
+    title: str
+    paragraphs: tuple[str, ...]
+    source_label: str
+    source_title: str
+    source_url: str
+
+    @classmethod
+    def from_record(cls, record: dict[str, object], category: str) -> Article:
+        paragraphs = record.get("paragraphs")
+        return cls(
+            sys.intern(_record_text(record, "slug")),
+            sys.intern(category),
+            _record_text(record, "title"),
+            tuple(text for text in paragraphs if isinstance(text, str)) if isinstance(paragraphs, list) else (),
+            _record_text(record, "source_label"),
+            _record_text(record, "source_title"),
+            _record_text(record, "source_url"),
+        )
 
-ARTICLE_LOOKUP: dict[str, dict[str, object]] = {}
-for _articles in ARTICLES.values():
-    for _article in _articles:
-        slug = _article.get("slug")
-        if isinstance(slug, str) and slug not in ARTICLE_LOOKUP:
-            ARTICLE_LOOKUP[slug] = _article
+    def to_record(self) -> dict[str, object]:
+        # Form der Zeilen in <kategorie>.jsonl (ohne Kategorie); Grundlage fuer Cache-Schluessel.
+        return {
+            "slug": self.slug,
+            "title": self.title,
+            "paragraphs": list(self.paragraphs),
+            "source_label": self.source_label,
+            "source_title": self.source_title,
+            "source_url": self.source_url,
+        }
+
+
+class ArticlePool(Sequence):
+    # Artikel einer Kategorie in Pool-Reihenfolge; Slugs als paralleles Tupel, Positionen erst bei Bedarf.
+    __slots__ = ("category", "articles", "slugs", "_positions")
+
+    def __init__(self, category: str, articles: Iterable[Article]) -> None:
+        self.category = sys.intern(category)
+        self.articles = tuple(articles)
+        self.slugs = tuple(article.slug for article in self.articles)
+        self._positions: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def __getitem__(self, index: int | slice) -> Article | tuple[Article, ...]:
+        return self.articles[index]
+
+    def __iter__(self) -> Iterator[Article]:
+        return iter(self.articles)
+
+    @property
+    def positions(self) -> dict[str, int]:
+        if self._positions is None:
+            positions: dict[str, int] = {}
+            for position, slug in enumerate(self.slugs):
+                positions.setdefault(slug, position)
+            self._positions = positions
+        return self._positions
+
+
+class ArticleStore(ABC):
+    # Schnittstelle fuer Artikelquellen: Kategorien werden erst beim ersten Zugriff geladen.
+    @abstractmethod
+    def categories(self) -> list[str]:
+        ...
+
+    @abstractmethod
+    def slugs(self) -> list[str]:
+        ...
+
+    @abstractmethod
+    def load_category(self, category: str) -> ArticlePool:
+        ...
+
+    @abstractmethod
+    def get(self, slug: str) -> Article | None:
+        ...
+
+    @abstractmethod
+    def category_of(self, slug: str) -> str | None:
+        ...
+
+    @abstractmethod
+    def fingerprint(self, category: str) -> str:
+        ...
+
+    # Stabile Ganzzahl-IDs: einmal vergeben, nie neu belegt; Grundlage fuer das Bitset der verwendeten Slugs.
+    @abstractmethod
+    def slug_id(self, slug: str) -> int | None:
+        ...
+
+    @abstractmethod
+    def id_slug(self, article_id: int) -> str | None:
+        ...
+
+    def category_ids(self, category: str) -> list[int]:
+        return [self.slug_id(slug) for slug in self.load_category(category).slugs]
+
+    @abstractmethod
+    def registry(self) -> tuple[int, str]:
+        ...
+
+    @abstractmethod
+    def registry_digest(self, count: int) -> str | None:
+        ...
+
+
+def _registry_digest(id_slugs: list[str]) -> str:
+    return hashlib.sha1("\n".join(id_slugs).encode("utf-8")).hexdigest()
+
+
+class MemoryArticleStore(ArticleStore):
+    def __init__(self, articles: dict[str, list[dict[str, object]]]) -> None:
+        self._articles = {
+            category: ArticlePool(
+                category,
+                (Article.from_record(record, category) for record in pool if isinstance(record.get("slug"), str)),
+            )
+            for category, pool in articles.items()
+        }
+        self._lookup: dict[str, Article] = {}
+        self._categories: dict[str, str] = {}
+        self._fingerprints: dict[str, str] = {}
+        for category, pool in self._articles.items():
+            for article in pool:
+                if article.slug not in self._lookup:
+                    self._lookup[article.slug] = article
+                    self._categories[article.slug] = category
+        self._id_slugs = list(self._lookup)
+        self._ids = {slug: article_id for article_id, slug in enumerate(self._id_slugs)}
+        self._registry_digests: dict[int, str] = {}
+        self._category_ids: dict[str, list[int]] = {}
+
+    def categories(self) -> list[str]:
+        return list(self._articles)
+
+    def slugs(self) -> list[str]:
+        return list(self._lookup)
+
+    def load_category(self, category: str) -> ArticlePool:
+        return self._articles[category]
+
+    def get(self, slug: str) -> Article | None:
+        return self._lookup.get(slug)
+
+    def category_of(self, slug: str) -> str | None:
+        return self._categories.get(slug)
+
+    def slug_id(self, slug: str) -> int | None:
+        return self._ids.get(slug)
+
+    def category_ids(self, category: str) -> list[int]:
+        ids = self._category_ids.get(category)
+        if ids is None:
+            ids = self._category_ids[category] = super().category_ids(category)
+        return ids
+
+    def id_slug(self, article_id: int) -> str | None:
+        return self._id_slugs[article_id] if 0 <= article_id < len(self._id_slugs) else None
+
+    def registry(self) -> tuple[int, str]:
+        return len(self._id_slugs), self.registry_digest(len(self._id_slugs)) or ""
+
+    def registry_digest(self, count: int) -> str | None:
+        if not 0 <= count <= len(self._id_slugs):
+            return None
+        digest = self._registry_digests.get(count)
+        if digest is None:
+            digest = self._registry_digests[count] = _registry_digest(self._id_slugs[:count])
+        return digest
+
+    def fingerprint(self, category: str) -> str:
+        fingerprint = self._fingerprints.get(category)
+        if fingerprint is None:
+            slugs = "\n".join(self._articles[category].slugs)
+            fingerprint = self._fingerprints[category] = hashlib.sha1(slugs.encode("utf-8")).hexdigest()
+        return fingerprint
+
+
+class JsonLinesArticleStore(ArticleStore):
+    # Eine Datei <kategorie>.jsonl pro Kategorie, dazu index.json mit Slug -> (Kategorie, Byte-Offset).
+    def __init__(self, directory: Path, index_name: str = ARTICLE_INDEX_NAME) -> None:
+        self.directory = directory
+        self.index_path = directory / index_name
+        self.stat_cache_path = directory / ARTICLE_STAT_CACHE_NAME
+        self._index: dict[str, object] | None = None
+        self._pools: dict[str, ArticlePool] = {}
+        self._lookup: dict[str, Article] = {}
+        self._category_ids: dict[str, list[int]] = {}
+
+    def _category_path(self, category: str) -> Path:
+        return self.directory / f"{category}{ARTICLE_FILE_SUFFIX}"
+
+    def _read_stat_cache(self) -> dict[str, object]:
+        try:
+            raw_cache = json.loads(self.stat_cache_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+            return {}
+        return raw_cache if isinstance(raw_cache, dict) else {}
+
+    def _write_stat_cache(self, stat_cache: dict[str, object]) -> None:
+        try:
+            self.stat_cache_path.write_text(
+                json.dumps(stat_cache, ensure_ascii=True, separators=(",", ":")) + "\n", encoding="utf-8"
+            )
+        except OSError:
+            pass
+
+    def _read_index(self) -> dict[str, object] | None:
+        try:
+            raw_index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+            return None
+        if not isinstance(raw_index, dict) or raw_index.get("version") != ARTICLE_INDEX_VERSION:
+            return None
+        files = raw_index.get("files")
+        if (
+            not isinstance(files, dict)
+            or not isinstance(raw_index.get("slugs"), dict)
+            or not isinstance(raw_index.get("digests"), dict)
+            or not isinstance(raw_index.get("ids"), list)
+            or not isinstance(raw_index.get("generations"), dict)
+        ):
+            return None
+
+        present = {path.name for path in self.directory.glob(f"*{ARTICLE_FILE_SUFFIX}")}
+        if present != {f"{category}{ARTICLE_FILE_SUFFIX}" for category in files}:
+            return None
+        # Groesse allein reicht nicht: umsortierte Zeilen behalten sie, der Digest waere dann veraltet. Der Index
+        # haengt nur vom Inhalt ab (bleibt nach einem frischen Checkout gueltig); gehasht wird aber nur, wenn der
+        # lokale Stat-Zwischenspeicher die Datei mit diesem Digest noch nicht kennt.
+        digests = raw_index["digests"]
+        stat_cache = self._read_stat_cache()
+        verified = False
+        for category, size in files.items():
+            path = self._category_path(category)
+            try:
+                stat = path.stat()
+                if stat.st_size != size:
+                    return None
+                signature = [stat.st_size, stat.st_mtime_ns, digests.get(category)]
+                if stat_cache.get(category) == signature:
+                    continue
+                if hashlib.sha1(path.read_bytes()).hexdigest() != digests.get(category):
+                    return None
+            except OSError:
+                return None
+            stat_cache[category] = signature
+            verified = True
+        if verified:
+            self._write_stat_cache(stat_cache)
+        return raw_index
+
+    def _previous_registry(self) -> tuple[list[str], dict[str, str]]:
+        # IDs und Generationen aus einem veralteten Index uebernehmen, damit vergebene IDs stabil bleiben.
+        try:
+            raw_index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+            return [], {}
+        if not isinstance(raw_index, dict):
+            return [], {}
+        ids = raw_index.get("ids")
+        generations = raw_index.get("generations")
+        if not isinstance(ids, list) or not all(isinstance(slug, str) for slug in ids):
+            return [], {}
+        if not isinstance(generations, dict):
+            generations = {}
+        return ids, {str(count): digest for count, digest in generations.items() if isinstance(digest, str)}
+
+    def rebuild_index(self) -> dict[str, object]:
+        id_slugs, generations = self._previous_registry()
+        known_ids = {slug: article_id for article_id, slug in enumerate(id_slugs)}
+        files: dict[str, int] = {}
+        digests: dict[str, str] = {}
+        stat_cache: dict[str, object] = {}
+        slugs: dict[str, list[object]] = {}
+        for path in sorted(self.directory.glob(f"*{ARTICLE_FILE_SUFFIX}")):
+            category = path.name[: -len(ARTICLE_FILE_SUFFIX)]
+            # Stat vor dem Lesen: aendert sich die Datei dazwischen, passt die Signatur beim naechsten Mal nicht.
+            stat = path.stat()
+            data = path.read_bytes()
+            files[category] = len(data)
+            digests[category] = hashlib.sha1(data).hexdigest()
+            if stat.st_size == len(data):
+                stat_cache[category] = [stat.st_size, stat.st_mtime_ns, digests[category]]
+            offset = 0
+            for line in data.splitlines(keepends=True):
+                if line.strip():
+                    slug = json.loads(line).get("slug")
+                    if isinstance(slug, str) and slug not in slugs:
+                        article_id = known_ids.get(slug)
+                        if article_id is None:
+                            article_id = known_ids[slug] = len(id_slugs)
+                            id_slugs.append(slug)
+                        slugs[slug] = [category, offset, article_id]
+                offset += len(line)
+        generations[str(len(id_slugs))] = _registry_digest(id_slugs)
+
+        index: dict[str, object] = {
+            "version": ARTICLE_INDEX_VERSION,
+            "files": files,
+            "digests": digests,
+            "slugs": slugs,
+            "ids": id_slugs,
+            "generations": generations,
+        }
+        try:
+            self.index_path.write_text(json.dumps(index, ensure_ascii=True, separators=(",", ":")) + "\n", encoding="utf-8")
+        except OSError:
+            pass
+        self._write_stat_cache(stat_cache)
+        self._index = index
+        self._category_ids.clear()
+        return index
+
+    def _ensure_index(self) -> dict[str, object]:
+        if self._index is None:
+            self._index = self._read_index() or self.rebuild_index()
+        return self._index
+
+    def categories(self) -> list[str]:
+        files = self._ensure_index()["files"]
+        ordered = [category for category in CATEGORY_ORDER if category in files]
+        ordered.extend(sorted(category for category in files if category not in ordered))
+        return ordered
+
+    def slugs(self) -> list[str]:
+        return list(self._ensure_index()["slugs"])
+
+    def load_category(self, category: str) -> ArticlePool:
+        pool = self._pools.get(category)
+        if pool is not None:
+            return pool
+
+        path = self._category_path(category)
+        if not path.exists():
+            raise KeyError(category)
+
+        articles: list[Article] = []
+        with path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if not isinstance(record.get("slug"), str):
+                    continue
+                # Bereits einzeln geladene Artikel behalten ihre Identitaet.
+                article = Article.from_record(record, category)
+                articles.append(self._lookup.setdefault(article.slug, article))
+        pool = self._pools[category] = ArticlePool(category, articles)
+        return pool
+
+    def get(self, slug: str) -> Article | None:
+        article = self._lookup.get(slug)
+        if article is not None:
+            return article
+
+        location = self._ensure_index()["slugs"].get(slug)
+        if not isinstance(location, list) or len(location) < 2:
+            return None
+        category, offset = location[0], location[1]
+        if category in self._pools:
+            return None
+
+        try:
+            with self._category_path(category).open("rb") as handle:
+                handle.seek(offset)
+                record = json.loads(handle.readline().decode("utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            record = None
+        if not isinstance(record, dict) or record.get("slug") != slug:
+            # Index passt nicht mehr zur Datei: neu aufbauen und Kategorie vollstaendig laden.
+            self.rebuild_index()
+            self.load_category(category)
+            return self._lookup.get(slug)
+
+        article = self._lookup[slug] = Article.from_record(record, category)
+        return article
+
+    def category_of(self, slug: str) -> str | None:
+        location = self._ensure_index()["slugs"].get(slug)
+        if isinstance(location, list) and location:
+            return location[0]
+        return None
+
+    def fingerprint(self, category: str) -> str:
+        return self._ensure_index()["digests"].get(category, "")
+
+    def slug_id(self, slug: str) -> int | None:
+        location = self._ensure_index()["slugs"].get(slug)
+        if isinstance(location, list) and len(location) > 2:
+            return location[2]
+        return None
+
+    def id_slug(self, article_id: int) -> str | None:
+        id_slugs = self._ensure_index()["ids"]
+        return id_slugs[article_id] if 0 <= article_id < len(id_slugs) else None
+
+    def category_ids(self, category: str) -> list[int]:
+        ids = self._category_ids.get(category)
+        if ids is None:
+            ids = self._category_ids[category] = super().category_ids(category)
+        return ids
+
+    def registry(self) -> tuple[int, str]:
+        index = self._ensure_index()
+        count = len(index["ids"])
+        return count, index["generations"].get(str(count), "")
+
+    def registry_digest(self, count: int) -> str | None:
+        return self._ensure_index()["generations"].get(str(count))
+
+
+class _ArticlesView(Mapping):
+    # Kompatibilitaetssicht: ARTICLES[kategorie] laedt nur die angefragte Kategorie.
+    def __getitem__(self, category: str) -> ArticlePool:
+        return ARTICLE_STORE.load_category(category)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ARTICLE_STORE.categories())
+
+    def __len__(self) -> int:
+        return len(ARTICLE_STORE.categories())
+
+
+class _ArticleLookupView(Mapping):
+    def __getitem__(self, slug: str) -> Article:
+        article = ARTICLE_STORE.get(slug)
+        if article is None:
+            raise KeyError(slug)
+        return article
+
+    def __contains__(self, slug: object) -> bool:
+        return isinstance(slug, str) and ARTICLE_STORE.get(slug) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ARTICLE_STORE.slugs())
+
+    def __len__(self) -> int:
+        return len(ARTICLE_STORE.slugs())
+
+
+ARTICLE_STORE: ArticleStore = JsonLinesArticleStore(ARTICLES_PATH)
+ARTICLES: Mapping[str, ArticlePool] = _ArticlesView()
+ARTICLE_LOOKUP: Mapping[str, Article] = _ArticleLookupView()
 
 
 def german_long_date(dt: datetime) -> str:
@@ -833,9 +633,120 @@ def german_long_date(dt: datetime) -> str:
 def german_short_date(dt: datetime) -> str:
     return f"{dt.day}.{dt.month:02d}.{str(dt.year)[-2:]}"
 
-def load_history(path: Path = HISTORY_LOG_PATH) -> dict[str, object]:
-    # ...existing code...
-    default: dict[str, object] = {"history": [], HISTORY_USED_SLUGS_KEY: []}
+class UsedSlugSet:
+    # Bit i gesetzt = Artikel mit stabiler ID i verwendet. Slugs ohne ID (nicht mehr im Korpus) stehen in extras.
+    __slots__ = ("bits", "extras", "_extra_set", "_size")
+
+    def __init__(self, bits: bytearray | None = None, extras: list[str] | None = None) -> None:
+        self.bits = bits if bits is not None else bytearray()
+        self.extras: list[str] = []
+        self._extra_set: set[str] = set()
+        self._size = bin(int.from_bytes(self.bits, "little")).count("1")
+        for slug in extras or []:
+            self.add(slug)
+
+    @classmethod
+    def from_slugs(cls, slugs: list[object]) -> UsedSlugSet:
+        used = cls()
+        for slug in slugs:
+            if isinstance(slug, str):
+                used.add(slug)
+        return used
+
+    @classmethod
+    def from_document(cls, document: dict[str, object], extras: list[str]) -> UsedSlugSet:
+        registry = document.get("registry")
+        bits = document.get("bits")
+        if not isinstance(registry, dict) or not isinstance(bits, str):
+            raise ValueError("Ungueltiges Bitset-Dokument.")
+        count = registry.get("count")
+        digest = registry.get("digest")
+        if not isinstance(count, int) or ARTICLE_STORE.registry_digest(count) != digest:
+            raise RuntimeError(
+                "Das gespeicherte Bitset der verwendeten Artikel passt nicht zu den Artikel-IDs in "
+                f"{ARTICLES_PATH / ARTICLE_INDEX_NAME}. Bitte den Artikelindex aus der Versionsverwaltung "
+                "wiederherstellen, bevor eine neue Aktualisierung erfolgt."
+            )
+        return cls(bytearray(base64.b64decode(bits)), extras)
+
+    def to_document(self) -> dict[str, object]:
+        count, digest = ARTICLE_STORE.registry()
+        bits = self.bits[: (count + 7) // 8]
+        return {"registry": {"count": count, "digest": digest}, "bits": base64.b64encode(bits).decode("ascii")}
+
+    def _has_bit(self, article_id: int) -> bool:
+        byte_index = article_id >> 3
+        return byte_index < len(self.bits) and bool(self.bits[byte_index] >> (article_id & 7) & 1)
+
+    def __contains__(self, slug: object) -> bool:
+        if not isinstance(slug, str):
+            return False
+        article_id = ARTICLE_STORE.slug_id(slug)
+        if article_id is None:
+            return slug in self._extra_set
+        return self._has_bit(article_id)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        for byte_index, byte in enumerate(self.bits):
+            for bit in range(8):
+                if byte >> bit & 1:
+                    slug = ARTICLE_STORE.id_slug(byte_index * 8 + bit)
+                    if slug is not None:
+                        yield slug
+        yield from self.extras
+
+    def add(self, slug: str) -> bool:
+        article_id = ARTICLE_STORE.slug_id(slug)
+        if article_id is None:
+            if slug in self._extra_set:
+                return False
+            self.extras.append(slug)
+            self._extra_set.add(slug)
+            self._size += 1
+            return True
+        if self._has_bit(article_id):
+            return False
+        byte_index = article_id >> 3
+        if byte_index >= len(self.bits):
+            self.bits.extend(bytes(byte_index + 1 - len(self.bits)))
+        self.bits[byte_index] |= 1 << (article_id & 7)
+        self._size += 1
+        return True
+
+    def union(self, other: UsedSlugSet) -> UsedSlugSet:
+        width = max(len(self.bits), len(other.bits))
+        merged = int.from_bytes(self.bits, "little") | int.from_bytes(other.bits, "little")
+        return UsedSlugSet(bytearray(merged.to_bytes(width, "little")), self.extras + other.extras)
+
+    def first_unset(self, ids: list[int | None], start: int = 0) -> int:
+        # Erste Position ab start, deren Artikel-ID nicht gesetzt ist; len(ids), wenn alle verwendet sind.
+        bits = self.bits
+        limit = len(bits)
+        for position in range(start, len(ids)):
+            article_id = ids[position]
+            if article_id is None:
+                return position
+            byte_index = article_id >> 3
+            if byte_index >= limit or not bits[byte_index] >> (article_id & 7) & 1:
+                return position
+        return max(start, len(ids))
+
+
+def _history_journal_path(path: Path) -> Path:
+    return path.with_name(path.stem + HISTORY_JOURNAL_SUFFIX)
+
+
+def _read_history_snapshot(path: Path) -> dict[str, object]:
+    default: dict[str, object] = {
+        "history": [],
+        HISTORY_USED_SLUGS_KEY: UsedSlugSet(),
+        HISTORY_SEQUENCE_KEY: 0,
+        HISTORY_CURSORS_KEY: {},
+        HISTORY_LAST_USED_KEY: {},
+    }
     if not path.exists():
         return default
 
@@ -843,19 +754,8 @@ def load_history(path: Path = HISTORY_LOG_PATH) -> dict[str, object]:
         raw_data = json.loads(path.read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError, UnicodeDecodeError):
         return default
-        {
-            "slug": "gesellschaft-2018",
-            "title": "Gesellschaft: Fridays for Future 2018",
-            "paragraphs": [
-                "<strong>Ereignis:</strong> Ab 2018 demonstrierten weltweit Millionen junge Menschen für Klimaschutz und eine nachhaltige Zukunft.",
-                "<strong>Folgen:</strong> Die Bewegung beeinflusste politische Debatten, Klimagesetze und das gesellschaftliche Bewusstsein für Umweltfragen.",
-                "<strong>Was wir gelernt haben:</strong> Zivilgesellschaftlicher Druck kann politische Prozesse beschleunigen und Innovationen anstoßen.",
-                "<strong>Vertiefung:</strong> Fridays for Future ist ein Beispiel für die Wirksamkeit globaler Graswurzelbewegungen.",
-            ],
-            "source_label": "Fridays for Future",
-            "source_title": "Über die Bewegung",
-            "source_url": "https://fridaysforfuture.de/ueber-uns/",
-        },
+    if not isinstance(raw_data, dict):
+        return default
 
     entries_raw = raw_data.get("history")
     cleaned_entries: list[dict[str, object]] = []
@@ -867,82 +767,434 @@ def load_history(path: Path = HISTORY_LOG_PATH) -> dict[str, object]:
             slugs_value = entry.get("slugs")
             if isinstance(date_value, str) and isinstance(slugs_value, list):
                 valid_slugs = [slug for slug in slugs_value if isinstance(slug, str)]
-                cleaned_entries.append({"date": date_value, "slugs": valid_slugs})
+                cleaned_entry: dict[str, object] = {"date": date_value, "slugs": valid_slugs}
+                repeats = _entry_repeats(entry)
+                if repeats:
+                    cleaned_entry[HISTORY_REPEATS_KEY] = repeats
+                cleaned_entries.append(cleaned_entry)
 
     used_slugs_raw = raw_data.get(HISTORY_USED_SLUGS_KEY)
-    used_slugs: list[str] = []
-    if isinstance(used_slugs_raw, list):
-        for slug in used_slugs_raw:
-            if isinstance(slug, str) and slug not in used_slugs:
-                used_slugs.append(slug)
+    listed_slugs = [slug for slug in used_slugs_raw if isinstance(slug, str)] if isinstance(used_slugs_raw, list) else []
+    bitset_raw = raw_data.get(HISTORY_USED_BITSET_KEY)
+    if isinstance(bitset_raw, dict):
+        # Kompaktes Format: Bitset ueber die Artikel-IDs, used_slugs enthaelt nur Slugs ohne ID.
+        used_slugs = UsedSlugSet.from_document(bitset_raw, listed_slugs)
+    else:
+        used_slugs = UsedSlugSet.from_slugs(listed_slugs)
+
+    sequence = raw_data.get(HISTORY_SEQUENCE_KEY)
+    if not isinstance(sequence, int) or sequence < 0:
+        sequence = 0
+
+    cursors_raw = raw_data.get(HISTORY_CURSORS_KEY)
+    cursors: dict[str, dict[str, object]] = {}
+    if isinstance(cursors_raw, dict):
+        for category, cursor in cursors_raw.items():
+            if (
+                isinstance(cursor, dict)
+                and isinstance(cursor.get("position"), int)
+                and isinstance(cursor.get("fingerprint"), str)
+            ):
+                cursors[category] = {"position": cursor["position"], "fingerprint": cursor["fingerprint"]}
+
+    last_used_raw = raw_data.get(HISTORY_LAST_USED_KEY)
+    last_used: dict[str, str] = {}
+    if isinstance(last_used_raw, dict):
+        last_used = {
+            slug: date_value for slug, date_value in last_used_raw.items() if isinstance(date_value, str)
+        }
+
+    return {
+        "history": cleaned_entries,
+        HISTORY_USED_SLUGS_KEY: used_slugs,
+        HISTORY_SEQUENCE_KEY: sequence,
+        HISTORY_CURSORS_KEY: cursors,
+        HISTORY_LAST_USED_KEY: last_used,
+    }
+
+
+def _entry_repeats(entry: dict[str, object]) -> list[str]:
+    repeats = entry.get(HISTORY_REPEATS_KEY)
+    return [slug for slug in repeats if isinstance(slug, str)] if isinstance(repeats, list) else []
+
+
+def _read_history_journal(path: Path, after_sequence: int) -> list[dict[str, object]]:
+    records: list[dict[str, object]] = []
+    try:
+        handle = path.open("r", encoding="utf-8")
+    except OSError:
+        return records
+
+    with handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Abgebrochener Schreibvorgang: unvollstaendige Zeilen ignorieren.
+                continue
+            if not isinstance(record, dict):
+                continue
+            sequence = record.get("seq")
+            date_value = record.get("date")
+            slugs_value = record.get("slugs")
+            if not isinstance(sequence, int) or sequence <= after_sequence:
+                continue
+            if isinstance(date_value, str) and isinstance(slugs_value, list):
+                valid_slugs = [slug for slug in slugs_value if isinstance(slug, str)]
+                records.append(
+                    {"seq": sequence, "date": date_value, "slugs": valid_slugs, HISTORY_REPEATS_KEY: _entry_repeats(record)}
+                )
+    return records
 
-   
 
-    result: dict[str, object] = {"history": cleaned_entries, HISTORY_USED_SLUGS_KEY: used_slugs}
+def load_history(path: Path = HISTORY_LOG_PATH) -> dict[str, object]:
+    # history_log.json ist der kompaktierte Stand, das Journal daneben enthaelt die Tage danach.
+    result = _read_history_snapshot(path)
     _ensure_entry_slugs_tracked(result)
+
+    records = _read_history_journal(_history_journal_path(path), result[HISTORY_SEQUENCE_KEY])
+    METRICS.count("history_entries_parsed", len(result["history"]) + len(records))
+    METRICS.count("journal_records_replayed", len(records))
+    for record in records:
+        _append_history_entry(result, record["date"], record["slugs"], record[HISTORY_REPEATS_KEY])
+        result[HISTORY_SEQUENCE_KEY] = record["seq"]
+
+    result[HISTORY_PENDING_KEY] = []
+    result[HISTORY_JOURNAL_RECORDS_KEY] = len(records)
     return result
 
 
-def save_history(history: dict[str, object], path: Path = HISTORY_LOG_PATH) -> None:
+def _temp_path_for(path: Path) -> Path:
+    return path.with_name(f".{path.name}.tmp")
+
+
+def _write_bytes_atomic(path: Path, payload: bytes) -> None:
+    # Erst vollstaendig in eine Nachbardatei schreiben, dann umbenennen: Leser sehen nie eine halbe Datei.
+    temp_path = _temp_path_for(path)
+    with temp_path.open("wb") as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    _write_bytes_atomic(path, text.encode("utf-8"))
+
+
+def _file_digest(path: Path, expected_size: int) -> bytes | None:
+    try:
+        if path.stat().st_size != expected_size:
+            return None
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 16), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.digest()
+
+
+def _file_matches(path: Path, payload: bytes) -> bool:
+    existing = _file_digest(path, len(payload))
+    return existing is not None and existing == hashlib.sha256(payload).digest()
+
+
+def _write_sidecars(targets: list[Path], payload: bytes) -> None:
+    for target in targets:
+        if target.suffix == OUTPUT_GZIP_SUFFIX:
+            # mtime=0 haelt die Datei bei gleichem Inhalt bytegleich.
+            compressed = gzip.compress(payload, compresslevel=9, mtime=0)
+        else:
+            compressed = zlib.compress(payload, 9)
+        _write_bytes_atomic(target, compressed)
+
+
+class OutputCompressor:
+    # Vorkomprimierte Geschwisterdateien fuer gzip_static; zlib gibt den GIL beim Komprimieren frei,
+    # daher laufen die Auftraege in Threads neben dem restlichen Lauf.
+    def __init__(self, deflate: bool = False, workers: int = OUTPUT_COMPRESS_WORKERS) -> None:
+        self.suffixes = (OUTPUT_GZIP_SUFFIX, OUTPUT_DEFLATE_SUFFIX) if deflate else (OUTPUT_GZIP_SUFFIX,)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._futures: list[Future[None]] = []
+
+    def _stale_sidecars(self, path: Path, changed: bool) -> list[Path]:
+        sidecars = [path.with_name(path.name + suffix) for suffix in self.suffixes]
+        if changed:
+            return sidecars
+        try:
+            modified = path.stat().st_mtime_ns
+        except OSError:
+            return []
+        stale = []
+        for sidecar in sidecars:
+            try:
+                if sidecar.stat().st_mtime_ns >= modified:
+                    continue
+            except OSError:
+                pass
+            stale.append(sidecar)
+        return stale
+
+    def schedule(self, path: Path, payload: bytes, changed: bool) -> None:
+        if path.suffix not in OUTPUT_COMPRESS_SUFFIXES:
+            return
+        targets = self._stale_sidecars(path, changed)
+        if targets:
+            METRICS.count("sidecars_written", len(targets))
+            self._futures.append(self._executor.submit(_write_sidecars, targets, payload))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        for future in self._futures:
+            error = future.exception()
+            if error is not None:
+                print(f"Komprimierte Ausgabe konnte nicht geschrieben werden: {error}", file=sys.stderr)
+        self._futures = []
+
+
+OUTPUT_COMPRESSOR: OutputCompressor | None = None
+
+
+@contextmanager
+def output_compression(deflate: bool = False) -> Iterator[OutputCompressor]:
+    global OUTPUT_COMPRESSOR
+    previous = OUTPUT_COMPRESSOR
+    compressor = OUTPUT_COMPRESSOR = OutputCompressor(deflate)
+    try:
+        yield compressor
+    finally:
+        OUTPUT_COMPRESSOR = previous
+        with METRICS.span("compress_wait"):
+            compressor.close()
+
+
+def write_output(path: Path, payload: bytes, *, link_from: Path | None = None) -> bool:
+    changed = _write_output(path, payload, link_from)
+    if OUTPUT_COMPRESSOR is not None:
+        OUTPUT_COMPRESSOR.schedule(path, payload, changed)
+    return changed
+
+
+def remove_output(path: Path) -> None:
+    # Mit der Datei auch ihre .gz/.zz-Geschwister entfernen, sonst liefert gzip_static sie weiter aus.
+    path.unlink(missing_ok=True)
+    for suffix in (OUTPUT_GZIP_SUFFIX, OUTPUT_DEFLATE_SUFFIX):
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def _write_output(path: Path, payload: bytes, link_from: Path | None) -> bool:
+    if _file_matches(path, payload):
+        METRICS.count("files_unchanged")
+        return False
+    METRICS.count("files_written")
+    METRICS.count("bytes_written", len(payload))
+
+    if link_from is not None and _file_matches(link_from, payload):
+        temp_path = _temp_path_for(path)
+        temp_path.unlink(missing_ok=True)
+        try:
+            os.link(link_from, temp_path)
+        except OSError:
+            # Dateisystem ohne Hardlinks: den bereits gerenderten Puffer kopieren statt neu zu kodieren.
+            _write_bytes_atomic(path, payload)
+        else:
+            os.replace(temp_path, path)
+        return True
+
+    _write_bytes_atomic(path, payload)
+    return True
+
+
+def compact_history(history: dict[str, object], path: Path = HISTORY_LOG_PATH) -> None:
+    index = _history_index(history)
+    used_slugs = index.used
     document = {
         "history": history.get("history", []),
-        HISTORY_USED_SLUGS_KEY: history.get(HISTORY_USED_SLUGS_KEY, []),
+        HISTORY_USED_BITSET_KEY: used_slugs.to_document(),
+        HISTORY_USED_SLUGS_KEY: used_slugs.extras,
+        HISTORY_SEQUENCE_KEY: history.get(HISTORY_SEQUENCE_KEY, 0),
+        HISTORY_CURSORS_KEY: history.get(HISTORY_CURSORS_KEY, {}),
+        # Nur Artikel, die es noch gibt; ausgemusterte Slugs rotieren nicht mehr.
+        HISTORY_LAST_USED_KEY: {
+            slug: date_value
+            for slug, date_value in sorted(index.last_used.items())
+            if ARTICLE_STORE.slug_id(slug) is not None
+        },
     }
-    path.write_text(json.dumps(document, ensure_ascii=True, indent=2) + "\n", encoding="utf-8")
+    _write_text_atomic(path, json.dumps(document, ensure_ascii=True, indent=2) + "\n")
+    # Erst nach dem Schreiben des Snapshots leeren; Eintraege bis "sequence" werden beim Laden ohnehin uebersprungen.
+    _history_journal_path(path).unlink(missing_ok=True)
+    history[HISTORY_PENDING_KEY] = []
+    history[HISTORY_JOURNAL_RECORDS_KEY] = 0
 
 
-def _all_used_slugs(
-    history: dict[str, object],
-) -> set[str]:
-    used: set[str] = set()
-    entries = history.get("history", [])
-    if not isinstance(entries, list):
-        return used
+def save_history(history: dict[str, object], path: Path = HISTORY_LOG_PATH) -> None:
+    pending = history.get(HISTORY_PENDING_KEY)
+    journal_records = history.get(HISTORY_JOURNAL_RECORDS_KEY, 0)
+    if not isinstance(pending, list) or not isinstance(journal_records, int) or not path.exists():
+        compact_history(history, path)
+        return
+    if not pending:
+        return
+    if journal_records + len(pending) >= HISTORY_COMPACT_INTERVAL:
+        compact_history(history, path)
+        return
+
+    lines = "".join(json.dumps(record, ensure_ascii=True, separators=(",", ":")) + "\n" for record in pending)
+    with _history_journal_path(path).open("a+b") as handle:
+        if handle.seek(0, os.SEEK_END) > 0:
+            handle.seek(-1, os.SEEK_END)
+            if handle.read(1) != b"\n":
+                lines = "\n" + lines
+        handle.write(lines.encode("ascii"))
+    history[HISTORY_JOURNAL_RECORDS_KEY] = journal_records + len(pending)
+    history[HISTORY_PENDING_KEY] = []
+
+
+class _Rotation:
+    # Min-Heap (letztes Einsatzdatum, Pool-Position, Slug) je Kategorie. Veraltete Eintraege bleiben liegen
+    # und werden beim Entnehmen verworfen, sobald ihr Datum nicht mehr zu last_used passt.
+    __slots__ = ("fingerprint", "positions", "heap")
+
+    def __init__(self, category: str, last_used: dict[str, str]) -> None:
+        self.fingerprint = ARTICLE_STORE.fingerprint(category)
+        self.positions = ARTICLE_STORE.load_category(category).positions
+        self.rebuild(last_used)
+
+    def rebuild(self, last_used: dict[str, str]) -> None:
+        self.heap = [(last_used.get(slug, ""), position, slug) for slug, position in self.positions.items()]
+        heapq.heapify(self.heap)
+
+    def push(self, slug: str, date_value: str, last_used: dict[str, str]) -> None:
+        position = self.positions.get(slug)
+        if position is None:
+            return
+        heapq.heappush(self.heap, (date_value, position, slug))
+        if len(self.heap) > 2 * len(self.positions) + 16:
+            self.rebuild(last_used)
+
+
+class HistoryIndex:
+    # Einmal beim Laden aufgebaut und bei jedem Anhaengen fortgeschrieben: Slug -> Daten der Eintraege,
+    # doppelt vergebene Slugs, die Menge aller je verwendeten Slugs und das letzte Einsatzdatum je Slug.
+    def __init__(self, used: UsedSlugSet | None = None, last_used: dict[str, str] | None = None) -> None:
+        self.slug_dates: dict[str, list[str]] = {}
+        # Wiederholungen aus der Rotation (Pool erschoepft) je Slug; sie zaehlen nicht als Dopplung.
+        self.repeats: dict[str, int] = {}
+        self.duplicates: set[str] = set()
+        self.used = used if used is not None else UsedSlugSet()
+        self.last_used = last_used if last_used is not None else {}
+        self._rotations: dict[str, _Rotation] = {}
+
+    @classmethod
+    def build(cls, history: dict[str, object]) -> HistoryIndex:
+        used_archive = history.get(HISTORY_USED_SLUGS_KEY)
+        if not isinstance(used_archive, UsedSlugSet):
+            used_archive = UsedSlugSet.from_slugs(used_archive if isinstance(used_archive, list) else [])
+            history[HISTORY_USED_SLUGS_KEY] = used_archive
+        last_used = history.get(HISTORY_LAST_USED_KEY)
+        if not isinstance(last_used, dict):
+            last_used = history[HISTORY_LAST_USED_KEY] = {}
+        index = cls(used_archive, last_used)
+
+        entries = history.get("history", [])
+        if isinstance(entries, list):
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                date_value = entry.get("date")
+                slugs = entry.get("slugs")
+                if not isinstance(date_value, str) or not isinstance(slugs, list):
+                    continue
+                index.add_entry(date_value, slugs, _entry_repeats(entry))
+                # Slugs aus Eintraegen, die im Archiv fehlen, dort nachtragen.
+                index.mark_used(slugs)
+        return index
+
+    def add_entry(self, date_value: str, slugs: list[str], repeats: list[str] | tuple[str, ...] = ()) -> None:
+        for slug in repeats:
+            self.repeats[slug] = self.repeats.get(slug, 0) + 1
+        for slug in slugs:
+            if not isinstance(slug, str):
+                continue
+            dates = self.slug_dates.setdefault(slug, [])
+            dates.append(date_value)
+            if len(dates) - self.repeats.get(slug, 0) > 1:
+                self.duplicates.add(slug)
+            if date_value > self.last_used.get(slug, ""):
+                # Beim Kuerzen oder Ersetzen von Eintraegen bleibt das Datum stehen; es zaehlt der letzte Einsatz.
+                self.last_used[slug] = date_value
+                category = ARTICLE_STORE.category_of(slug) if self._rotations else None
+                rotation = self._rotations.get(category) if category is not None else None
+                if rotation is not None:
+                    rotation.push(slug, date_value, self.last_used)
+
+    def remove_entry(self, date_value: str, slugs: list[str], repeats: list[str] | tuple[str, ...] = ()) -> None:
+        for slug in repeats:
+            count = self.repeats.get(slug, 0) - 1
+            if count > 0:
+                self.repeats[slug] = count
+            else:
+                self.repeats.pop(slug, None)
+        for slug in slugs:
+            dates = self.slug_dates.get(slug) if isinstance(slug, str) else None
+            if not dates or date_value not in dates:
+                continue
+            dates.remove(date_value)
+            if not dates:
+                del self.slug_dates[slug]
+            if len(dates) - self.repeats.get(slug, 0) < 2:
+                self.duplicates.discard(slug)
+
+    def mark_used(self, slugs: list[str]) -> None:
+        for slug in slugs:
+            if isinstance(slug, str):
+                self.used.add(slug)
+
+    def duplicate_report(self) -> dict[str, list[str]]:
+        return {slug: sorted(set(self.slug_dates[slug])) for slug in self.duplicates}
+
+    def least_recently_used(self, category: str, excluded: set[str]) -> str | None:
+        # O(log n) je Auswahl; nie verwendete Artikel ("") kommen zuerst, Gleichstand nach Pool-Reihenfolge.
+        rotation = self._rotations.get(category)
+        if rotation is None or rotation.fingerprint != ARTICLE_STORE.fingerprint(category):
+            rotation = self._rotations[category] = _Rotation(category, self.last_used)
+        heap = rotation.heap
+        held: list[tuple[str, int, str]] = []
+        chosen: str | None = None
+        while heap:
+            date_value, _, slug = heap[0]
+            if self.last_used.get(slug, "") != date_value:
+                heapq.heappop(heap)
+            elif slug in excluded:
+                held.append(heapq.heappop(heap))
+            else:
+                chosen = slug
+                break
+        for entry in held:
+            heapq.heappush(heap, entry)
+        return chosen
 
-    for entry in entries:
-        if not isinstance(entry, dict):
-            continue
-        slugs = entry.get("slugs")
-        if isinstance(slugs, list):
-            for slug in slugs:
-                if isinstance(slug, str):
-                    used.add(slug)
 
-    archive = history.get(HISTORY_USED_SLUGS_KEY)
-    if isinstance(archive, list):
-        for slug in archive:
-            if isinstance(slug, str):
-                used.add(slug)
-    return used
+def _history_index(history: dict[str, object]) -> HistoryIndex:
+    index = history.get(HISTORY_INDEX_KEY)
+    if not isinstance(index, HistoryIndex):
+        index = history[HISTORY_INDEX_KEY] = HistoryIndex.build(history)
+    return index
 
 
-def _article_by_slug(slug: str) -> dict[str, object] | None:
-    return ARTICLE_LOOKUP.get(slug)
+def _all_used_slugs(history: dict[str, object]) -> UsedSlugSet:
+    # Lebende Menge aus dem Index, nicht veraendern.
+    return _history_index(history).used
+
+
+def _article_by_slug(slug: str) -> Article | None:
+    return ARTICLE_STORE.get(slug)
 
 
 def _find_duplicate_history_slugs(history: dict[str, object]) -> dict[str, list[str]]:
-    duplicates: dict[str, set[str]] = {}
-    seen: dict[str, str] = {}
-    entries = history.get("history", [])
-    if isinstance(entries, list):
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
-            date_value = entry.get("date")
-            slugs = entry.get("slugs")
-            if not isinstance(date_value, str) or not isinstance(slugs, list):
-                continue
-            for slug in slugs:
-                if not isinstance(slug, str):
-                    continue
-                previous_date = seen.get(slug)
-                if previous_date is None:
-                    seen[slug] = date_value
-                else:
-                    bucket = duplicates.setdefault(slug, set())
-                    bucket.add(previous_date)
-                    bucket.add(date_value)
-    return {slug: sorted(dates) for slug, dates in duplicates.items()}
+    return _history_index(history).duplicate_report()
 
 
 def _ensure_history_unique(history: dict[str, object]) -> None:
@@ -965,66 +1217,280 @@ def _env_flag(name: str) -> bool:
     return normalized not in {"", "0", "false", "no"}
 
 
-def _append_history_entry(history: dict[str, object], date_value: str, slugs: list[str]) -> None:
+def _is_allowed_repeat(history: dict[str, object], date_value: str, slug: str) -> bool:
+    # Eine Wiederholung im Fenster ist nur erlaubt, wenn der Kalender den Artikel an diesem Tag festlegt oder
+    # die Kategorie keinen unbenutzten, nicht gesperrten Artikel mehr hatte; dann hat die Rotation sie gewaehlt.
+    calendar = load_calendar()
+    day = date.fromisoformat(date_value)
+    if any(pin == slug for pin, _ in calendar.pinned(day)):
+        return True
+    category = ARTICLE_STORE.category_of(slug)
+    if category is None:
+        return False
+    pool = ARTICLE_STORE.load_category(category)
+    used_slugs = _all_used_slugs(history)
+    position = _category_cursor(history, category, pool, used_slugs)
+    if position >= len(pool):
+        return True
+    excluded = set(calendar.blocked(day))
+    excluded.update(calendar.reserved(day))
+    return all(candidate in used_slugs or candidate in excluded for candidate in pool.slugs[position:])
+
+
+def _append_history_entry(
+    history: dict[str, object],
+    date_value: str,
+    slugs: list[str],
+    repeats: list[str] | None = None,
+) -> None:
+    index = _history_index(history)
     entries = history.setdefault("history", [])
     if not isinstance(entries, list):
         entries = history["history"] = []
 
-    if entries and isinstance(entries[-1], dict) and entries[-1].get("date") == date_value:
-        entries[-1] = {"date": date_value, "slugs": slugs}
+    replaced = bool(entries) and isinstance(entries[-1], dict) and entries[-1].get("date") == date_value
+    if replaced:
+        index.remove_entry(date_value, entries[-1].get("slugs") or [], _entry_repeats(entries[-1]))
+    if repeats is None:
+        repeats = [
+            slug
+            for slug in slugs
+            if isinstance(slug, str) and slug in index.slug_dates and _is_allowed_repeat(history, date_value, slug)
+        ]
+    new_entry: dict[str, object] = {"date": date_value, "slugs": slugs}
+    if repeats:
+        new_entry[HISTORY_REPEATS_KEY] = repeats
+    if replaced:
+        entries[-1] = new_entry
     else:
-        entries.append({"date": date_value, "slugs": slugs})
+        entries.append(new_entry)
+    index.add_entry(date_value, slugs, repeats)
 
     overflow = len(entries) - HISTORY_MAX_ENTRIES
     if overflow > 0:
+        for entry in entries[:overflow]:
+            if isinstance(entry, dict) and isinstance(entry.get("date"), str):
+                index.remove_entry(entry["date"], entry.get("slugs") or [], _entry_repeats(entry))
         del entries[:overflow]
 
     _mark_slugs_as_used(history, slugs)
+    _advance_category_cursors(history, slugs)
+
+    pending = history.get(HISTORY_PENDING_KEY)
+    if isinstance(pending, list):
+        sequence = history.get(HISTORY_SEQUENCE_KEY, 0)
+        sequence = (sequence if isinstance(sequence, int) else 0) + 1
+        history[HISTORY_SEQUENCE_KEY] = sequence
+        record: dict[str, object] = {"seq": sequence, "date": date_value, "slugs": list(slugs)}
+        if repeats:
+            record[HISTORY_REPEATS_KEY] = list(repeats)
+        pending.append(record)
 
 
 def _ensure_entry_slugs_tracked(history: dict[str, object]) -> None:
-    entries = history.get("history", [])
-    used_archive = history.setdefault(HISTORY_USED_SLUGS_KEY, [])
-    if not isinstance(used_archive, list):
-        used_archive = history[HISTORY_USED_SLUGS_KEY] = []
+    # Der Index traegt beim Aufbau fehlende Slugs nach und haelt das Archiv danach bei jedem Anhaengen aktuell.
+    _history_index(history)
 
-    seen: set[str] = set()
-    for slug in used_archive:
-        if isinstance(slug, str):
-            seen.add(slug)
 
-    changed = False
-    if isinstance(entries, list):
-        for entry in entries:
-            if not isinstance(entry, dict):
-                continue
-            slugs = entry.get("slugs")
-            if not isinstance(slugs, list):
-                continue
-            for slug in slugs:
-                if isinstance(slug, str) and slug not in seen:
-                    used_archive.append(slug)
-                    seen.add(slug)
-                    changed = True
+def _mark_slugs_as_used(history: dict[str, object], slugs: list[str]) -> None:
+    _history_index(history).mark_used(slugs)
 
-    if changed:
-        history[HISTORY_USED_SLUGS_KEY] = used_archive
 
+def _category_cursor(
+    history: dict[str, object],
+    category: str,
+    pool: ArticlePool,
+    used_slugs: UsedSlugSet,
+) -> int:
+    # Alle Artikel vor "position" sind verwendet; der Zeiger wandert nur vorwaerts, solange sich der Pool nicht aendert.
+    cursors = history.setdefault(HISTORY_CURSORS_KEY, {})
+    if not isinstance(cursors, dict):
+        cursors = history[HISTORY_CURSORS_KEY] = {}
+
+    fingerprint = ARTICLE_STORE.fingerprint(category)
+    cursor = cursors.get(category)
+    position = 0
+    if isinstance(cursor, dict) and cursor.get("fingerprint") == fingerprint:
+        stored_position = cursor.get("position")
+        if isinstance(stored_position, int):
+            position = min(max(stored_position, 0), len(pool))
+
+    start_position = position
+    position = used_slugs.first_unset(ARTICLE_STORE.category_ids(category), position)
+    METRICS.count("articles_scanned", position - start_position + 1)
+    cursors[category] = {"position": position, "fingerprint": fingerprint}
+    return position
+
+
+def _advance_category_cursors(history: dict[str, object], slugs: list[str]) -> None:
+    cursors = history.get(HISTORY_CURSORS_KEY)
+    if not isinstance(cursors, dict) or not cursors:
+        return
+
+    used_slugs: UsedSlugSet | None = None
+    for slug in slugs:
+        if not isinstance(slug, str):
+            continue
+        category = ARTICLE_STORE.category_of(slug)
+        cursor = cursors.get(category) if category is not None else None
+        if not isinstance(cursor, dict):
+            continue
+        pool = ARTICLE_STORE.load_category(category)
+        position = cursor.get("position")
+        if not isinstance(position, int) or not 0 <= position < len(pool) or pool.slugs[position] != slug:
+            continue
+        if used_slugs is None:
+            used_slugs = _all_used_slugs(history)
+        _category_cursor(history, category, pool, used_slugs)
 
-def _mark_slugs_as_used(history: dict[str, object], slugs: list[str]) -> None:
-    used_archive = history.setdefault(HISTORY_USED_SLUGS_KEY, [])
-    if not isinstance(used_archive, list):
-        used_archive = history[HISTORY_USED_SLUGS_KEY] = []
 
-    seen = {slug for slug in used_archive if isinstance(slug, str)}
-    for slug in slugs:
-        if isinstance(slug, str) and slug not in seen:
-            used_archive.append(slug)
-            seen.add(slug)
+def rebuild_category_cursors(
+    history: dict[str, object],
+    categories: list[str] | tuple[str, ...] | None = None,
+) -> dict[str, int]:
+    used_slugs = _all_used_slugs(history)
+    history[HISTORY_CURSORS_KEY] = {}
+    return {
+        category: _category_cursor(history, category, ARTICLE_STORE.load_category(category), used_slugs)
+        for category in categories or CATEGORY_ORDER
+    }
+
+
+def _check_category_cursors(
+    history: dict[str, object],
+    categories: list[str] | tuple[str, ...] | None = None,
+) -> list[str]:
+    cursors = history.get(HISTORY_CURSORS_KEY)
+    stored = dict(cursors) if isinstance(cursors, dict) else {}
+    rebuilt = rebuild_category_cursors(history, categories)
+    mismatched: list[str] = []
+    for category, position in rebuilt.items():
+        cursor = stored.get(category)
+        if cursor is None:
+            continue
+        if not isinstance(cursor, dict) or cursor.get("position") != position:
+            mismatched.append(category)
+    return mismatched
+
+
+class IntervalIndex:
+    # Elementarabschnitte zwischen allen Intervallgrenzen mit den dort aktiven Werten (in Regelreihenfolge);
+    # eine Abfrage ist eine Bisektion ueber die Grenzen.
+    __slots__ = ("bounds", "active")
+
+    def __init__(self, intervals: list[tuple[int, int, object]]) -> None:
+        opening: dict[int, list[int]] = {}
+        closing: dict[int, list[int]] = {}
+        for number, (start, end, _) in enumerate(intervals):
+            opening.setdefault(start, []).append(number)
+            closing.setdefault(end + 1, []).append(number)
+        self.bounds = sorted(opening.keys() | closing.keys())
+        self.active: list[tuple[object, ...]] = []
+        current: set[int] = set()
+        for point in self.bounds:
+            current.difference_update(closing.get(point, ()))
+            current.update(opening.get(point, ()))
+            self.active.append(tuple(intervals[number][2] for number in sorted(current)))
+
+    def at(self, ordinal: int) -> tuple[object, ...]:
+        position = bisect_right(self.bounds, ordinal) - 1
+        return self.active[position] if position >= 0 else ()
+
+
+class EditorialCalendar:
+    # Festgelegte Artikel (pins) und Sperren (blackouts) fuer Tage oder Zeitraeume.
+    def __init__(
+        self,
+        pins: list[tuple[int, int, str]] | None = None,
+        blackouts: list[tuple[int, int, str]] | None = None,
+        signature: str = "",
+    ) -> None:
+        pins = pins or []
+        self.signature = signature
+        # Pins tragen ihren ersten Tag mit: erschien der Artikel schon im Pin-Zeitraum, ist der Pin erfuellt.
+        self.pins = IntervalIndex([(start, end, (slug, date.fromordinal(start))) for start, end, slug in pins])
+        self.blackouts = IntervalIndex(blackouts or [])
+        self._pin_ends = sorted((end, slug) for _, end, slug in pins)
+        self._pin_end_keys = [end for end, _ in self._pin_ends]
+
+    def pinned(self, day: date) -> tuple[tuple[str, date], ...]:
+        return self.pins.at(day.toordinal())
+
+    def blocked(self, day: date) -> tuple[str, ...]:
+        return self.blackouts.at(day.toordinal())
+
+    def reserved(self, day: date) -> list[str]:
+        # Noch nicht abgelaufene Pins: die normale Rotation darf sie nicht vorher verbrauchen.
+        return [slug for _, slug in self._pin_ends[bisect_left(self._pin_end_keys, day.toordinal()) :]]
+
+
+def _calendar_rules(raw_rules: object, kind: str) -> list[tuple[int, int, str]]:
+    if raw_rules is None:
+        return []
+    if not isinstance(raw_rules, list):
+        raise ValueError(f"Kalender: '{kind}' muss eine Liste sein.")
+    rules: list[tuple[int, int, str]] = []
+    for number, rule in enumerate(raw_rules, start=1):
+        if not isinstance(rule, dict):
+            raise ValueError(f"Kalender: Eintrag {number} in '{kind}' muss ein Objekt sein.")
+        slugs = rule.get("slugs", [rule.get("slug")])
+        first = rule.get("from", rule.get("date"))
+        last = rule.get("to", first)
+        try:
+            start = date.fromisoformat(first).toordinal()
+            end = date.fromisoformat(last).toordinal()
+        except (TypeError, ValueError):
+            raise ValueError(f"Kalender: Eintrag {number} in '{kind}' braucht 'date' oder 'from'/'to' als JJJJ-MM-TT.")
+        if end < start:
+            raise ValueError(f"Kalender: Eintrag {number} in '{kind}' endet vor seinem Beginn.")
+        if not isinstance(slugs, list) or not slugs:
+            raise ValueError(f"Kalender: Eintrag {number} in '{kind}' braucht 'slug' oder 'slugs'.")
+        for slug in slugs:
+            if not isinstance(slug, str) or ARTICLE_STORE.category_of(slug) is None:
+                raise ValueError(f"Kalender: unbekannter Artikel {slug!r} in '{kind}'.")
+            rules.append((start, end, slug))
+    return rules
+
+
+_CALENDAR: tuple[tuple[str, int, int], EditorialCalendar] | None = None
+
+
+def load_calendar(path: Path | None = None) -> EditorialCalendar:
+    global _CALENDAR
+    if path is None:
+        path = CALENDAR_PATH
+    try:
+        stat = path.stat()
+    except OSError:
+        return EditorialCalendar()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if _CALENDAR is not None and _CALENDAR[0] == key:
+        return _CALENDAR[1]
+
+    data = path.read_bytes()
+    try:
+        raw_calendar = json.loads(data.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError) as error:
+        raise ValueError(f"Kalender {path} ist kein gueltiges JSON: {error}") from error
+    if not isinstance(raw_calendar, dict):
+        raise ValueError(f"Kalender {path} muss ein Objekt mit 'pins' und 'blackouts' sein.")
+    calendar = EditorialCalendar(
+        _calendar_rules(raw_calendar.get("pins"), "pins"),
+        _calendar_rules(raw_calendar.get("blackouts"), "blackouts"),
+        hashlib.sha1(data).hexdigest(),
+    )
+    _CALENDAR = (key, calendar)
+    return calendar
 
 
-def select_articles(now: datetime, history: dict[str, object]) -> tuple[list[dict[str, object]], bool]:
-    selections: list[dict[str, object]] = []
+def select_articles(
+    now: datetime,
+    history: dict[str, object],
+    categories: list[str] | tuple[str, ...] | None = None,
+    *,
+    anniversaries: bool | None = None,
+) -> tuple[list[Article], bool]:
+    selections: list[Article] = []
     ordinal = now.date().toordinal()
     today = now.date().isoformat()
 
@@ -1041,7 +1507,7 @@ def select_articles(now: datetime, history: dict[str, object]) -> tuple[list[dic
     if existing_entry is not None and not force_new_today:
         slugs = existing_entry.get("slugs")
         if isinstance(slugs, list):
-            resolved: list[dict[str, object]] = []
+            resolved: list[Article] = []
             for slug in slugs:
                 if not isinstance(slug, str):
                     break
@@ -1054,184 +1520,1965 @@ def select_articles(now: datetime, history: dict[str, object]) -> tuple[list[dic
 
     # Neue Logik: Rotation, aber keine Dopplung an einem Tag. Immer der älteste noch nicht verwendete Artikel, dann wieder von vorne.
     used_slugs = _all_used_slugs(history)
-    for category in CATEGORY_ORDER:
-        pool = ARTICLES[category]
-        unused_articles = [article for article in pool if article["slug"] not in used_slugs]
-        if unused_articles:
-            selection = unused_articles[0]
+    # Gesperrte und fuer spaeter festgelegte Artikel gelten fuer die Rotation wie bereits gewaehlt.
+    calendar = load_calendar()
+    pinned = calendar.pinned(now.date())
+    picked: set[str] = set(calendar.blocked(now.date()))
+    picked.update(calendar.reserved(now.date()))
+    if anniversaries is None:
+        anniversaries = _env_flag(ANNIVERSARY_SELECTION_ENV)
+    # Jahrestage des Tages je Kategorie; ein noch unbenutzter Treffer hat Vorrang vor der Rotation.
+    anniversary_slugs = load_anniversary_index().get(now.strftime("%m-%d"), {}) if anniversaries else {}
+    last_used = _history_index(history).last_used if pinned else {}
+    today = now.date().isoformat()
+    for category in categories or CATEGORY_ORDER:
+        pool = ARTICLE_STORE.load_category(category)
+        # Ein Pin gilt, bis der Artikel in seinem Zeitraum erschienen ist; fruehere Auftritte zaehlen nicht.
+        pin = next(
+            (
+                slug
+                for slug, first in pinned
+                if not first.isoformat() <= last_used.get(slug, "") < today
+                and ARTICLE_STORE.category_of(slug) == category
+            ),
+            None,
+        )
+        if pin is not None:
+            METRICS.count("pinned_picks")
+            selections.append(ARTICLE_STORE.get(pin))
+            picked.add(pin)
+            continue
+
+        anniversary = next(
+            (
+                slug
+                for slug in anniversary_slugs.get(category, ())
+                if slug not in picked and slug not in used_slugs
+            ),
+            None,
+        )
+        if anniversary is not None:
+            METRICS.count("anniversary_picks")
+            selection = ARTICLE_STORE.get(anniversary)
+            selections.append(selection)
+            picked.add(anniversary)
+            continue
+
+        position = _category_cursor(history, category, pool, used_slugs)
+        pool_slugs = pool.slugs
+        while position < len(pool_slugs) and (pool_slugs[position] in picked or pool_slugs[position] in used_slugs):
+            position += 1
+        if position < len(pool):
+            selection = pool[position]
         else:
-            # Rotation: Wenn alle verwendet, beginne von vorne (aber keine Dopplung an einem Tag)
-            # Finde Slugs, die heute noch nicht verwendet wurden
-            today_slugs = set()
-            for entry in history.get("history", []):
-                if entry.get("date") == now.date().isoformat():
-                    today_slugs.update(entry.get("slugs", []))
-            available = [article for article in pool if article["slug"] not in today_slugs]
-            if not available:
-                # Fallback: Wenn alle heute schon verwendet, nimm den ersten
+            # Rotation: Pool erschoepft, daher der am laengsten nicht mehr verwendete Artikel.
+            METRICS.count("rotation_picks")
+            slug = _history_index(history).least_recently_used(category, picked)
+            selection = ARTICLE_STORE.get(slug) if slug is not None else None
+            if selection is None:
                 selection = pool[0]
-            else:
-                selection = available[0]
         selections.append(selection)
-        used_slugs.add(selection["slug"])
+        picked.add(selection.slug)
     return selections, False
 
-def build_html(date_long: str, date_short: str, articles: list[dict[str, object]]) -> str:
-    sections = []
-    footnotes = []
-    for idx, article in enumerate(articles, start=1):
-        section_lines = [
-            f'<section class="artikel" aria-labelledby="{article["slug"]}">',
-            f'<h2 id="{article["slug"]}">{article["title"]}</h2>',
-        ]
-        for paragraph_index, paragraph in enumerate(article["paragraphs"]):
-            if paragraph_index == 0:
-                section_lines.append(
-                    f'<p>{paragraph}<sup><a id="ref-{idx}" href="#fn-{idx}">[{idx}]</a></sup></p>'
-                )
-            else:
-                section_lines.append(f"<p>{paragraph}</p>")
-        section_lines.append("</section>")
-        sections.append("\n".join(section_lines))
-        footnotes.append(
-            f'<li id="fn-{idx}">{article["source_label"]}: "{article["source_title"]}". '
-            f'<a href="{article["source_url"]}">{article["source_url"]}</a> '
-            f'<a href="#ref-{idx}">Zurueck</a></li>'
+
+def _schedule_path(history_path: Path) -> Path:
+    return history_path.with_name(history_path.stem + SCHEDULE_SUFFIX)
+
+
+def _read_schedule(path: Path) -> dict[str, object] | None:
+    try:
+        raw_schedule = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        return None
+    if (
+        not isinstance(raw_schedule, dict)
+        or raw_schedule.get("version") != SCHEDULE_VERSION
+        or not isinstance(raw_schedule.get("categories"), list)
+        or not isinstance(raw_schedule.get("fingerprints"), dict)
+        or not isinstance(raw_schedule.get("sequence"), int)
+        or not isinstance(raw_schedule.get("days"), dict)
+    ):
+        return None
+    return raw_schedule
+
+
+def _prime_category_cursors(history: dict[str, object], categories: list[str]) -> None:
+    # Rotationszeiger in der echten Historie anlegen, damit sie mit ihr gespeichert werden.
+    used_slugs = _all_used_slugs(history)
+    for category in categories:
+        _category_cursor(history, category, ARTICLE_STORE.load_category(category), used_slugs)
+
+
+def _pending_schedule_days(
+    stored: dict[str, object],
+    history: dict[str, object],
+) -> list[tuple[str, list[str]]] | None:
+    # Seit dem Planen angehaengte Tage muessen genau dem Plan entsprechen, sonst passt der Rest nicht mehr.
+    entries = history["history"]
+    last_date = entries[-1]["date"] if entries else ""
+    stored_days = sorted((date_value, slugs) for date_value, slugs in stored["days"].items() if isinstance(slugs, list))
+    consumed = [(date_value, slugs) for date_value, slugs in stored_days if date_value <= last_date]
+    published = {entry["date"]: entry["slugs"] for entry in entries[len(entries) - len(consumed) :]}
+    if history.get(HISTORY_SEQUENCE_KEY, 0) - stored["sequence"] != len(consumed) or any(
+        published.get(date_value) != slugs for date_value, slugs in consumed
+    ):
+        return None
+    return [(date_value, slugs) for date_value, slugs in stored_days if date_value > last_date]
+
+
+def plan_schedule(
+    today: date,
+    loaded_history: dict[str, object],
+    history_path: Path = HISTORY_LOG_PATH,
+    categories: list[str] | tuple[str, ...] | None = None,
+    horizon: int = SCHEDULE_HORIZON_DAYS,
+) -> dict[str, list[str]]:
+    # Fuehrt die Auswahl auf einer Kopie der bereits geladenen Historie bis today + horizon fort. Vorhandene
+    # Plantage werden uebernommen, solange sie noch gelten; neu berechnet wird erst ab dem ersten betroffenen Tag.
+    categories = list(categories or CATEGORY_ORDER)
+    path = _schedule_path(history_path)
+    _prime_category_cursors(loaded_history, categories)
+    history = copy.deepcopy(loaded_history)
+    entries = history["history"]
+    last_date = entries[-1]["date"] if entries else ""
+    sequence = history.get(HISTORY_SEQUENCE_KEY, 0)
+    fingerprints = {category: ARTICLE_STORE.fingerprint(category) for category in categories}
+
+    anniversaries = _env_flag(ANNIVERSARY_SELECTION_ENV)
+    calendar = load_calendar().signature
+    stored = _read_schedule(path)
+    planned: list[tuple[str, list[str]]] = []
+    changed = categories
+    if (
+        stored is not None
+        and stored["categories"] == categories
+        and stored.get("anniversaries") == anniversaries
+        and stored.get("calendar") == calendar
+    ):
+        pending = _pending_schedule_days(stored, history)
+        if pending is not None:
+            planned = pending
+            changed = [category for category in categories if stored["fingerprints"].get(category) != fingerprints[category]]
+
+    day = today
+    if last_date:
+        day = max(day, date.fromisoformat(last_date) + timedelta(days=1))
+    end = today + timedelta(days=horizon)
+    days: dict[str, list[str]] = {}
+    for date_value, slugs in planned:
+        if date_value != day.isoformat() or day >= end:
+            break
+        if changed:
+            # Kategorien sind unabhaengig voneinander; nur die Spalten mit geaendertem Korpus werden geprueft.
+            now = datetime.combine(day, datetime.min.time(), tzinfo=BERLIN_TZ)
+            articles, _ = select_articles(now, history, changed)
+            if [article.slug for article in articles] != [slugs[categories.index(category)] for category in changed]:
+                break
+        _append_history_entry(history, date_value, slugs)
+        days[date_value] = slugs
+        day += timedelta(days=1)
+    METRICS.count("schedule_days_kept", len(days))
+
+    while day < end:
+        now = datetime.combine(day, datetime.min.time(), tzinfo=BERLIN_TZ)
+        articles, _ = select_articles(now, history, categories)
+        slugs = [article.slug for article in articles]
+        _append_history_entry(history, day.isoformat(), slugs)
+        days[day.isoformat()] = slugs
+        METRICS.count("schedule_days_planned")
+        day += timedelta(days=1)
+
+    if (
+        stored is None
+        or stored["days"] != days
+        or stored["fingerprints"] != fingerprints
+        or stored["sequence"] != sequence
+        or stored.get("anniversaries") != anniversaries
+        or stored.get("calendar") != calendar
+    ):
+        document = {
+            "version": SCHEDULE_VERSION,
+            "categories": categories,
+            "anniversaries": anniversaries,
+            "calendar": calendar,
+            "fingerprints": fingerprints,
+            "sequence": sequence,
+            "days": days,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_text_atomic(path, json.dumps(document, ensure_ascii=True, separators=(",", ":")) + "\n")
+    return days
+
+
+def scheduled_articles(
+    now: datetime,
+    history: dict[str, object],
+    history_path: Path = HISTORY_LOG_PATH,
+    categories: list[str] | tuple[str, ...] | None = None,
+) -> tuple[list[Article], bool]:
+    # Taeglicher Lauf: Nachschlagen im Plan. Bereits ausgewaehlte Tage und erzwungene Neuwahl wie bisher.
+    today = now.date().isoformat()
+    entries = history.get("history", [])
+    if _env_flag("FORCE_NEW_SELECTION") or (
+        isinstance(entries, list) and any(isinstance(entry, dict) and entry.get("date") == today for entry in entries)
+    ):
+        return select_articles(now, history, categories)
+
+    # Gilt der gespeicherte Plan noch (Korpus, Kalender, Schalter, seither erschienene Tage), ist heute sein
+    # naechster Tag; neu geplant wird nur, wenn diese Pruefung fehlschlaegt.
+    categories = list(categories or CATEGORY_ORDER)
+    _prime_category_cursors(history, categories)
+    stored = _read_schedule(_schedule_path(history_path))
+    slugs: list[str] | None = None
+    if (
+        stored is not None
+        and stored["categories"] == categories
+        and stored.get("anniversaries") == _env_flag(ANNIVERSARY_SELECTION_ENV)
+        and stored.get("calendar") == load_calendar().signature
+        and all(stored["fingerprints"].get(category) == ARTICLE_STORE.fingerprint(category) for category in categories)
+    ):
+        pending = _pending_schedule_days(stored, history)
+        if pending and pending[0][0] == today and len(pending[0][1]) == len(categories):
+            METRICS.count("schedule_hits")
+            slugs = pending[0][1]
+    if slugs is None:
+        slugs = plan_schedule(now.date(), history, history_path, categories).get(today, [])
+    articles = [ARTICLE_STORE.get(slug) for slug in slugs]
+    if not articles or any(article is None for article in articles):
+        return select_articles(now, history, categories)
+    return articles, False
+
+
+_TEMPLATE_FIELD = re.compile(r"\{\{(\w+)\}\}")
+
+
+class CompiledTemplate:
+    # {{name}}-Platzhalter; wird einmal in Text- und Byte-Segmente zerlegt, gerendert wird per join
+    # ueber die Segmente und die Werte der festen Positionsparameter.
+    __slots__ = ("fields", "segments", "texts", "indices")
+
+    def __init__(self, source: str, parameters: tuple[str, ...]) -> None:
+        pieces = _TEMPLATE_FIELD.split(source)
+        literals = pieces[0::2]
+        self.fields = tuple(pieces[1::2])
+        unknown = sorted(set(self.fields) - set(parameters))
+        if unknown:
+            raise ValueError(f"Unbekannte Platzhalter in Vorlage: {', '.join(unknown)}")
+        self.segments = tuple(literal.encode("utf-8") for literal in literals)
+        # Segment, Wert, Segment, ...: die Werte landen an den ungeraden Positionen.
+        self.texts: list[str] = [""] * (2 * len(literals) - 1)
+        self.texts[0::2] = literals
+        self.indices = tuple(parameters.index(field) for field in self.fields)
+
+    def render(self, *values: str) -> str:
+        parts = self.texts.copy()
+        parts[1::2] = [values[index] for index in self.indices]
+        return "".join(parts)
+
+
+class HtmlTheme:
+    def __init__(
+        self,
+        name: str,
+        page: str,
+        section: str,
+        lead_paragraph: str,
+        paragraph: str,
+        footnote: str,
+        separator: str = "\n",
+    ) -> None:
+        self.name = name
+        self.page = CompiledTemplate(page, ("date_long", "date_short", "sections", "footnotes", "title"))
+        self.section = CompiledTemplate(section, ("idx", "slug", "title", "paragraphs"))
+        self.lead_paragraph = CompiledTemplate(lead_paragraph, ("idx", "text"))
+        self.paragraph = CompiledTemplate(paragraph, ("idx", "text"))
+        self.footnote = CompiledTemplate(footnote, ("idx", "slug", "source_label", "source_title", "source_url"))
+        self.separator = separator.encode("utf-8")
+        # Fertig kodierte Abschnitte/Fussnoten je (Position, Artikelinhalt); Artikel wiederholen sich in
+        # Rotation, Stapel- und Mehrfachausgaben staendig.
+        self._fragments: dict[tuple[object, ...], tuple[bytes, bytes]] = {}
+
+    def render_section(self, idx: int, article: Article) -> str:
+        number = str(idx)
+        paragraphs = article.paragraphs
+        if not paragraphs:
+            return self.section.render(number, article.slug, article.title, "")
+        paragraph = self.paragraph.render
+        rendered = [self.lead_paragraph.render(number, paragraphs[0])]
+        rendered.extend([paragraph(number, text) for text in paragraphs[1:]])
+        return self.section.render(number, article.slug, article.title, "".join(rendered))
+
+    def render_footnote(self, idx: int, article: Article) -> str:
+        return self.footnote.render(
+            str(idx),
+            article.slug,
+            article.source_label,
+            article.source_title,
+            article.source_url,
         )
 
-    sections_html = "\n".join(sections)
-    footnotes_html = "\n".join(footnotes)
+    def fragments(self, idx: int, article: Article) -> tuple[bytes, bytes]:
+        key = (
+            idx,
+            article.slug,
+            article.title,
+            article.paragraphs,
+            article.source_label,
+            article.source_title,
+            article.source_url,
+        )
+        cached = self._fragments.get(key)
+        if cached is None:
+            if len(self._fragments) >= HTML_FRAGMENT_CACHE_SIZE:
+                self._fragments.clear()
+            cached = (
+                self.render_section(idx, article).encode("utf-8"),
+                self.render_footnote(idx, article).encode("utf-8"),
+            )
+            self._fragments[key] = cached
+        return cached
+
+    def _iter_fragments(self, articles: list[Article], part: int) -> Iterator[bytes]:
+        for idx, article in enumerate(articles, start=1):
+            fragment = self.fragments(idx, article)[part]
+            yield fragment if idx == 1 else self.separator + fragment
+
+    def iter_page(
+        self,
+        date_long: str,
+        date_short: str,
+        articles: list[Article],
+        title: str = DEFAULT_EDITION_TITLE,
+    ) -> Iterator[bytes]:
+        # Liefert die vorkodierten Seitenstuecke der Reihe nach; build_html_bytes fuegt sie zu einer Seite zusammen.
+        for segment, field in zip(self.page.segments, self.page.fields):
+            yield segment
+            if field == "sections":
+                yield from self._iter_fragments(articles, 0)
+            elif field == "footnotes":
+                yield from self._iter_fragments(articles, 1)
+            elif field == "date_long":
+                yield date_long.encode("utf-8")
+            elif field == "title":
+                yield title.encode("utf-8")
+            else:
+                yield date_short.encode("utf-8")
+        yield self.page.segments[-1]
+
+
+HTML_THEMES: dict[str, HtmlTheme] = {}
+
 
-    return f"""<!DOCTYPE html>
+def register_html_theme(theme: HtmlTheme) -> None:
+    HTML_THEMES[theme.name] = theme
+
+
+register_html_theme(
+    HtmlTheme(
+        DEFAULT_HTML_THEME,
+        page="""<!DOCTYPE html>
 <html lang="de">
 <head>
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
-<title>history &ndash; {date_long}</title>
+<title>{{title}} &ndash; {{date_long}}</title>
 <style>
-    body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 2rem auto; max-width: 900px; padding: 0 1rem; }}
-    header, footer {{ border-bottom: 1px solid #ccc; padding-bottom: 1rem; margin-bottom: 1.5rem; }}
-    footer {{ border-top: 1px solid #ccc; border-bottom: none; margin-top: 2rem; padding-top: 1.5rem; }}
-    h1, h2, h3 {{ color: #1a1a1a; }}
-    section {{ margin-bottom: 2rem; }}
-    .meta {{ color: #555; font-size: 0.95rem; }}
-    .artikel {{ border-left: 4px solid #1a1a1a; padding-left: 1rem; background: #fafafa; }}
-    .artikel p {{ margin: 0.4rem 0; }}
-    .footnotes {{ font-size: 0.9rem; }}
-    .footnotes li {{ margin-bottom: 0.5rem; }}
+    body { font-family: Arial, sans-serif; line-height: 1.6; margin: 2rem auto; max-width: 900px; padding: 0 1rem; }
+    header, footer { border-bottom: 1px solid #ccc; padding-bottom: 1rem; margin-bottom: 1.5rem; }
+    footer { border-top: 1px solid #ccc; border-bottom: none; margin-top: 2rem; padding-top: 1.5rem; }
+    h1, h2, h3 { color: #1a1a1a; }
+    section { margin-bottom: 2rem; }
+    .meta { color: #555; font-size: 0.95rem; }
+    .artikel { border-left: 4px solid #1a1a1a; padding-left: 1rem; background: #fafafa; }
+    .artikel p { margin: 0.4rem 0; }
+    .footnotes { font-size: 0.9rem; }
+    .footnotes li { margin-bottom: 0.5rem; }
 </style>
 </head>
 <body>
 <header>
-<h1>history</h1>
-<p class="meta">update: {date_short}</p>
+<h1>{{title}}</h1>
+<p class="meta">update: {{date_short}}</p>
 </header>
 <main>
-{sections_html}
+{{sections}}
 </main>
 <footer>
 <section class="footnotes" aria-label="Quellen">
 <h3>Quellen</h3>
 <ol>
-{footnotes_html}
+{{footnotes}}
 </ol>
 </section>
 </footer>
 </body>
 </html>
-"""
-
-
-def build_pdf_content(date_long: str, date_short: str, articles: list[dict[str, object]]) -> bytes:
-    lines = [
-        "BT",
-        "/F1 12 Tf",
-        "72 760 Td",
-        "(Dokumentation history) Tj",
-        "0 -18 Td",
-        f"(update: {date_short}) Tj",
-        "0 -30 Td",
-        "(Automatisierung:) Tj",
-        "0 -18 Td",
-        "(1. Artikelpool wird taeglich anhand des Datums neu gewaehlt.) Tj",
-        "0 -18 Td",
-        "(2. Skript ersetzt index.html, tageschronik.html und das PDF vollstaendig.) Tj",
-        "0 -18 Td",
-        f"(3. GitHub Action aktualisiert Inhalte um {UPDATE_TIME} Uhr.) Tj",
-        "0 -18 Td",
-        "(4. Quellen werden automatisch als Fussnoten eingefuegt.) Tj",
-        "0 -18 Td",
-        "(Auswahl des Tages:) Tj",
+""",
+        section=(
+            '<section class="artikel" aria-labelledby="{{slug}}">\n'
+            '<h2 id="{{slug}}">{{title}}</h2>{{paragraphs}}\n'
+            "</section>"
+        ),
+        lead_paragraph='\n<p>{{text}}<sup><a id="ref-{{idx}}" href="#fn-{{idx}}">[{{idx}}]</a></sup></p>',
+        paragraph="\n<p>{{text}}</p>",
+        footnote=(
+            '<li id="fn-{{idx}}">{{source_label}}: "{{source_title}}". '
+            '<a href="{{source_url}}">{{source_url}}</a> '
+            '<a href="#ref-{{idx}}">Zurueck</a></li>'
+        ),
+    )
+)
+
+
+def build_html_bytes(
+    date_long: str,
+    date_short: str,
+    articles: list[Article],
+    theme: str = DEFAULT_HTML_THEME,
+    title: str = DEFAULT_EDITION_TITLE,
+) -> bytes:
+    return b"".join(HTML_THEMES[theme].iter_page(date_long, date_short, articles, title))
+
+
+def build_html(
+    date_long: str,
+    date_short: str,
+    articles: list[Article],
+    theme: str = DEFAULT_HTML_THEME,
+    title: str = DEFAULT_EDITION_TITLE,
+) -> str:
+    return build_html_bytes(date_long, date_short, articles, theme, title).decode("utf-8")
+
+
+# Helvetica-Breiten (AFM, 1/1000 em) fuer ASCII 32-126; andere Zeichen ueber ihren Grundbuchstaben.
+_HELVETICA_WIDTHS = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+
+
+def _pdf_char_width(char: str) -> int:
+    code = ord(char)
+    if 32 <= code <= 126:
+        return _HELVETICA_WIDTHS[code - 32]
+    if char == "ß":
+        return 611
+    base = unicodedata.normalize("NFKD", char)[:1]
+    if base and 32 <= ord(base) <= 126:
+        return _HELVETICA_WIDTHS[ord(base) - 32]
+    return 556
+
+
+def _pdf_text_width(text: str, font_size: float = PDF_FONT_SIZE) -> float:
+    return sum(_pdf_char_width(char) for char in text) * font_size / 1000
+
+
+def _wrap_pdf_text(text: str, max_width: float = PDF_TEXT_WIDTH) -> list[str]:
+    lines: list[str] = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if _pdf_text_width(candidate) <= max_width:
+            current = candidate
+            continue
+        if current:
+            lines.append(current)
+        # Woerter breiter als die Zeile hart umbrechen.
+        while _pdf_text_width(word) > max_width:
+            cut = len(word) - 1
+            while cut > 1 and _pdf_text_width(word[:cut]) > max_width:
+                cut -= 1
+            lines.append(word[:cut])
+            word = word[cut:]
+        current = word
+    if current or not lines:
+        lines.append(current)
+    return lines
+
+
+def _pdf_string(text: str) -> bytes:
+    # WinAnsiEncoding entspricht cp1252; nicht darstellbare Zeichen werden zu "?".
+    encoded = text.encode("cp1252", errors="replace")
+    return b"(" + encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def _layout_pdf_pages(blocks: list[tuple[float, str]]) -> list[list[tuple[float, str]]]:
+    # Bloecke: (Abstand zur vorherigen Zeile, Text). Liefert pro Seite (Abstand, Zeile), der erste Abstand ist 0.
+    pages: list[list[tuple[float, str]]] = [[]]
+    y = PDF_PAGE_HEIGHT - PDF_MARGIN_TOP
+    for gap, text in blocks:
+        for line_index, line in enumerate(_wrap_pdf_text(text)):
+            step = gap if line_index == 0 else PDF_LEADING
+            if pages[-1] and y - step < PDF_MARGIN_BOTTOM:
+                pages.append([])
+            if not pages[-1]:
+                y = PDF_PAGE_HEIGHT - PDF_MARGIN_TOP
+                step = 0
+            y -= step
+            pages[-1].append((step, line))
+    return pages
+
+
+def _pdf_content_stream(lines: list[tuple[float, str]]) -> bytes:
+    commands = [
+        b"BT",
+        b"/F1 %d Tf" % PDF_FONT_SIZE,
+        b"%d %d Td" % (PDF_MARGIN_LEFT, PDF_PAGE_HEIGHT - PDF_MARGIN_TOP),
     ]
+    for step, line in lines:
+        if step:
+            commands.append(b"0 %d Td" % -step)
+        commands.append(_pdf_string(line) + b" Tj")
+    commands.append(b"ET")
+    return b"\n".join(commands) + b"\n"
 
-    for article in articles:
-        title = article["title"]
-        if isinstance(title, str):
-            if len(title) > 90:
-                title = title[:87] + "..."
-            title = title.replace("(", "\\(").replace(")", "\\)")
-            lines.extend(["0 -18 Td", f"({title}) Tj"])
-
-    lines.extend(
-        [
-            "0 -30 Td",
-            "(Status:) Tj",
-            "0 -18 Td",
-            "(Dieses PDF dokumentiert den Stand der HTML-Dateien am) Tj",
-            "0 -18 Td",
-            f"({date_long}) Tj",
-            "ET",
-        ]
-    )
-    stream = ("\n".join(lines) + "\n").encode("ascii")
-    objs = []
-    objs.append(b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n")
-    objs.append(b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n")
-    objs.append(
-        b"3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>\nendobj\n"
-    )
-    objs.append(b"4 0 obj\n<< /Length %d >>\nstream\n" % len(stream) + stream + b"endstream\nendobj\n")
-    objs.append(b"5 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj\n")
 
-    parts = [b"%PDF-1.4\n"]
+def _pdf_document(objects: list[bytes]) -> bytes:
+    parts = [b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"]
     offsets = [0]
     length = len(parts[0])
-    for obj in objs:
+    for number, body in enumerate(objects, start=1):
+        obj = b"%d 0 obj\n" % number + body + b"\nendobj\n"
         offsets.append(length)
         parts.append(obj)
         length += len(obj)
 
     xref_pos = length
-    xref = [b"xref\n", b"0 6\n", b"0000000000 65535 f \n"]
+    xref = [b"xref\n", b"0 %d\n" % (len(objects) + 1), b"0000000000 65535 f \n"]
     for offset in offsets[1:]:
         xref.append(f"{offset:010d} 00000 n \n".encode("ascii"))
     parts.append(b"".join(xref))
-    trailer = b"trailer\n<< /Size 6 /Root 1 0 R >>\nstartxref\n" + str(xref_pos).encode("ascii") + b"\n%%EOF\n"
+    trailer = (
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n" % (len(objects) + 1)
+        + str(xref_pos).encode("ascii")
+        + b"\n%%EOF\n"
+    )
     parts.append(trailer)
     return b"".join(parts)
 
 
-def main() -> None:
-    now = datetime.now(ZoneInfo("Europe/Berlin"))
-    date_long = german_long_date(now)
-    date_short = german_short_date(now)
-    history = load_history()
-    _ensure_history_unique(history)
-    articles, _ = select_articles(now, history)
+def build_pdf_content(
+    date_long: str,
+    date_short: str,
+    articles: list[Article],
+    title: str = DEFAULT_EDITION_TITLE,
+    update_time: str = UPDATE_TIME,
+) -> bytes:
+    blocks: list[tuple[float, str]] = [
+        (0, f"Dokumentation {title}"),
+        (18, f"update: {date_short}"),
+        (30, "Automatisierung:"),
+        (18, "1. Artikelpool wird taeglich anhand des Datums neu gewaehlt."),
+        (18, "2. Skript ersetzt index.html, tageschronik.html und das PDF vollstaendig."),
+        (18, f"3. GitHub Action aktualisiert Inhalte um {update_time} Uhr."),
+        (18, "4. Quellen werden automatisch als Fussnoten eingefuegt."),
+        (18, "Auswahl des Tages:"),
+    ]
+    for article in articles:
+        if article.title:
+            blocks.append((18, article.title))
+    blocks.extend(
+        [
+            (30, "Status:"),
+            (18, "Dieses PDF dokumentiert den Stand der HTML-Dateien am"),
+            (18, date_long),
+        ]
+    )
+
+    pages = _layout_pdf_pages(blocks)
+    # 1 Katalog, 2 Seitenbaum, 3 Schrift, danach je Seite ein Page- und ein Inhaltsobjekt.
+    kids = b" ".join(b"%d 0 R" % (4 + 2 * index) for index in range(len(pages)))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(pages),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    for index, lines in enumerate(pages):
+        content_number = 5 + 2 * index
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 3 0 R >> >> >>" % (PDF_PAGE_WIDTH, PDF_PAGE_HEIGHT, content_number)
+        )
+        stream = zlib.compress(_pdf_content_stream(lines), 9)
+        objects.append(
+            b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        )
+    return _pdf_document(objects)
+
+
+class RenderJob(NamedTuple):
+    kind: str
+    date_long: str
+    date_short: str
+    articles: list[Article]
+    theme: str = DEFAULT_HTML_THEME
+    title: str = DEFAULT_EDITION_TITLE
+    update_time: str = UPDATE_TIME
 
-    slugs_today = [article["slug"] for article in articles]
-    _append_history_entry(history, now.date().isoformat(), slugs_today)
-    _ensure_entry_slugs_tracked(history)
-    save_history(history)
 
-    html_content = build_html(date_long, date_short, articles)
-    base_path = BASE_PATH
+RENDERERS = {
+    "html": lambda job: build_html_bytes(job.date_long, job.date_short, job.articles, job.theme, job.title),
+    "pdf": lambda job: build_pdf_content(job.date_long, job.date_short, job.articles, job.title, job.update_time),
+}
+
+
+def _render_job(job: RenderJob) -> bytes:
+    return RENDERERS[job.kind](job)
+
+
+def _render_workers(default: int = 1) -> int:
+    value = os.getenv(RENDER_WORKERS_ENV)
+    if value is None or not value.strip():
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return default
+
+
+def render_outputs(jobs: list[RenderJob], workers: int = 1, *, use_threads: bool = False) -> list[bytes]:
+    # Ergebnisse kommen in Auftragsreihenfolge zurueck, identisch zum seriellen Pfad.
+    if workers <= 1 or len(jobs) <= 1:
+        return [_render_job(job) for job in jobs]
+
+    executor_class: type[Executor] = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    with executor_class(max_workers=min(workers, len(jobs))) as executor:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        return list(executor.map(_render_job, jobs, chunksize=chunksize))
+
+
+_TEMPLATE_FINGERPRINT: str | None = None
+
+
+def _template_fingerprint() -> str:
+    global _TEMPLATE_FINGERPRINT
+    if _TEMPLATE_FINGERPRINT is None:
+        digest = hashlib.sha256(RENDER_TEMPLATE_VERSION.encode("ascii"))
+        digest.update(Path(__file__).read_bytes())
+        _TEMPLATE_FINGERPRINT = digest.hexdigest()
+    return _TEMPLATE_FINGERPRINT
+
+
+def render_cache_key(job: RenderJob) -> str:
+    digest = hashlib.sha256(_template_fingerprint().encode("ascii"))
+    header = [
+        job.kind,
+        job.theme,
+        job.title,
+        job.update_time,
+        job.date_long,
+        job.date_short,
+        [article.slug for article in job.articles],
+    ]
+    digest.update(json.dumps(header, ensure_ascii=True).encode("ascii"))
+    # Artikelinhalt mit hashen, damit Korrekturen am Korpus nicht aus dem Cache ueberdeckt werden.
+    records = [article.to_record() for article in job.articles]
+    digest.update(json.dumps(records, ensure_ascii=True, sort_keys=True).encode("ascii"))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    # Ein Eintrag pro Datei <schluessel>.bin; mtime dient als LRU-Zeitstempel.
+    def __init__(self, directory: Path = RENDER_CACHE_PATH, max_bytes: int = RENDER_CACHE_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.bin"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._entry_path(key)
+        try:
+            payload = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return payload
+
+    def put(self, key: str, payload: bytes) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp_path = self.directory / f".{key}.tmp"
+            temp_path.write_bytes(payload)
+            os.replace(temp_path, self._entry_path(key))
+        except OSError:
+            return
+
+    def evict(self) -> None:
+        # Einmal je render_cached-Aufruf, nicht nach jedem put: das Verzeichnis wird dafuer komplett gelistet.
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self.directory.glob("*.bin"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def render_cached(
+    jobs: list[RenderJob],
+    workers: int = 1,
+    cache: RenderCache | None = None,
+) -> list[bytes]:
+    if cache is None:
+        return render_outputs(jobs, workers)
+
+    keys = [render_cache_key(job) for job in jobs]
+    payloads: list[bytes | None] = [cache.get(key) for key in keys]
+    missing = [index for index, payload in enumerate(payloads) if payload is None]
+    METRICS.count("render_cache_hits", len(keys) - len(missing))
+    METRICS.count("render_cache_misses", len(missing))
+    if missing:
+        # Gleiche Auftraege (etwa Ausgaben mit identischer Auswahl) nur einmal rendern.
+        first_index: dict[str, int] = {}
+        for index in missing:
+            first_index.setdefault(keys[index], index)
+        unique = list(first_index.values())
+        rendered = dict(zip(unique, render_outputs([jobs[index] for index in unique], workers)))
+        for index in unique:
+            cache.put(keys[index], rendered[index])
+        cache.evict()
+        for index in missing:
+            payloads[index] = rendered[first_index[keys[index]]]
+    return payloads
+
+
+_SEARCH_MARKUP = re.compile(r"<[^>]*>|&\w+;")
+_SEARCH_TOKEN = re.compile(r"[a-z0-9]+")
+_SEARCH_FOLDING = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+
+def _fold_search_text(text: str) -> str:
+    # Der Korpus schreibt Umlaute als "ae"/"oe"/"ue"; Anfragen mit "ä" oder "ß" werden auf dieselbe Form gebracht.
+    folded = unicodedata.normalize("NFKD", _SEARCH_MARKUP.sub(" ", text).lower().translate(_SEARCH_FOLDING))
+    return "".join(char for char in folded if not unicodedata.combining(char))
+
+
+def search_tokens(text: str) -> list[str]:
+    return [
+        token
+        for token in _SEARCH_TOKEN.findall(_fold_search_text(text))
+        if len(token) > 1 and token not in SEARCH_STOPWORDS
+    ]
+
+
+def _corpus_signature(salt: str) -> str:
+    digest = hashlib.sha1(salt.encode("utf-8"))
+    for category in ARTICLE_STORE.categories():
+        digest.update(f"\n{category}:{ARTICLE_STORE.fingerprint(category)}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _search_signature() -> str:
+    return _corpus_signature(f"{SEARCH_INDEX_VERSION}:{SEARCH_FIELD_WEIGHTS}")
+
+
+class SearchIndex:
+    # postings: Begriff -> [[Dokumentnummer, gewichtete Haeufigkeit], ...], nach Dokumentnummer sortiert.
+    def __init__(
+        self,
+        signature: str,
+        documents: list[str],
+        lengths: list[float],
+        postings: dict[str, list[list[float]]],
+    ) -> None:
+        self.signature = signature
+        self.documents = documents
+        self.lengths = lengths
+        self.postings = postings
+        self.average_length = sum(lengths) / len(lengths) if lengths else 0.0
+        self._terms: list[str] | None = None
+
+    @classmethod
+    def build(cls) -> SearchIndex:
+        documents: list[str] = []
+        lengths: list[float] = []
+        postings: dict[str, list[list[float]]] = {}
+        for category in ARTICLE_STORE.categories():
+            for article in ARTICLE_STORE.load_category(category):
+                fields = {
+                    "title": [article.title],
+                    "paragraphs": article.paragraphs,
+                    "source": [article.source_label, article.source_title],
+                }
+                frequencies: dict[str, float] = {}
+                for field, texts in fields.items():
+                    weight = SEARCH_FIELD_WEIGHTS[field]
+                    for text in texts:
+                        for token in search_tokens(text):
+                            frequencies[token] = frequencies.get(token, 0.0) + weight
+                document = len(documents)
+                documents.append(article.slug)
+                lengths.append(sum(frequencies.values()))
+                for token, frequency in frequencies.items():
+                    postings.setdefault(token, []).append([document, frequency])
+        return cls(_search_signature(), documents, lengths, postings)
+
+    def to_document(self) -> dict[str, object]:
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "signature": self.signature,
+            "documents": self.documents,
+            "lengths": self.lengths,
+            "postings": self.postings,
+        }
+
+    def terms(self) -> list[str]:
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        return self._terms
+
+    def expand(self, prefix: str) -> list[str]:
+        terms = self.terms()
+        position = bisect_left(terms, prefix)
+        expanded: list[str] = []
+        while position < len(terms) and terms[position].startswith(prefix):
+            expanded.append(terms[position])
+            position += 1
+        return expanded
+
+    def term_scores(self, term: str) -> dict[int, float]:
+        # BM25 mit feldgewichteten Haeufigkeiten.
+        entries = self.postings.get(term, [])
+        if not entries:
+            return {}
+        count = len(self.documents)
+        idf = math.log(1 + (count - len(entries) + 0.5) / (len(entries) + 0.5))
+        scores: dict[int, float] = {}
+        for document, frequency in entries:
+            document = int(document)
+            norm = 1 - SEARCH_BM25_B + SEARCH_BM25_B * self.lengths[document] / (self.average_length or 1.0)
+            scores[document] = idf * frequency * (SEARCH_BM25_K1 + 1) / (frequency + SEARCH_BM25_K1 * norm)
+        return scores
+
+    def search(self, query: str, limit: int = SEARCH_RESULT_LIMIT, *, prefix: bool = True) -> list[tuple[str, float]]:
+        # Alle Begriffe muessen vorkommen; der letzte darf ein Wortanfang sein (Eingabe waehrend des Tippens).
+        tokens = search_tokens(query)
+        if not tokens:
+            return []
+        totals: dict[int, float] | None = None
+        for position, token in enumerate(tokens):
+            terms = self.expand(token) if prefix and position == len(tokens) - 1 else [token]
+            scores: dict[int, float] = {}
+            for term in terms:
+                for document, score in self.term_scores(term).items():
+                    scores[document] = max(scores.get(document, 0.0), score)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {document: total + scores[document] for document, total in totals.items() if document in scores}
+            if not totals:
+                return []
+        ranked = sorted(totals.items(), key=lambda item: (-item[1], self.documents[item[0]]))
+        return [(self.documents[document], score) for document, score in ranked[:limit]]
+
+
+def load_search_index(path: Path = SEARCH_INDEX_PATH) -> SearchIndex:
+    # Gespeicherter Index gilt, solange die Fingerabdruecke aller Kategorien unveraendert sind.
+    signature = _search_signature()
+    try:
+        raw_index = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        raw_index = None
+    if (
+        isinstance(raw_index, dict)
+        and raw_index.get("version") == SEARCH_INDEX_VERSION
+        and raw_index.get("signature") == signature
+        and isinstance(raw_index.get("documents"), list)
+        and isinstance(raw_index.get("lengths"), list)
+        and isinstance(raw_index.get("postings"), dict)
+    ):
+        METRICS.count("search_index_reused")
+        return SearchIndex(signature, raw_index["documents"], raw_index["lengths"], raw_index["postings"])
+
+    with METRICS.span("search_index"):
+        index = SearchIndex.build()
+    try:
+        _write_text_atomic(path, json.dumps(index.to_document(), ensure_ascii=True, separators=(",", ":")) + "\n")
+    except OSError:
+        pass
+    return index
+
+
+_MONTH_NUMBERS = {_fold_search_text(name): number for number, name in MONTHS.items()}
+_EVENT_DATE = re.compile(r"\b([0-3]?\d)\.\s+(" + "|".join(_MONTH_NUMBERS) + r")\b")
+_ANNIVERSARY_INDEX: tuple[str, dict[str, dict[str, list[str]]]] | None = None
+
+
+def event_month_day(article: Article) -> str | None:
+    # Tag und Monat aus dem Ereignis-Absatz ("Am 24. Oktober 1648 ..."); nur Monat ("Im Juli 1944") zaehlt nicht.
+    paragraphs = article.paragraphs
+    if not paragraphs:
+        return None
+    match = _EVENT_DATE.search(_fold_search_text(paragraphs[0]))
+    if match is None:
+        return None
+    month = _MONTH_NUMBERS[match.group(2)]
+    day = int(match.group(1))
+    try:
+        date(2000, month, day)
+    except ValueError:
+        return None
+    return f"{month:02d}-{day:02d}"
+
+
+def build_anniversary_index() -> dict[str, dict[str, list[str]]]:
+    index: dict[str, dict[str, list[str]]] = {}
+    for category in ARTICLE_STORE.categories():
+        for article in ARTICLE_STORE.load_category(category):
+            month_day = event_month_day(article)
+            if month_day is not None:
+                index.setdefault(month_day, {}).setdefault(category, []).append(article.slug)
+    return index
+
+
+def load_anniversary_index(path: Path = ANNIVERSARY_INDEX_PATH) -> dict[str, dict[str, list[str]]]:
+    # MM-TT -> Kategorie -> Slugs in Pool-Reihenfolge; nur bei geaendertem Korpus neu aus den Absaetzen gelesen.
+    global _ANNIVERSARY_INDEX
+    signature = _corpus_signature(f"anniversaries:{ANNIVERSARY_INDEX_VERSION}")
+    if _ANNIVERSARY_INDEX is not None and _ANNIVERSARY_INDEX[0] == signature:
+        return _ANNIVERSARY_INDEX[1]
+
+    try:
+        raw_index = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        raw_index = None
+    if isinstance(raw_index, dict) and raw_index.get("signature") == signature and isinstance(raw_index.get("days"), dict):
+        index = raw_index["days"]
+    else:
+        METRICS.count("anniversary_index_built")
+        index = build_anniversary_index()
+        document = {"version": ANNIVERSARY_INDEX_VERSION, "signature": signature, "days": index}
+        try:
+            _write_text_atomic(path, json.dumps(document, ensure_ascii=True, sort_keys=True, separators=(",", ":")) + "\n")
+        except OSError:
+            pass
+    _ANNIVERSARY_INDEX = (signature, index)
+    return index
+
+
+def export_search_shards(
+    index: SearchIndex,
+    output_dir: Path = SEARCH_SHARDS_PATH,
+    prefix_length: int = SEARCH_SHARD_PREFIX_LENGTH,
+) -> list[Path]:
+    # Der Client laedt manifest.json und danach nur die Scheibe fuer den Anfang des gesuchten Worts.
+    shards: dict[str, dict[str, list[list[float]]]] = {}
+    for term in index.terms():
+        scores = index.term_scores(term)
+        shards.setdefault(term[:prefix_length], {})[term] = [
+            [document, round(score, 4)] for document, score in sorted(scores.items())
+        ]
+
+    documents = []
+    for slug in index.documents:
+        article = ARTICLE_STORE.get(slug)
+        documents.append(
+            {"slug": slug, "title": article.title if article is not None else slug, "category": ARTICLE_STORE.category_of(slug)}
+        )
+    manifest = {
+        "version": SEARCH_INDEX_VERSION,
+        "signature": index.signature,
+        "prefix_length": prefix_length,
+        "documents": documents,
+        "shards": {prefix: f"shard-{prefix}.json" for prefix in sorted(shards)},
+    }
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = [output_dir / "manifest.json"]
+    write_output(written[0], json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    for prefix, terms in shards.items():
+        target = output_dir / f"shard-{prefix}.json"
+        write_output(target, json.dumps(terms, ensure_ascii=True, separators=(",", ":")).encode("utf-8"))
+        written.append(target)
+    current = {path.name for path in written}
+    for stale in output_dir.glob("shard-*.json"):
+        if stale.name not in current:
+            remove_output(stale)
+    return written
+
+
+class Edition(NamedTuple):
+    name: str
+    title: str = DEFAULT_EDITION_TITLE
+    categories: tuple[str, ...] = tuple(CATEGORY_ORDER)
+    output_dir: Path = BASE_PATH
+    history_path: Path = HISTORY_LOG_PATH
+    update_time: str = UPDATE_TIME
+    theme: str = DEFAULT_HTML_THEME
+    html_names: tuple[str, ...] = ("index.html", "tageschronik.html")
+    pdf_name: str = "dokumentation.pdf"
+    site_url: str = ""
+
+
+DEFAULT_EDITION = Edition(DEFAULT_EDITION_NAME, site_url=os.getenv(SITE_URL_ENV, "").rstrip("/"))
+
+_SITE_URL_PATTERN = re.compile(r"https?://[^/\s]+")
+_UPDATE_TIME_PATTERN = re.compile(r"([01]\d|2[0-3]):[0-5]\d")
+
+
+def _config_path(value: object, base_dir: Path, field: str, edition: str) -> Path:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"Ausgabe {edition}: '{field}' muss ein Pfad sein.")
+    path = Path(value)
+    return path if path.is_absolute() else base_dir / path
+
+
+def _edition_from_config(raw_edition: object, base_dir: Path) -> Edition:
+    if not isinstance(raw_edition, dict):
+        raise ValueError("Jede Ausgabe muss ein Objekt sein.")
+    name = raw_edition.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("Jede Ausgabe braucht einen Namen.")
+
+    categories = raw_edition.get("categories", CATEGORY_ORDER)
+    if not isinstance(categories, list) or not categories or not all(isinstance(item, str) for item in categories):
+        raise ValueError(f"Ausgabe {name}: 'categories' muss eine nicht leere Liste von Kategorien sein.")
+    known = set(ARTICLE_STORE.categories())
+    unknown = [category for category in categories if category not in known]
+    if unknown:
+        raise ValueError(f"Ausgabe {name}: unbekannte Kategorien {', '.join(unknown)}.")
+    if len(set(categories)) != len(categories):
+        raise ValueError(f"Ausgabe {name}: Kategorien sind doppelt aufgefuehrt.")
+
+    title = raw_edition.get("title", DEFAULT_EDITION_TITLE)
+    update_time = raw_edition.get("update_time", UPDATE_TIME)
+    theme = raw_edition.get("theme", DEFAULT_HTML_THEME)
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError(f"Ausgabe {name}: 'title' muss ein Text sein.")
+    if not isinstance(update_time, str) or not _UPDATE_TIME_PATTERN.fullmatch(update_time):
+        raise ValueError(f"Ausgabe {name}: 'update_time' muss im Format HH:MM angegeben sein.")
+    if theme not in HTML_THEMES:
+        raise ValueError(f"Ausgabe {name}: unbekanntes Theme {theme}.")
+    site_url = raw_edition.get("site_url", os.getenv(SITE_URL_ENV, ""))
+    if not isinstance(site_url, str):
+        raise ValueError(f"Ausgabe {name}: 'site_url' muss ein Text sein.")
+    if site_url and not _SITE_URL_PATTERN.match(site_url):
+        raise ValueError(f"Ausgabe {name}: 'site_url' muss eine absolute http(s)-Adresse sein.")
+
+    output_dir = _config_path(raw_edition.get("output_dir", name), base_dir, "output_dir", name)
+    history_path = _config_path(
+        raw_edition.get("history", str(output_dir / HISTORY_LOG_PATH.name)), base_dir, "history", name
+    )
+    return Edition(
+        name,
+        title,
+        tuple(categories),
+        output_dir,
+        history_path,
+        update_time,
+        theme,
+        site_url=site_url.rstrip("/"),
+    )
 
-    for filename in ("index.html", "tageschronik.html"):
-        (base_path / filename).write_text(html_content, encoding="utf-8")
 
-    pdf_bytes = build_pdf_content(date_long, date_short, articles)
-    (base_path / "dokumentation.pdf").write_bytes(pdf_bytes)
+def load_editions(path: Path = EDITIONS_CONFIG_PATH) -> list[Edition]:
+    # Relative Pfade gelten relativ zur Konfigurationsdatei.
+    try:
+        raw_config = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError) as error:
+        raise ValueError(f"Ausgabenkonfiguration {path} ist nicht lesbar: {error}") from error
+    except json.JSONDecodeError as error:
+        raise ValueError(f"Ausgabenkonfiguration {path} ist kein gueltiges JSON: {error}") from error
+    raw_editions = raw_config.get("editions") if isinstance(raw_config, dict) else None
+    if not isinstance(raw_editions, list) or not raw_editions:
+        raise ValueError(f"Ausgabenkonfiguration {path} enthaelt keine Ausgaben.")
+
+    editions = [_edition_from_config(raw_edition, path.resolve().parent) for raw_edition in raw_editions]
+    names = [edition.name for edition in editions]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Ausgabennamen sind doppelt vergeben: {', '.join(duplicates)}.")
+
+    # Zwei Ausgaben auf derselben Historie oder denselben Zieldateien wuerden sich gegenseitig ueberschreiben.
+    owners: dict[Path, str] = {}
+    for edition in editions:
+        claimed = [edition.history_path]
+        claimed.extend(edition.output_dir / file_name for file_name in (*edition.html_names, edition.pdf_name))
+        for claimed_path in claimed:
+            owner = owners.setdefault(claimed_path.resolve(), edition.name)
+            if owner != edition.name:
+                raise ValueError(f"Ausgaben {owner} und {edition.name} verwenden beide {claimed_path}.")
+    return editions
+
+
+def _load_checked_history(
+    path: Path = HISTORY_LOG_PATH,
+    categories: list[str] | tuple[str, ...] | None = None,
+) -> dict[str, object]:
+    with METRICS.span("load"):
+        history = load_history(path)
+    with METRICS.span("validate"):
+        _ensure_history_unique(history)
+        if _env_flag("CHECK_CURSORS"):
+            mismatched = _check_category_cursors(history, categories)
+            if mismatched:
+                print(f"Rotationszeiger neu aufgebaut fuer: {', '.join(mismatched)}")
+    return history
+
+
+def run_batch(
+    start: date,
+    end: date,
+    output_dir: Path = BATCH_OUTPUT_PATH,
+    *,
+    save: bool = True,
+    history_path: Path = HISTORY_LOG_PATH,
+    workers: int = 1,
+    cache: RenderCache | None = None,
+) -> list[Path]:
+    if end < start:
+        raise ValueError(f"Enddatum {end.isoformat()} liegt vor dem Startdatum {start.isoformat()}.")
+
+    history = _load_checked_history(history_path)
+    entries = history.get("history", [])
+    last_date = entries[-1].get("date") if isinstance(entries, list) and entries else None
+
+    # Auswahl fuer den gesamten Zeitraum im Speicher; Historie wird danach genau einmal geschrieben.
+    selections: list[tuple[datetime, list[Article]]] = []
+    day = start
+    while day <= end:
+        now = datetime.combine(day, datetime.min.time(), tzinfo=BERLIN_TZ)
+        with METRICS.span("select"):
+            articles, reused = select_articles(now, history)
+        if not reused:
+            if isinstance(last_date, str) and day.isoformat() < last_date:
+                raise RuntimeError(
+                    f"Fuer {day.isoformat()} existiert kein Eintrag, die Historie reicht aber bereits bis "
+                    f"{last_date}. Nachtraegliches Einfuegen wird nicht unterstuetzt."
+                )
+            with METRICS.span("append"):
+                _append_history_entry(history, day.isoformat(), [article.slug for article in articles])
+            last_date = day.isoformat()
+        selections.append((now, articles))
+        day += timedelta(days=1)
+
+    if save:
+        # Eine Auswahl mit Dopplungen wuerde jeden spaeteren Lauf blockieren: dann lieber gar nicht speichern.
+        with METRICS.span("validate"):
+            _ensure_history_unique(history)
+        with METRICS.span("save"):
+            save_history(history, history_path)
+
+    jobs: list[RenderJob] = []
+    targets: list[Path] = []
+    for now, articles in selections:
+        date_long = german_long_date(now)
+        date_short = german_short_date(now)
+        for kind in ("html", "pdf"):
+            jobs.append(RenderJob(kind, date_long, date_short, articles))
+            targets.append(output_dir / f"{now.date().isoformat()}.{kind}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with METRICS.span("render"):
+        payloads = render_cached(jobs, workers, cache)
+    with METRICS.span("write"):
+        for target, payload in zip(targets, payloads):
+            write_output(target, payload)
+    return targets
+
+
+ARCHIVE_LISTING_TEMPLATE = CompiledTemplate(
+    """<!DOCTYPE html>
+<html lang="de">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{{title}} &ndash; Archiv, Seite {{page}}</title>
+<style>
+    body { font-family: Arial, sans-serif; line-height: 1.6; margin: 2rem auto; max-width: 900px; padding: 0 1rem; }
+    header, footer { border-bottom: 1px solid #ccc; padding-bottom: 1rem; margin-bottom: 1.5rem; }
+    footer { border-top: 1px solid #ccc; border-bottom: none; margin-top: 2rem; padding-top: 1.5rem; }
+    h1 { color: #1a1a1a; }
+    .meta { color: #555; font-size: 0.95rem; }
+    .archiv li { margin-bottom: 0.75rem; }
+    .seiten a { margin-right: 1rem; }
+</style>
+</head>
+<body>
+<header>
+<h1>{{title}} &ndash; Archiv</h1>
+<p class="meta">Seite {{page}}</p>
+</header>
+<main>
+<ul class="archiv">
+{{items}}
+</ul>
+</main>
+<footer>
+<nav class="seiten" aria-label="Seiten">{{navigation}}</nav>
+</footer>
+</body>
+</html>
+""",
+    ("title", "page", "items", "navigation"),
+)
+ARCHIVE_ITEM_TEMPLATE = CompiledTemplate(
+    '<li><a href="{{date}}.html">{{date_long}}</a><br>{{titles}}</li>',
+    ("date", "date_long", "titles"),
+)
+
+
+def _archive_listing_name(page: int) -> str:
+    return f"seite-{page}.html"
+
+
+def _read_archive_manifest(path: Path) -> dict[str, dict[str, object]]:
+    try:
+        raw_manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        raw_manifest = None
+    if not isinstance(raw_manifest, dict) or raw_manifest.get("version") != ARCHIVE_MANIFEST_VERSION:
+        return {"days": {}, "listings": {}}
+    days = raw_manifest.get("days")
+    listings = raw_manifest.get("listings")
+    return {
+        "days": {
+            date_value: record
+            for date_value, record in (days.items() if isinstance(days, dict) else [])
+            if isinstance(record, dict) and isinstance(record.get("titles"), list)
+        },
+        "listings": dict(listings) if isinstance(listings, dict) else {},
+    }
+
+
+def _archive_day_key(edition: Edition, date_value: str, slugs: list[str], categories: list[str]) -> str:
+    # Aus Vorlage, Ausgabe, Auswahl und Kategorie-Fingerabdruecken; ohne den Artikelinhalt zu hashen. Geaenderte
+    # Kategorien rendern ihre Tage neu, den Cache-Schluessel braucht es nur fuer tatsaechlich zu rendernde Tage.
+    header = [
+        _template_fingerprint(),
+        edition.theme,
+        edition.title,
+        edition.update_time,
+        date_value,
+        slugs,
+        [ARTICLE_STORE.fingerprint(category) for category in categories],
+    ]
+    return hashlib.sha256(json.dumps(header, ensure_ascii=True).encode("ascii")).hexdigest()
+
+
+def _render_archive_listing(
+    edition: Edition,
+    page: int,
+    has_newer: bool,
+    dates: list[str],
+    days: dict[str, dict[str, object]],
+) -> bytes:
+    items = []
+    for date_value in reversed(dates):
+        day = datetime.combine(date.fromisoformat(date_value), datetime.min.time(), tzinfo=BERLIN_TZ)
+        items.append(
+            ARCHIVE_ITEM_TEMPLATE.render(date_value, german_long_date(day), "<br>".join(days[date_value]["titles"]))
+        )
+    # Seite 1 enthaelt die aeltesten Tage; ein neuer Tag aendert nur die letzte Seite (und beim Seitenwechsel
+    # den Vorwaerts-Link der vorletzten).
+    navigation = []
+    if has_newer:
+        navigation.append(f'<a href="{_archive_listing_name(page + 1)}">Neuere Tage</a>')
+    if page > 1:
+        navigation.append(f'<a href="{_archive_listing_name(page - 1)}">Aeltere Tage</a>')
+    return ARCHIVE_LISTING_TEMPLATE.render(
+        edition.title, str(page), "\n".join(items), "".join(navigation)
+    ).encode("utf-8")
+
+
+def update_archive(
+    history: dict[str, object],
+    edition: Edition = DEFAULT_EDITION,
+    *,
+    workers: int = 1,
+    cache: RenderCache | None = None,
+) -> list[Path]:
+    # Das Manifest behaelt auch Tage, die aus der gekuerzten Historie herausgefallen sind.
+    archive_dir = edition.output_dir / ARCHIVE_DIR_NAME
+    manifest_path = archive_dir / ARCHIVE_MANIFEST_NAME
+    manifest = _read_archive_manifest(manifest_path)
+    days = manifest["days"]
+    listings = manifest["listings"]
+    changed: list[Path] = []
+    dirty = not manifest_path.exists()
+
+    jobs: list[RenderJob] = []
+    pending: list[tuple[str, str, list[str]]] = []
+    entries = history.get("history", [])
+    for entry in entries if isinstance(entries, list) else []:
+        date_value = entry.get("date") if isinstance(entry, dict) else None
+        slugs = entry.get("slugs") if isinstance(entry, dict) else None
+        if not isinstance(date_value, str) or not isinstance(slugs, list):
+            continue
+        slugs = [slug for slug in slugs if isinstance(slug, str)]
+        categories = [ARTICLE_STORE.category_of(slug) for slug in slugs]
+        if not slugs or None in categories:
+            continue
+        key = _archive_day_key(edition, date_value, slugs, categories)
+        if days.get(date_value, {}).get("key") == key and (archive_dir / f"{date_value}.html").exists():
+            continue
+        articles = [_article_by_slug(slug) for slug in slugs]
+        if any(article is None for article in articles):
+            continue
+        day = datetime.combine(date.fromisoformat(date_value), datetime.min.time(), tzinfo=BERLIN_TZ)
+        job = RenderJob(
+            "html",
+            german_long_date(day),
+            german_short_date(day),
+            articles,
+            edition.theme,
+            edition.title,
+            edition.update_time,
+        )
+        jobs.append(job)
+        pending.append((key, date_value, [article.title for article in articles]))
+
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    if jobs:
+        METRICS.count("archive_days_rendered", len(jobs))
+        payloads = render_cached(jobs, workers, cache)
+        for (key, date_value, titles), payload in zip(pending, payloads):
+            target = archive_dir / f"{date_value}.html"
+            if write_output(target, payload):
+                changed.append(target)
+            days[date_value] = {"key": key, "titles": titles}
+        dirty = True
+
+    ordered = sorted(days)
+    pages = max(1, -(-len(ordered) // ARCHIVE_PAGE_SIZE))
+    fingerprint = _template_fingerprint()
+    for page in range(1, pages + 1):
+        dates = ordered[(page - 1) * ARCHIVE_PAGE_SIZE : page * ARCHIVE_PAGE_SIZE]
+        has_newer = page < pages
+        listed = [[date_value, days[date_value]["titles"]] for date_value in dates]
+        header = [fingerprint, edition.title, page, has_newer, listed]
+        key = hashlib.sha256(json.dumps(header, ensure_ascii=True).encode("ascii")).hexdigest()
+        names = [_archive_listing_name(page)] + (["index.html"] if page == pages else [])
+        stale = [name for name in names if listings.get(name) != key or not (archive_dir / name).exists()]
+        if not stale:
+            continue
+        METRICS.count("archive_listings_rendered")
+        payload = _render_archive_listing(edition, page, has_newer, dates, days)
+        for name in stale:
+            target = archive_dir / name
+            if write_output(target, payload):
+                changed.append(target)
+            listings[name] = key
+        dirty = True
+
+    if dirty:
+        document = {"version": ARCHIVE_MANIFEST_VERSION, "days": days, "listings": listings}
+        _write_text_atomic(manifest_path, json.dumps(document, ensure_ascii=False, indent=1, sort_keys=True) + "\n")
+    return changed
+
+
+def _site_link(edition: Edition, path: str) -> str:
+    return f"{edition.site_url}/{path}"
+
+
+def _feed_item(edition: Edition, date_value: str, articles: list[Article]) -> dict[str, object]:
+    # Jedes Format wird einmal je Tag gerendert und im Zustand gehalten; spaetere Laeufe fuegen nur noch zusammen.
+    day = datetime.combine(date.fromisoformat(date_value), datetime.min.time(), tzinfo=BERLIN_TZ)
+    hour, minute = (int(part) for part in edition.update_time.split(":"))
+    published = day.replace(hour=hour, minute=minute)
+    title = f"{edition.title} – {german_long_date(day)}"
+    link = _site_link(edition, f"{ARCHIVE_DIR_NAME}/{date_value}.html")
+    content = "".join(
+        f'<h2>{article.title}</h2>\n<p>{article.paragraphs[0] if article.paragraphs else ""}</p>\n'
+        f'<p><a href="{article.source_url}">{article.source_label}: {article.source_title}</a></p>\n'
+        for article in articles
+    )
+    escaped_title = html.escape(title)
+    escaped_link = html.escape(link)
+    return {
+        "rss": (
+            f"<item>\n<title>{escaped_title}</title>\n<link>{escaped_link}</link>\n"
+            f'<guid isPermaLink="false">{html.escape(edition.name)}-{date_value}</guid>\n'
+            f"<pubDate>{format_datetime(published)}</pubDate>\n"
+            f"<description>{html.escape(content)}</description>\n</item>\n"
+        ),
+        "atom": (
+            f"<entry>\n<title>{escaped_title}</title>\n<link href=\"{escaped_link}\"/>\n"
+            f"<id>urn:{html.escape(edition.name)}:{date_value}</id>\n"
+            f"<updated>{published.isoformat()}</updated>\n"
+            f'<content type="html">{html.escape(content)}</content>\n</entry>\n'
+        ),
+        "json": {
+            "id": f"{edition.name}-{date_value}",
+            "url": link,
+            "title": title,
+            "content_html": content,
+            "date_published": published.isoformat(),
+        },
+    }
+
+
+def _feed_signature(edition: Edition) -> str:
+    fields = [FEED_FORMAT_VERSION, FEED_WINDOW, edition.name, edition.title, edition.site_url, edition.update_time]
+    return hashlib.sha256(json.dumps(fields, ensure_ascii=True).encode("ascii")).hexdigest()
+
+
+def _feed_state_path(history_path: Path) -> Path:
+    # Arbeitsstand neben der Historie der Ausgabe, nicht im veroeffentlichten Verzeichnis.
+    return history_path.with_name(history_path.stem + FEED_STATE_SUFFIX)
+
+
+def _read_feed_state(path: Path, signature: str) -> list[dict[str, object]]:
+    try:
+        raw_state = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        return []
+    if not isinstance(raw_state, dict) or raw_state.get("signature") != signature:
+        return []
+    items = raw_state.get("items")
+    if not isinstance(items, list):
+        return []
+    return [
+        item
+        for item in items
+        if isinstance(item, dict)
+        and isinstance(item.get("date"), str)
+        and isinstance(item.get("slugs"), list)
+        and all(isinstance(item.get(kind), (str, dict)) for kind in FEED_FILES)
+    ]
+
+
+def _feed_documents(edition: Edition, items: list[dict[str, object]]) -> dict[str, bytes]:
+    updated = items[0]["json"]["date_published"] if items else ""
+    site = html.escape(_site_link(edition, ""))
+    feed_title = html.escape(edition.title)
+    rss = (
+        '<?xml version="1.0" encoding="utf-8"?>\n<rss version="2.0">\n<channel>\n'
+        f"<title>{feed_title}</title>\n<link>{site}</link>\n"
+        f"<description>{feed_title}: taegliche Auswahl</description>\n<language>de</language>\n"
+        + (f"<lastBuildDate>{format_datetime(datetime.fromisoformat(updated))}</lastBuildDate>\n" if updated else "")
+        + "".join(item["rss"] for item in items)
+        + "</channel>\n</rss>\n"
+    )
+    atom = (
+        '<?xml version="1.0" encoding="utf-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="de">\n'
+        f"<title>{feed_title}</title>\n<link href=\"{site}\"/>\n"
+        f"<id>urn:{html.escape(edition.name)}</id>\n<updated>{updated}</updated>\n"
+        + "".join(item["atom"] for item in items)
+        + "</feed>\n"
+    )
+    json_feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": edition.title,
+        "home_page_url": _site_link(edition, ""),
+        "feed_url": _site_link(edition, FEED_FILES["json"]),
+        "language": "de",
+        "items": [item["json"] for item in items],
+    }
+    return {
+        "rss": rss.encode("utf-8"),
+        "atom": atom.encode("utf-8"),
+        "json": (json.dumps(json_feed, ensure_ascii=False, indent=1) + "\n").encode("utf-8"),
+    }
+
+
+def update_feeds(history: dict[str, object], edition: Edition = DEFAULT_EDITION) -> list[Path]:
+    # Neue Tage werden vorne angefuegt und das Fenster gekuerzt; aeltere Historie wird nicht mehr gelesen.
+    if not _SITE_URL_PATTERN.match(edition.site_url):
+        # RSS, Atom und JSON Feed verlangen absolute Links; ohne SITE_URL bzw. site_url keine Feeds.
+        METRICS.count("feeds_skipped")
+        return []
+    signature = _feed_signature(edition)
+    state_path = _feed_state_path(edition.history_path)
+    items = _read_feed_state(state_path, signature)
+    known = {item["date"]: item for item in items}
+
+    fresh: list[dict[str, object]] = []
+    entries = history.get("history", [])
+    for entry in reversed(entries) if isinstance(entries, list) else []:
+        if len(fresh) >= FEED_WINDOW:
+            break
+        date_value = entry.get("date") if isinstance(entry, dict) else None
+        slugs = entry.get("slugs") if isinstance(entry, dict) else None
+        if not isinstance(date_value, str) or not isinstance(slugs, list):
+            continue
+        item = known.get(date_value)
+        if item is not None and item["slugs"] == slugs:
+            break
+        articles = [_article_by_slug(slug) for slug in slugs if isinstance(slug, str)]
+        if not articles or any(article is None for article in articles):
+            continue
+        item = _feed_item(edition, date_value, articles)
+        item["date"] = date_value
+        item["slugs"] = slugs
+        fresh.append(item)
+
+    outputs_present = state_path.exists() and all((edition.output_dir / name).exists() for name in FEED_FILES.values())
+    if not fresh and outputs_present:
+        return []
+    METRICS.count("feed_items_rendered", len(fresh))
+    replaced = {item["date"] for item in fresh}
+    items = fresh + [item for item in items if item["date"] not in replaced]
+    items = sorted(items, key=lambda item: item["date"], reverse=True)[:FEED_WINDOW]
+
+    edition.output_dir.mkdir(parents=True, exist_ok=True)
+    changed: list[Path] = []
+    for kind, payload in _feed_documents(edition, items).items():
+        target = edition.output_dir / FEED_FILES[kind]
+        if write_output(target, payload):
+            changed.append(target)
+    state = {"signature": signature, "items": items}
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_text_atomic(state_path, json.dumps(state, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return changed
+
+
+def run_editions(
+    editions: list[Edition],
+    now: datetime,
+    *,
+    workers: int = 1,
+    cache: RenderCache | None = None,
+) -> dict[str, bool]:
+    # Korpus und Slug-Index liegen einmal im ARTICLE_STORE; jede Ausgabe fuehrt nur ihre eigene Historie.
+    date_long = german_long_date(now)
+    date_short = german_short_date(now)
+    reused_by_edition: dict[str, bool] = {}
+    histories: list[dict[str, object]] = []
+    jobs: list[RenderJob] = []
+    for edition in editions:
+        history = _load_checked_history(edition.history_path, edition.categories)
+        with METRICS.span("select"):
+            articles, reused = scheduled_articles(now, history, edition.history_path, edition.categories)
+        if not reused:
+            with METRICS.span("append"):
+                _append_history_entry(history, now.date().isoformat(), [article.slug for article in articles])
+            with METRICS.span("save"):
+                edition.history_path.parent.mkdir(parents=True, exist_ok=True)
+                save_history(history, edition.history_path)
+        reused_by_edition[edition.name] = reused
+        histories.append(history)
+        for kind in ("html", "pdf"):
+            jobs.append(
+                RenderJob(kind, date_long, date_short, articles, edition.theme, edition.title, edition.update_time)
+            )
+
+    # Alle Ausgaben in einem Durchgang rendern, damit sie sich die Worker teilen.
+    with METRICS.span("render"):
+        payloads = render_cached(jobs, workers, cache)
+
+    with METRICS.span("write"):
+        for position, edition in enumerate(editions):
+            html_bytes, pdf_bytes = payloads[2 * position : 2 * position + 2]
+            edition.output_dir.mkdir(parents=True, exist_ok=True)
+            first_html: Path | None = None
+            for file_name in edition.html_names:
+                target = edition.output_dir / file_name
+                write_output(target, html_bytes, link_from=first_html)
+                first_html = first_html or target
+            write_output(edition.output_dir / edition.pdf_name, pdf_bytes)
+
+    with METRICS.span("archive"):
+        for edition, history in zip(editions, histories):
+            update_archive(history, edition, workers=workers, cache=cache)
+    with METRICS.span("feeds"):
+        for edition, history in zip(editions, histories):
+            update_feeds(history, edition)
+    return reused_by_edition
+
+
+class PreviewPlanner:
+    # Waehlt auf einer Kopie der Historie aus; die Datei auf der Platte wird nie geschrieben.
+    def __init__(self, edition: Edition = DEFAULT_EDITION) -> None:
+        self.edition = edition
+        self.signature: tuple[int, ...] | None = None
+        self.history: dict[str, object] = {}
+        self.planned_until: date | None = None
+        self.selections: dict[date, list[Article]] = {}
+
+    def _history_signature(self) -> tuple[int, ...]:
+        signature: list[int] = []
+        for path in (self.edition.history_path, _history_journal_path(self.edition.history_path)):
+            try:
+                stat = path.stat()
+            except OSError:
+                signature.extend((0, 0))
+                continue
+            signature.extend((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def refresh(self) -> bool:
+        # Hat der taegliche Lauf die Historie veraendert, wird die Kopie neu geladen.
+        signature = self._history_signature()
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        self.history = load_history(self.edition.history_path)
+        entries = self.history.get("history", [])
+        last_date = entries[-1].get("date") if isinstance(entries, list) and entries else None
+        self.planned_until = date.fromisoformat(last_date) if isinstance(last_date, str) else None
+        self.selections = {}
+        return True
+
+    def _select(self, day: date) -> tuple[list[Article], bool]:
+        now = datetime.combine(day, datetime.min.time(), tzinfo=BERLIN_TZ)
+        return select_articles(now, self.history, self.edition.categories)
+
+    def articles_for(self, day: date) -> list[Article]:
+        articles = self.selections.get(day)
+        if articles is not None:
+            return articles
+
+        if self.planned_until is not None and day <= self.planned_until:
+            # Vergangene Tage: vorhandener Eintrag oder, falls keiner existiert, die Auswahl nach heutigem Stand.
+            articles, _ = self._select(day)
+            self.selections[day] = articles
+            return articles
+
+        # Zukuenftige Tage haengen von allen Tagen davor ab; die Luecke wird der Reihe nach aufgefuellt.
+        if (day - datetime.now(BERLIN_TZ).date()).days >= PREVIEW_MAX_DAYS_AHEAD:
+            raise ValueError(f"{day.isoformat()} liegt mehr als {PREVIEW_MAX_DAYS_AHEAD} Tage voraus.")
+        current = self.planned_until + timedelta(days=1) if self.planned_until is not None else day
+        while current <= day:
+            articles, reused = self._select(current)
+            if not reused:
+                _append_history_entry(self.history, current.isoformat(), [article.slug for article in articles])
+            self.selections[current] = articles
+            self.planned_until = current
+            current += timedelta(days=1)
+        return self.selections[day]
+
+
+_PREVIEW_ROUTE = re.compile(r"/(\d{4}-\d{2}-\d{2})\.(html|pdf)")
+_PREVIEW_CONTENT_TYPES = {"html": "text/html; charset=utf-8", "pdf": "application/pdf"}
+_HTTP_REASONS = {
+    200: "OK",
+    302: "Found",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+class PreviewServer:
+    def __init__(self, edition: Edition = DEFAULT_EDITION, cache_size: int = PREVIEW_CACHE_SIZE) -> None:
+        self.edition = edition
+        self.planner = PreviewPlanner(edition)
+        self.cache_size = cache_size
+        # Eingefuegt bzw. zuletzt gelesen am Ende; der erste Schluessel ist der am laengsten unbenutzte.
+        self._pages: dict[tuple[date, str], tuple[str, bytes]] = {}
+
+    def page(self, day: date, kind: str) -> tuple[str, bytes]:
+        if self.planner.refresh():
+            self._pages.clear()
+        key = (day, kind)
+        cached = self._pages.pop(key, None)
+        if cached is None:
+            METRICS.count("preview_cache_misses")
+            now = datetime.combine(day, datetime.min.time(), tzinfo=BERLIN_TZ)
+            job = RenderJob(
+                kind,
+                german_long_date(now),
+                german_short_date(now),
+                self.planner.articles_for(day),
+                self.edition.theme,
+                self.edition.title,
+                self.edition.update_time,
+            )
+            payload = _render_job(job)
+            cached = (f'"{hashlib.sha256(payload).hexdigest()[:32]}"', payload)
+            if len(self._pages) >= self.cache_size:
+                del self._pages[next(iter(self._pages))]
+        else:
+            METRICS.count("preview_cache_hits")
+        self._pages[key] = cached
+        return cached
+
+    def respond(self, method: str, target: str, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        if method not in ("GET", "HEAD"):
+            return 405, {"Allow": "GET, HEAD"}, b""
+        path = target.split("?", 1)[0]
+        if path == "/":
+            today = datetime.now(BERLIN_TZ).date().isoformat()
+            return 302, {"Location": f"/{today}.html"}, b""
+        match = _PREVIEW_ROUTE.fullmatch(path)
+        if match is None:
+            return 404, {}, b""
+        try:
+            day = date.fromisoformat(match.group(1))
+            etag, payload = self.page(day, match.group(2))
+        except ValueError as error:
+            return 404, {"Content-Type": "text/plain; charset=utf-8"}, str(error).encode("utf-8")
+
+        response_headers = {
+            "Content-Type": _PREVIEW_CONTENT_TYPES[match.group(2)],
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+        }
+        requested = headers.get("if-none-match", "")
+        if requested.strip() == "*" or etag in (value.strip() for value in requested.split(",")):
+            return 304, response_headers, b""
+        return 200, response_headers, payload
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+                    status, response_headers, body = 400, {}, b""
+                    keep_alive = False
+                else:
+                    method, target, version = parts
+                    try:
+                        status, response_headers, body = self.respond(method, target, headers)
+                    except Exception as error:
+                        print(f"Vorschau fuer {target} fehlgeschlagen: {error!r}", file=sys.stderr)
+                        status, response_headers, body = 500, {}, b""
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                    if method == "HEAD":
+                        response_headers["Content-Length"] = str(len(body))
+                        body = b""
+
+                response_headers.setdefault("Content-Length", str(len(body)))
+                response_headers["Connection"] = "keep-alive" if keep_alive else "close"
+                head = [f"HTTP/1.1 {status} {_HTTP_REASONS[status]}"]
+                head.extend(f"{name}: {value}" for name, value in response_headers.items())
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = PREVIEW_HOST, port: int = PREVIEW_PORT) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Vorschau unter http://{host}:{port}/JJJJ-MM-TT.html bzw. .pdf (Strg+C beendet).")
+        async with server:
+            await server.serve_forever()
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Aktualisiert die taegliche Geschichtsseite.")
+    parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=date.fromisoformat,
+        help="Erster Tag (JJJJ-MM-TT) fuer den Stapelmodus.",
+    )
+    parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=date.fromisoformat,
+        help="Letzter Tag (JJJJ-MM-TT) fuer den Stapelmodus.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=BATCH_OUTPUT_PATH,
+        help="Zielverzeichnis fuer die Seiten des Stapelmodus.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Stapelmodus ohne Speichern der Historie (nur Vorschau).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=_render_workers(),
+        help=f"Anzahl paralleler Render-Prozesse (Standard: ${RENDER_WORKERS_ENV} oder 1).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render-Cache weder lesen noch schreiben.",
+    )
+    parser.add_argument(
+        "--editions",
+        nargs="?",
+        type=Path,
+        const=EDITIONS_CONFIG_PATH,
+        help=f"Alle Ausgaben aus der Konfiguration erzeugen (Standard: {EDITIONS_CONFIG_PATH.name}).",
+    )
+    parser.add_argument(
+        "--schedule",
+        action="store_true",
+        help="Veroeffentlichungsplan fuer die kommenden Tage berechnen und ausgeben.",
+    )
+    parser.add_argument(
+        "--horizon",
+        type=int,
+        default=SCHEDULE_HORIZON_DAYS,
+        help=f"Planungshorizont in Tagen fuer --schedule (Standard: {SCHEDULE_HORIZON_DAYS}).",
+    )
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Keine vorkomprimierten .gz-Dateien neben HTML-, XML- und JSON-Ausgaben schreiben.",
+    )
+    parser.add_argument(
+        "--deflate",
+        action="store_true",
+        help=f"Zusaetzlich zlib-komprimierte {OUTPUT_DEFLATE_SUFFIX}-Dateien schreiben.",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Lokalen Vorschau-Server starten statt Dateien zu schreiben.",
+    )
+    parser.add_argument("--host", default=PREVIEW_HOST, help=f"Adresse des Vorschau-Servers (Standard: {PREVIEW_HOST}).")
+    parser.add_argument("--port", type=int, default=PREVIEW_PORT, help=f"Port des Vorschau-Servers (Standard: {PREVIEW_PORT}).")
+    parser.add_argument("--search", metavar="ANFRAGE", help="Volltextsuche ueber alle Artikel (Ergebnisse nach Relevanz).")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=SEARCH_RESULT_LIMIT,
+        help=f"Maximale Trefferzahl fuer --search (Standard: {SEARCH_RESULT_LIMIT}).",
+    )
+    parser.add_argument(
+        "--export-search",
+        nargs="?",
+        type=Path,
+        const=SEARCH_SHARDS_PATH,
+        metavar="VERZEICHNIS",
+        help=f"Suchindex als Praefix-Scheiben fuer die statische Seite exportieren (Standard: {SEARCH_SHARDS_PATH.name}/).",
+    )
+    args = parser.parse_args(argv)
+    batch = args.date_from is not None or args.date_to is not None
+    if args.editions is not None and (batch or args.serve):
+        parser.error("--editions ist nur im taeglichen Lauf verfuegbar.")
+    if args.serve and batch:
+        parser.error("--serve und der Stapelmodus schliessen sich aus.")
+    return args
+
+
+def _run(args: argparse.Namespace) -> dict[str, object]:
+    if args.schedule:
+        with METRICS.span("schedule"):
+            days = plan_schedule(
+                datetime.now(BERLIN_TZ).date(), _load_checked_history(), horizon=max(1, args.horizon)
+            )
+        for date_value, slugs in days.items():
+            print(f"{date_value}  {', '.join(slugs)}")
+        return {"mode": "schedule", "days": len(days)}
+
+    if args.search is not None or args.export_search is not None:
+        index = load_search_index()
+        record: dict[str, object] = {"mode": "search"}
+        if args.search is not None:
+            with METRICS.span("search"):
+                results = index.search(args.search, max(1, args.limit))
+            for slug, score in results:
+                article = ARTICLE_STORE.get(slug)
+                print(f"{score:7.3f}  {slug:<24} {article.title if article is not None else ''}")
+            if not results:
+                print("Keine Treffer.")
+            record["results"] = len(results)
+        if args.export_search is not None:
+            written = export_search_shards(index, args.export_search)
+            print(f"{len(written)} Suchdateien in {args.export_search} geschrieben.")
+        return record
+
+    if args.serve:
+        server = PreviewServer()
+        try:
+            asyncio.run(server.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        return {"mode": "serve"}
+
+    cache = None if args.no_cache or _env_flag("DISABLE_RENDER_CACHE") else RenderCache()
+    if args.date_from is not None or args.date_to is not None:
+        start = args.date_from or args.date_to
+        end = args.date_to or args.date_from
+        written = run_batch(
+            start,
+            end,
+            args.output_dir,
+            save=not args.dry_run,
+            workers=args.workers,
+            cache=cache,
+        )
+        print(f"{len(written)} Dateien in {args.output_dir} geschrieben.")
+        return {"mode": "batch", "from": start.isoformat(), "to": end.isoformat()}
+
+    now = datetime.now(BERLIN_TZ)
+    editions = load_editions(args.editions) if args.editions is not None else [DEFAULT_EDITION]
+    reused = run_editions(editions, now, workers=args.workers, cache=cache)
+    record = {"mode": "daily", "date": now.date().isoformat(), "reused": all(reused.values())}
+    if args.editions is not None:
+        record["editions"] = reused
+    return record
+
+
+def _emit_metrics(record: dict[str, object]) -> None:
+    line = json.dumps(record, ensure_ascii=True, sort_keys=True)
+    metrics_path = os.getenv(METRICS_PATH_ENV)
+    if metrics_path:
+        with Path(metrics_path).open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+    if _env_flag("DAILY_METRICS"):
+        print(line, file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    METRICS.reset()
+    profiler = cProfile.Profile() if _env_flag("DAILY_PROFILE") else None
+    trace_memory = _env_flag("DAILY_TRACEMALLOC")
+    if trace_memory:
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+    compress = not args.no_compress and not args.serve and not _env_flag("DISABLE_OUTPUT_COMPRESSION")
+    try:
+        with output_compression(args.deflate) if compress else nullcontext():
+            extra = _run(args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+
+    stamp = datetime.now(BERLIN_TZ).strftime("%Y%m%d-%H%M%S")
+    if profiler is not None:
+        PROFILE_DIR_PATH.mkdir(parents=True, exist_ok=True)
+        profile_path = PROFILE_DIR_PATH / f"daily-{stamp}.prof"
+        profiler.dump_stats(profile_path)
+        extra["profile"] = str(profile_path)
+    if trace_memory:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        PROFILE_DIR_PATH.mkdir(parents=True, exist_ok=True)
+        snapshot_path = PROFILE_DIR_PATH / f"daily-{stamp}.tracemalloc"
+        snapshot.dump(str(snapshot_path))
+        extra["tracemalloc"] = {
+            "peak_bytes": peak,
+            "snapshot": str(snapshot_path),
+            "top": [str(stat) for stat in snapshot.statistics("lineno")[:TRACEMALLOC_TOP_STATS]],
+        }
+    _emit_metrics(METRICS.record(**extra))
 
 
 if __name__ == "__main__":